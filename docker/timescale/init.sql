@@ -1,7 +1,8 @@
 CREATE EXTENSION IF NOT EXISTS timescaledb;
 
+-- Fallback for event types without a typed table.
 CREATE TABLE IF NOT EXISTS events (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     event_type TEXT NOT NULL,
     payload JSONB NOT NULL,
     valid_time TIMESTAMPTZ NOT NULL DEFAULT NOW(),
@@ -9,3 +10,78 @@ CREATE TABLE IF NOT EXISTS events (
 );
 
 SELECT create_hypertable('events', 'transaction_time', if_not_exists => TRUE);
+
+-- Typed tables: "time" is the event's valid time (the tick or signal
+-- timestamp, or the write time for orders and fills), "recorded_at" the
+-- transaction time. Each is a hypertable chunked on time and
+-- space-partitioned by symbol.
+
+CREATE TABLE IF NOT EXISTS ticks (
+    time TIMESTAMPTZ NOT NULL,
+    symbol TEXT NOT NULL,
+    price DOUBLE PRECISION NOT NULL,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS signals (
+    time TIMESTAMPTZ NOT NULL,
+    symbol TEXT NOT NULL,
+    strategy_id TEXT NOT NULL,
+    side TEXT NOT NULL,
+    strength DOUBLE PRECISION NOT NULL,
+    signal_id UUID NOT NULL,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    time TIMESTAMPTZ NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity DOUBLE PRECISION NOT NULL,
+    price DOUBLE PRECISION,
+    client_order_id UUID NOT NULL,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS fills (
+    time TIMESTAMPTZ NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity DOUBLE PRECISION NOT NULL,
+    price DOUBLE PRECISION NOT NULL,
+    client_order_id UUID NOT NULL,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+SELECT create_hypertable('ticks', 'time', 'symbol', 8, chunk_time_interval => INTERVAL '1 day', if_not_exists => TRUE);
+SELECT create_hypertable('signals', 'time', 'symbol', 4, chunk_time_interval => INTERVAL '7 days', if_not_exists => TRUE);
+SELECT create_hypertable('orders', 'time', 'symbol', 4, chunk_time_interval => INTERVAL '7 days', if_not_exists => TRUE);
+SELECT create_hypertable('fills', 'time', 'symbol', 4, chunk_time_interval => INTERVAL '7 days', if_not_exists => TRUE);
+
+-- Symbol-filtered range reads and downsampling use (symbol, time DESC);
+-- create_hypertable already builds it, so those statements are no-ops kept
+-- to document the read path. Unfiltered ranges use the default time index.
+CREATE INDEX IF NOT EXISTS ticks_symbol_time_idx ON ticks (symbol, time DESC);
+CREATE INDEX IF NOT EXISTS signals_symbol_time_idx ON signals (symbol, time DESC);
+CREATE INDEX IF NOT EXISTS signals_strategy_time_idx ON signals (strategy_id, time DESC);
+CREATE INDEX IF NOT EXISTS orders_symbol_time_idx ON orders (symbol, time DESC);
+CREATE INDEX IF NOT EXISTS orders_client_order_id_idx ON orders (client_order_id, time DESC);
+CREATE INDEX IF NOT EXISTS fills_symbol_time_idx ON fills (symbol, time DESC);
+CREATE INDEX IF NOT EXISTS fills_client_order_id_idx ON fills (client_order_id, time DESC);
+
+-- Compress closed chunks segmented by symbol; ticks are dropped after a
+-- quarter, trading records kept for seven years.
+ALTER TABLE ticks SET (timescaledb.compress, timescaledb.compress_segmentby = 'symbol', timescaledb.compress_orderby = 'time DESC');
+ALTER TABLE signals SET (timescaledb.compress, timescaledb.compress_segmentby = 'symbol', timescaledb.compress_orderby = 'time DESC');
+ALTER TABLE orders SET (timescaledb.compress, timescaledb.compress_segmentby = 'symbol', timescaledb.compress_orderby = 'time DESC');
+ALTER TABLE fills SET (timescaledb.compress, timescaledb.compress_segmentby = 'symbol', timescaledb.compress_orderby = 'time DESC');
+
+SELECT add_compression_policy('ticks', INTERVAL '2 days', if_not_exists => TRUE);
+SELECT add_compression_policy('signals', INTERVAL '14 days', if_not_exists => TRUE);
+SELECT add_compression_policy('orders', INTERVAL '14 days', if_not_exists => TRUE);
+SELECT add_compression_policy('fills', INTERVAL '14 days', if_not_exists => TRUE);
+
+SELECT add_retention_policy('ticks', INTERVAL '90 days', if_not_exists => TRUE);
+SELECT add_retention_policy('signals', INTERVAL '7 years', if_not_exists => TRUE);
+SELECT add_retention_policy('orders', INTERVAL '7 years', if_not_exists => TRUE);
+SELECT add_retention_policy('fills', INTERVAL '7 years', if_not_exists => TRUE);
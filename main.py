@@ -1,47 +1,123 @@
 import asyncio
+from collections import Counter
+from typing import Optional
+
+import structlog
 
 from src import config
+from src.adapters.broker.simulator import SimulatedBroker
 from src.application.bus import EventBus
+from src.application.cold_path import ColdPathPersistence, ColdPathProcess, ColdPathService
 from src.application.engine import PartitionedEngine
+from src.application.micro_batch import MicroBatchEngine, TickBatch
+from src.application.order_book import OrderBook
+from src.application.portfolio_metrics import MetricsPublisher, PortfolioMetrics
 from src.application.position_tracker import PositionTracker
 from src.application.services import ExecutionService, RiskService
-from src.domain.events import FillEvent, OrderEvent, SignalEvent, TickEvent
-from src.domain.models import Tick
+from src.application.warmup import WarmupService
+from src.domain.events import FillEvent, OrderEvent, OrderRejectedEvent, SignalEvent, TickEvent
+from src.domain.models import Signal, Tick
+from src.domain.strategy.cross_section import CrossSectionalGoldenCross
 from src.domain.strategy.golden_cross import GoldenCrossStrategy
 from src.infrastructure.idempotency import generate_signal_id
-from src.infrastructure.logging import get_logger
+from src.infrastructure.logging import CALL_SITE_PROCESSORS, configure_async_logging, get_logger
+from src.ports.persistence import EventSinkPort
 
 logger = get_logger(__name__)
 
+# Per-event log rate limits (events per second), applied by whichever process renders the logs.
+LOG_RATE_LIMITS = {"risk_validation_failed": 10.0}
+
 
-async def run() -> None:
-    components = config.build_components()
+async def run(cold_path: Optional[ColdPathProcess] = None) -> None:
+    # In split mode the child process builds and owns persistence, news, fundamentals and research.
+    components = config.build_components(split=cold_path is not None)
+    settings: config.Settings = components["settings"]
     bus: EventBus = components["bus"]
     engine: PartitionedEngine = components["engine"]
     market_data = components["market_data"]
-    persistence = components["persistence"]
+    persistence: EventSinkPort = ColdPathPersistence(cold_path) if cold_path is not None else components["persistence"]
+    cold_service = None
+    if cold_path is None:
+        cold_service = ColdPathService(
+            persistence,
+            news=components["news"],
+            fundamentals=components["fundamentals"],
+            symbols=settings.deployment.cold_symbols,
+            poll_interval=settings.deployment.cold_poll_interval,
+        )
     risk_service: RiskService = components["risk_service"]
     execution_service: ExecutionService = components["execution_service"]
+    metrics: PortfolioMetrics = components["metrics"]
+    order_book: OrderBook = components["order_book"]
+    broker = components["broker"]
+    simulated = broker if isinstance(broker, SimulatedBroker) else None
 
     strategy = GoldenCrossStrategy(strategy_id="golden-cross", id_generator=generate_signal_id)
+    universe = CrossSectionalGoldenCross(strategy_id="golden-cross", id_generator=generate_signal_id)
     tracker = PositionTracker()
-    broker_connected = True
 
-    async def on_tick(event: TickEvent) -> None:
+    async def mark(event: TickEvent) -> None:
         tracker.update_market_price(event.symbol, event.price)
+        metrics.on_price(event.symbol, event.price)
+        if simulated is not None:
+            await simulated.on_tick(event)
+
+    def signal_event(signal: Signal) -> SignalEvent:
+        return SignalEvent(
+            symbol=signal.symbol,
+            strategy_id=signal.strategy_id,
+            timestamp=signal.timestamp,
+            side=signal.side,
+            strength=signal.strength,
+            signal_id=signal.signal_id,
+        )
+
+    async def place(event: SignalEvent) -> None:
+        order = OrderEvent(
+            symbol=event.symbol,
+            side=event.side,
+            quantity=1,
+            price=None,
+            client_order_id=event.signal_id,
+        )
+        await bus.publish(order)
+        await persistence.persist_event(order)
+
+    async def on_tick(event: TickEvent) -> None:
+        await mark(event)
         tick = Tick(symbol=event.symbol, price=event.price, timestamp=event.timestamp)
         signal = strategy.on_tick(tick)
         if signal:
-            signal_event = SignalEvent(
-                symbol=signal.symbol,
-                strategy_id=signal.strategy_id,
-                timestamp=signal.timestamp,
-                side=signal.side,
-                strength=signal.strength,
-                signal_id=signal.signal_id,
-            )
-            await bus.publish(signal_event)
-            await persistence.persist_event(signal_event)
+            event = signal_event(signal)
+            await bus.publish(event)
+            await persistence.persist_event(event)
+
+    async def on_batch(batch: TickBatch) -> None:
+        prices = {}
+        for event in batch.events:
+            await mark(event)
+            prices[event.symbol] = event.price
+        signals = batch.signals
+        if not len(signals):
+            return
+        # The whole batch goes through risk at once; only signals that become orders are materialized.
+        decisions = risk_service.validate_signal_batch(
+            signals,
+            generate_signal_id,
+            tracker.get_positions(),
+            pnl=tracker.get_total_pnl(),
+            broker_connected=metrics.broker_connected,
+            prices=prices,
+        )
+        rejected = Counter(decision.reason for decision in decisions if not decision.accepted)
+        for reason, count in rejected.items():
+            logger.error("risk_validation_failed", error=reason, count=count)
+        accepted = [index for index, decision in enumerate(decisions) if decision.accepted]
+        for signal in signals.signals(generate_signal_id, accepted):
+            event = signal_event(signal)
+            await persistence.persist_event(event)
+            await place(event)
 
     async def on_signal(event: SignalEvent) -> None:
         try:
@@ -49,37 +125,70 @@ async def run() -> None:
                 event,
                 tracker.get_positions(),
                 pnl=tracker.get_total_pnl(),
-                broker_connected=broker_connected,
+                broker_connected=metrics.broker_connected,
             )
         except Exception as exc:
             logger.error("risk_validation_failed", error=str(exc))
             return
-        order = OrderEvent(
-            symbol=event.symbol,
-            side=event.side,
-            quantity=1,
-            price=None,
-            client_order_id=event.signal_id,
-        )
-        await bus.publish(order)
-        await persistence.persist_event(order)
+        await place(event)
 
     async def on_order(event: OrderEvent) -> None:
-        await execution_service.submit(event)
+        # Booked as SUBMITTED before the broker call, so its fills always find it in the book.
+        try:
+            order_book.add_event(event, state="SUBMITTED")
+        except ValueError:
+            logger.warning("duplicate_order", symbol=event.symbol, client_order_id=str(event.client_order_id))
+            return
+        try:
+            await execution_service.submit(event)
+        except Exception:
+            order_book.transition(event.client_order_id, "REJECTED")
+            order_book.prune_terminal()
+            raise
 
     async def on_fill(event: FillEvent) -> None:
         tracker.handle_fill(event)
+        metrics.on_fill(event)
+        report = order_book.reconcile([event])
+        if not report.applied:
+            logger.warning("fill_not_reconciled", symbol=event.symbol, client_order_id=str(event.client_order_id))
+        order_book.prune_terminal()
         await persistence.persist_event(event)
 
+    async def on_rejected(event: OrderRejectedEvent) -> None:
+        logger.warning(
+            "order_rejected", symbol=event.symbol, client_order_id=str(event.client_order_id), reason=event.reason
+        )
+        order_book.transition_many([(event.client_order_id, "REJECTED")])
+        order_book.prune_terminal()
+        await persistence.persist_event(event)
+
+    await persistence.connect()
     await bus.subscribe(TickEvent, on_tick)
     await bus.subscribe(SignalEvent, on_signal)
     await bus.subscribe(OrderEvent, on_order)
     await bus.subscribe(FillEvent, on_fill)
-
-    engine.register_handler("AAPL", on_tick)
-    await market_data.subscribe("AAPL", engine.enqueue)
-
+    await bus.subscribe(OrderRejectedEvent, on_rejected)
+
+    warmup = WarmupService(components["history"])
+    batcher: Optional[MicroBatchEngine] = None
+    if settings.engine.mode == "micro_batch":
+        await warmup.warm({"AAPL": universe}, lookback=settings.history.warmup_lookback)
+        batcher = MicroBatchEngine(universe, on_batch, window=settings.engine.batch_window)
+        await market_data.subscribe("AAPL", batcher.enqueue)
+    elif settings.engine.mode == "partitioned":
+        await warmup.warm({"AAPL": strategy}, lookback=settings.history.warmup_lookback)
+        engine.register_handler("AAPL", on_tick)
+        await market_data.subscribe("AAPL", engine.enqueue)
+    else:
+        raise ValueError(f"Unknown engine mode {settings.engine.mode}")
+
+    publisher = MetricsPublisher(metrics, bus, interval=settings.risk.metrics_interval)
+    publisher.start()
+    fills_task = asyncio.create_task(execution_service.pump_fills(bus.publish))
     market_task = asyncio.create_task(market_data.start())
+    polls_task = asyncio.create_task(cold_service.run_polls()) if cold_service is not None else None
+    monitor_task = asyncio.create_task(cold_path.monitor()) if cold_path is not None else None
 
     await market_data.emit(TickEvent(symbol="AAPL", price=150.0, timestamp=1.0))
     await market_data.emit(TickEvent(symbol="AAPL", price=151.0, timestamp=2.0))
@@ -87,12 +196,53 @@ async def run() -> None:
     await market_data.emit(TickEvent(symbol="AAPL", price=153.0, timestamp=4.0))
     await asyncio.sleep(0.1)
 
-    market_task.cancel()
+    for task in (market_task, fills_task, polls_task, monitor_task):
+        if task is None:
+            continue
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    if batcher is not None:
+        await batcher.shutdown()
+        stats = batcher.stats
+        logger.info(
+            "micro_batch_stats",
+            windows=stats.windows,
+            ticks=stats.ticks,
+            signals=stats.signals,
+            mean_wait=stats.mean_wait,
+            max_wait=stats.max_wait,
+            ticks_per_second=stats.ticks_per_second,
+        )
+    await publisher.stop()
+    await persistence.close()
+
+
+def main() -> None:
+    settings = config.load_settings()
+    if settings.deployment.mode == "split":
+        cold_path = ColdPathProcess(
+            capacity=settings.deployment.cold_ring_bytes, rate_limits=LOG_RATE_LIMITS
+        ).start()
+        # Log events are rendered and written by the child; after stop they fall through to JSON on stdout.
+        structlog.configure(
+            processors=[*CALL_SITE_PROCESSORS, cold_path.log_processor, structlog.processors.JSONRenderer()],
+        )
+        try:
+            asyncio.run(run(cold_path))
+        finally:
+            cold_path.stop()
+        return
+    if settings.deployment.mode != "single":
+        raise ValueError(f"Unknown deployment mode {settings.deployment.mode}")
+    log_sink = configure_async_logging(rate_limits=LOG_RATE_LIMITS)
     try:
-        await market_task
-    except asyncio.CancelledError:
-        pass
+        asyncio.run(run())
+    finally:
+        log_sink.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    main()
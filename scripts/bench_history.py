@@ -0,0 +1,75 @@
+"""Measure cold and warm range loads from the columnar history store.
+
+Writes synthetic minute bars for every symbol and trading day (skipped if
+the store already holds them), then loads the full range for all symbols.
+The default size is a year of minute bars for 500 symbols (~2.4 GB).
+
+    python scripts/bench_history.py --root /tmp/kyzlo-history --symbols 500 --days 252
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.adapters.history.columnar import ColumnarHistoryStore  # noqa: E402
+
+DAY = 86_400.0
+BARS_PER_DAY = 390
+
+
+def populate(store: ColumnarHistoryStore, symbols: int, days: int) -> None:
+    rng = np.random.default_rng(0)
+    first = date(2023, 1, 2)
+    with store.batch():
+        for idx in range(symbols):
+            symbol = f"SYM{idx:04d}"
+            if store.days("bars", symbol):
+                continue
+            for day_index in range(days):
+                close = 100.0 + np.cumsum(rng.standard_normal(BARS_PER_DAY)) * 0.05
+                store.write_day(
+                    "bars",
+                    symbol,
+                    first + timedelta(days=day_index),
+                    {
+                        "timestamp": day_index * DAY + 34_200.0 + np.arange(BARS_PER_DAY) * 60.0,
+                        "open": close,
+                        "high": close + 0.05,
+                        "low": close - 0.05,
+                        "close": close,
+                        "volume": np.full(BARS_PER_DAY, 100.0),
+                    },
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default="/tmp/kyzlo-history")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--days", type=int, default=252)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    populate(ColumnarHistoryStore(args.root), args.symbols, args.days)
+    print(f"populate: {time.perf_counter() - started:.2f}s")
+
+    symbols = [f"SYM{idx:04d}" for idx in range(args.symbols)]
+    store = ColumnarHistoryStore(args.root)
+    for label in ("first load", "warm load"):
+        started = time.perf_counter()
+        result = store.read("bars", symbols, 0.0, args.days * DAY)
+        # Touch every close so pages are actually read, not just mapped.
+        checksum = sum(float(columns["close"].sum()) for columns in result.values())
+        elapsed = time.perf_counter() - started
+        rows = sum(len(columns["close"]) for columns in result.values())
+        print(f"{label}: {rows} rows x 6 columns in {elapsed * 1000:.1f}ms (checksum {checksum:.0f})")
+
+
+if __name__ == "__main__":
+    main()
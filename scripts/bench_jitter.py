@@ -0,0 +1,166 @@
+"""Compare tick-handling jitter with the cold path in-process and in a child process.
+
+The hot loop replays paced ticks for ``--symbols`` symbols through
+GoldenCrossStrategy, persisting every tick and signal and logging every
+``--log-every`` ticks. The cold path keeps everything it is sent in the
+in-memory TimescaleRepository (a growing heap that the garbage collector
+keeps walking) and every ``--flush-interval`` seconds summarizes the
+whole history, standing in for a large persistence flush. In ``single``
+mode both share one event loop; in ``split`` mode the cold path runs in a
+ColdPathProcess behind the shared-memory ring. Latency is measured from
+each tick's scheduled arrival to the end of its handler.
+
+    python scripts/bench_jitter.py --rate 5000 --seconds 10 --modes single split
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import structlog  # noqa: E402
+
+from src.adapters.persistence.timescale import TimescaleRepository  # noqa: E402
+from src.application.cold_path import ColdPathPersistence, ColdPathProcess, ColdPathService  # noqa: E402
+from src.domain.events import SignalEvent, TickEvent  # noqa: E402
+from src.domain.models import Tick  # noqa: E402
+from src.domain.strategy.golden_cross import GoldenCrossStrategy  # noqa: E402
+from src.infrastructure.idempotency import generate_signal_id  # noqa: E402
+from src.infrastructure.logging import AsyncLogSink  # noqa: E402
+
+logger = structlog.get_logger("bench_jitter")
+
+
+class FlushingColdPath(ColdPathService):
+    """Cold path whose periodic job summarizes every stored tick."""
+
+    def __init__(self, flush_interval: float, log_sink: Optional[AsyncLogSink]) -> None:
+        super().__init__(TimescaleRepository(dsn="memory://"), log_sink=log_sink)
+        self.flush_interval = flush_interval
+
+    async def run_polls(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            # Render the whole history into rows, like building a large write batch.
+            rows = []
+            async for chunk in self.persistence.stream_events(TickEvent, 0.0, float("inf")):
+                rows.extend((event.symbol, event.price, event.timestamp) for event in chunk)
+            del rows
+
+
+def split_factory(log_sink: Optional[AsyncLogSink]) -> ColdPathService:
+    """Child-process factory; settings arrive through the environment."""
+
+    if log_sink is not None:
+        log_sink.stream = open(os.devnull, "w")
+    return FlushingColdPath(float(os.environ["BENCH_FLUSH_INTERVAL"]), log_sink)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def hot_loop(args: argparse.Namespace, persistence: Any) -> List[float]:
+    strategies = {
+        f"SYM{idx:04d}": GoldenCrossStrategy("golden-cross", id_generator=generate_signal_id)
+        for idx in range(args.symbols)
+    }
+    symbols = list(strategies)
+    total = int(args.rate * args.seconds)
+    latencies: List[float] = []
+    started = time.perf_counter()
+    sent = 0
+    while sent < total:
+        now = time.perf_counter()
+        due = min(total, int((now - started) * args.rate) + 1)
+        while sent < due:
+            arrival = started + sent / args.rate
+            symbol = symbols[sent % len(symbols)]
+            price = 100.0 + (sent * 7919 % 1000) * 0.01
+            event = TickEvent(symbol=symbol, price=price, timestamp=arrival)
+            await persistence.persist_event(event)
+            signal = strategies[symbol].on_tick(Tick(symbol, price, arrival))
+            if signal is not None:
+                await persistence.persist_event(
+                    SignalEvent(
+                        symbol=signal.symbol,
+                        strategy_id=signal.strategy_id,
+                        timestamp=signal.timestamp,
+                        side=signal.side,
+                        strength=signal.strength,
+                        signal_id=signal.signal_id,
+                    )
+                )
+            if sent % args.log_every == 0:
+                logger.info("tick_handled", symbol=symbol, price=price, sequence=sent)
+            latencies.append(time.perf_counter() - arrival)
+            sent += 1
+        await asyncio.sleep(0.0002)
+    return latencies
+
+
+async def run_single(args: argparse.Namespace) -> Dict[str, float]:
+    sink = AsyncLogSink(stream=open(os.devnull, "w")).start()
+    structlog.configure(processors=[structlog.processors.add_log_level, sink])
+    cold = FlushingColdPath(args.flush_interval, sink)
+    flusher = asyncio.create_task(cold.run_polls())
+    try:
+        latencies = await hot_loop(args, cold.persistence)
+    finally:
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        sink.close()
+    return _summary(latencies, dropped=0)
+
+
+async def run_split(args: argparse.Namespace) -> Dict[str, float]:
+    os.environ["BENCH_FLUSH_INTERVAL"] = str(args.flush_interval)
+    cold_path = ColdPathProcess(capacity=args.ring_bytes, factory=split_factory).start()
+    structlog.configure(processors=[structlog.processors.add_log_level, cold_path.log_processor])
+    await asyncio.sleep(1.0)  # let the child finish importing before the clock starts
+    try:
+        latencies = await hot_loop(args, ColdPathPersistence(cold_path))
+    finally:
+        dropped = cold_path.dropped
+        cold_path.stop()
+    return _summary(latencies, dropped=dropped)
+
+
+def _summary(latencies: List[float], dropped: int) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "ticks": len(ordered),
+        "p50_us": _percentile(ordered, 0.5) * 1e6,
+        "p99_us": _percentile(ordered, 0.99) * 1e6,
+        "p999_us": _percentile(ordered, 0.999) * 1e6,
+        "max_us": (ordered[-1] if ordered else 0.0) * 1e6,
+        "dropped": dropped,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=5_000, help="ticks per second")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--log-every", type=int, default=10)
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--ring-bytes", type=int, default=8 << 20)
+    parser.add_argument("--modes", nargs="+", choices=("single", "split"), default=["single", "split"])
+    args = parser.parse_args()
+    print(f"cpus={os.cpu_count()} rate={args.rate:,.0f}/s seconds={args.seconds}")
+    for mode in args.modes:
+        result = asyncio.run(run_single(args) if mode == "single" else run_split(args))
+        print(
+            f"{mode:>6}: p50 {result['p50_us']:9.1f} us  p99 {result['p99_us']:9.1f} us  "
+            f"p99.9 {result['p999_us']:9.1f} us  max {result['max_us']:9.1f} us  dropped={result['dropped']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
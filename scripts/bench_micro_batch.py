@@ -0,0 +1,153 @@
+"""Compare per-tick GoldenCrossStrategy calls with micro-batched cross-sectional updates.
+
+Replays a synthetic feed of ``--rate`` ticks per second spread over
+``--symbols`` symbols. The baseline calls one GoldenCrossStrategy per
+symbol for every tick, as the PartitionedEngine handlers do. Micro-batch
+mode groups the ticks that arrive within each ``--windows`` interval and
+runs one CrossSectionalGoldenCross step per group. It reports throughput
+for the strategy step alone, with every Signal object materialized, and
+as the live pipeline runs it ("+risk"): per-tick mode validates each
+signal with RiskService.validate, micro-batch mode validates the whole
+SignalBatch with RiskService.validate_signal_batch and materializes only
+the accepted signals. It also reports per-tick latency from arrival to the end of the tick's
+processing. A tick first waits for its window to close and then for
+earlier batches to finish, so a path slower than the feed shows its
+growing backlog.
+
+    python scripts/bench_micro_batch.py --symbols 1000 5000 --rate 200000 --windows 0.001 0.002 0.005
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.application.services import RiskService  # noqa: E402
+from src.domain.events import SignalEvent  # noqa: E402
+from src.domain.models import Tick  # noqa: E402
+from src.domain.risk.kill_switch import KillSwitch  # noqa: E402
+from src.domain.risk.rules import MaxNotionalRule, MaxPositionRule  # noqa: E402
+from src.domain.strategy.cross_section import CrossSectionalGoldenCross  # noqa: E402
+from src.domain.strategy.golden_cross import GoldenCrossStrategy  # noqa: E402
+from src.infrastructure.idempotency import generate_signal_id  # noqa: E402
+
+
+def make_feed(symbols: int, ticks: int, rate: float, seed: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(symbols, size=ticks)
+    prices = np.round(100.0 + rng.normal(scale=0.5, size=ticks), 2)
+    return {"rows": rows, "prices": prices, "arrivals": np.arange(ticks) / rate}
+
+
+def _percentiles(values: np.ndarray) -> str:
+    p50, p99 = np.percentile(values, [50, 99]) * 1e3
+    return f"latency p50 {p50:9.2f} ms  p99 {p99:9.2f} ms"
+
+
+def _risk_service(names: List[str]) -> RiskService:
+    # Limits loose enough that every signal passes, so both paths materialize the same signals.
+    rules = [MaxPositionRule(names[0], 1e12), MaxNotionalRule(1e18)]
+    return RiskService(kill_switch=KillSwitch(daily_loss_limit=1e18), rules=rules)
+
+
+def bench_per_tick(feed: Dict[str, np.ndarray], names: List[str], args: argparse.Namespace, risk: bool) -> None:
+    strategies = {
+        name: GoldenCrossStrategy("golden-cross", args.short_window, args.long_window, generate_signal_id)
+        for name in names
+    }
+    service = _risk_service(names)
+    ticks = [
+        Tick(names[row], price, arrival)
+        for row, price, arrival in zip(feed["rows"].tolist(), feed["prices"].tolist(), feed["arrivals"].tolist())
+    ]
+    signals = 0
+    finished = [0.0] * len(ticks)
+    started = time.perf_counter()
+    for idx, tick in enumerate(ticks):
+        signal = strategies[tick.symbol].on_tick(tick)
+        if signal is not None:
+            if risk:
+                event = SignalEvent(
+                    signal.symbol, signal.strategy_id, signal.timestamp, signal.side, signal.strength, signal.signal_id
+                )
+                service.validate(event, [], pnl=0.0, broker_connected=True)
+            signals += 1
+        finished[idx] = time.perf_counter()
+    elapsed = finished[-1] - started
+    durations = np.diff(np.r_[started, finished])
+    latencies = np.empty(len(ticks))
+    busy_until = 0.0
+    for idx, (arrival, duration) in enumerate(zip(feed["arrivals"].tolist(), durations.tolist())):
+        busy_until = max(arrival, busy_until) + duration
+        latencies[idx] = busy_until - arrival
+    label = "per-tick" + (" +risk" if risk else "")
+    print(f"  {label:<20}: {len(ticks) / elapsed:>10,.0f} ticks/s  {_percentiles(latencies)}  signals={signals}")
+
+
+def bench_window(feed: Dict[str, np.ndarray], names: List[str], window: float, args: argparse.Namespace) -> None:
+    service = _risk_service(names)
+    for mode in ("", "+signals", "+risk"):
+        universe = CrossSectionalGoldenCross(
+            "golden-cross", args.short_window, args.long_window, generate_signal_id, capacity=len(names)
+        )
+        for name in names:
+            universe.index_of(name)
+        arrivals = feed["arrivals"]
+        closes = (np.floor(arrivals / window) + 1) * window
+        bounds = np.flatnonzero(np.r_[True, closes[1:] != closes[:-1], True])
+        latencies = np.empty(len(arrivals))
+        compute = 0.0
+        signals = 0
+        busy_until = 0.0
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            started = time.perf_counter()
+            rows, prices = feed["rows"][start:end], feed["prices"][start:end]
+            batch = universe.on_batch(rows, prices, arrivals[start:end])
+            if mode == "+signals":
+                batch.signals(generate_signal_id)
+            elif mode == "+risk":
+                latest = dict(zip([names[row] for row in rows.tolist()], prices.tolist()))
+                decisions = service.validate_signal_batch(
+                    batch, generate_signal_id, [], pnl=0.0, broker_connected=True, prices=latest
+                )
+                batch.signals(generate_signal_id, [idx for idx, decision in enumerate(decisions) if decision.accepted])
+            elapsed = time.perf_counter() - started
+            compute += elapsed
+            signals += len(batch)
+            busy_until = max(closes[start], busy_until) + elapsed
+            latencies[start:end] = busy_until - arrivals[start:end]
+        label = f"window {window * 1e3:g} ms" + (f" {mode}" if mode else "")
+        print(
+            f"  {label:<20}: {len(arrivals) / compute:>10,.0f} ticks/s  {_percentiles(latencies)}"
+            f"  windows={len(bounds) - 1} signals={signals}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--rate", type=float, default=200_000, help="feed ticks per second")
+    parser.add_argument("--seconds", type=float, default=2.0, help="feed duration replayed")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0.001, 0.002, 0.005])
+    parser.add_argument("--short-window", type=int, default=3)
+    parser.add_argument("--long-window", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    ticks = int(args.rate * args.seconds)
+    for symbols in args.symbols:
+        names = [f"SYM{idx:05d}" for idx in range(symbols)]
+        feed = make_feed(symbols, ticks, args.rate, args.seed)
+        print(f"{symbols:,} symbols, {ticks:,} ticks at {args.rate:,.0f}/s")
+        bench_per_tick(feed, names, args, risk=False)
+        bench_per_tick(feed, names, args, risk=True)
+        for window in args.windows:
+            bench_window(feed, names, window, args)
+
+
+if __name__ == "__main__":
+    main()
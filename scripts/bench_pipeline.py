@@ -0,0 +1,82 @@
+"""Find the tick throughput at which the engine pipeline saturates.
+
+Drives a SyntheticStream into PartitionedEngine at increasing target rates
+and reports achieved feed rate, handler throughput and worst queue lag.
+The unthrottled run gives the ceiling of the feed itself.
+
+    python scripts/bench_pipeline.py --symbols 500 --rates 10000 50000 100000 200000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.adapters.market_data.synthetic import SyntheticStream, SyntheticSymbol  # noqa: E402
+from src.application.engine import PartitionedEngine  # noqa: E402
+from src.domain.events import TickEvent  # noqa: E402
+from src.infrastructure.clock import MonotonicClock  # noqa: E402
+
+
+async def run_once(symbols: int, rate, duration: float, workers, policy: str) -> dict:
+    per_symbol = (rate or 100_000) / symbols
+    specs = [SyntheticSymbol(f"SYM{idx:05d}", rate=per_symbol) for idx in range(symbols)]
+    clock = MonotonicClock()
+    engine = PartitionedEngine(maxsize=10_000, policy=policy, clock=clock, workers=workers)
+    stream = SyntheticStream(
+        specs,
+        speed=1.0 if rate else None,
+        duration=duration if rate else None,
+        max_ticks=None if rate else int(duration * 200_000),
+        seed=1,
+    )
+    handled = 0
+
+    async def handler(event: TickEvent) -> None:
+        nonlocal handled
+        handled += 1
+
+    for spec in specs:
+        engine.register_handler(spec.symbol, handler)
+        await stream.subscribe(spec.symbol, engine.enqueue)
+    # Tick timestamps are relative to the start of the feed; align them with the clock.
+    stream.start_timestamp = clock.now()
+    started = time.perf_counter()
+    await stream.start()
+    while handled < stream.emitted and time.perf_counter() - started < duration * 10:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    worst_lag = max((stats.lag for stats in engine.all_stats().values()), default=0.0)
+    dropped = sum(stats.dropped for stats in engine.all_stats().values())
+    await engine.shutdown()
+    return {
+        "target": rate or "unthrottled",
+        "feed_rate": stream.achieved_rate,
+        "handled_rate": handled / elapsed,
+        "worst_lag_ms": worst_lag * 1000,
+        "dropped": dropped,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--rates", type=float, nargs="+", default=[10_000, 50_000, 100_000, 200_000])
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--policy", default="block")
+    args = parser.parse_args()
+    for rate in [*args.rates, None]:
+        result = asyncio.run(run_once(args.symbols, rate, args.duration, args.workers, args.policy))
+        print(
+            f"target={result['target']!s:>12} feed={result['feed_rate']:>10.0f}/s "
+            f"handled={result['handled_rate']:>10.0f}/s worst_lag={result['worst_lag_ms']:>8.1f}ms "
+            f"dropped={result['dropped']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark the offline tick -> order -> fill -> position cycle.
+
+Drives a SyntheticStream paced at ``--rate`` ticks per second (0 runs
+unthrottled, where latencies mostly measure queueing) into
+SimulatedBroker. Every
+``--order-every`` ticks the handler submits an order (market or, with
+``--limit-share``, a limit order a few bps away from the last price); a
+fill consumer applies fills to a PositionTracker. Reports order and fill
+throughput and submit-to-fill latency percentiles.
+
+    python scripts/bench_roundtrip.py --rate 50000 --ticks 200000 --order-every 2 --latency 0.0005
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.adapters.broker.simulator import SimulatedBroker  # noqa: E402
+from src.adapters.market_data.synthetic import SyntheticStream, SyntheticSymbol  # noqa: E402
+from src.application.position_tracker import PositionTracker  # noqa: E402
+from src.domain.events import OrderEvent, TickEvent  # noqa: E402
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, float]:
+    per_symbol = (args.rate or 100_000) / args.symbols
+    specs = [SyntheticSymbol(f"SYM{idx:04d}", rate=per_symbol) for idx in range(args.symbols)]
+    stream = SyntheticStream(specs, speed=1.0 if args.rate else None, max_ticks=args.ticks, seed=args.seed)
+    broker = SimulatedBroker(
+        latency=args.latency,
+        jitter=args.jitter,
+        slippage_bps=args.slippage_bps,
+        impact_bps=args.impact_bps,
+        liquidity=args.liquidity,
+        reject_probability=args.reject_probability,
+        seed=args.seed,
+    )
+    tracker = PositionTracker()
+    rng = random.Random(args.seed)
+    submitted_at: Dict[UUID, float] = {}
+    latencies: List[float] = []
+    ticks = 0
+
+    async def on_tick(event: TickEvent) -> None:
+        nonlocal ticks
+        ticks += 1
+        await broker.on_tick(event)
+        tracker.update_market_price(event.symbol, event.price)
+        if ticks % args.order_every:
+            return
+        held = tracker.get_position(event.symbol).quantity
+        side = "SELL" if held >= args.quantity and rng.random() < 0.5 else "BUY"
+        price = None
+        if rng.random() < args.limit_share:
+            offset = event.price * 5e-4
+            price = event.price - offset if side == "BUY" else event.price + offset
+        order_id = uuid4()
+        submitted_at[order_id] = time.perf_counter()
+        await broker.submit_order(
+            OrderEvent(symbol=event.symbol, side=side, quantity=args.quantity, price=price, client_order_id=order_id)
+        )
+
+    async def consume_fills() -> None:
+        while True:
+            fill = await broker.stream_fills()
+            tracker.handle_fill(fill)
+            started = submitted_at.pop(fill.client_order_id, None)
+            if started is not None:
+                latencies.append(time.perf_counter() - started)
+
+    for spec in specs:
+        await stream.subscribe(spec.symbol, on_tick)
+    consumer = asyncio.create_task(consume_fills())
+    started = time.perf_counter()
+    await stream.start()
+    # Let in-flight orders arrive and drain the fill queue.
+    await asyncio.sleep(args.latency + args.jitter + 0.01)
+    while not broker._fills.empty():
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    consumer.cancel()
+    await asyncio.gather(consumer, return_exceptions=True)
+    stats = broker.stats
+    return {
+        "ticks": ticks,
+        "orders": stats.submitted,
+        "orders_per_s": stats.submitted / elapsed,
+        "fills": stats.fills,
+        "fills_per_s": stats.fills / elapsed,
+        "rejected": stats.rejected,
+        "open_orders": broker.open_orders,
+        "fill_p50_us": _percentile(latencies, 0.5) * 1e6,
+        "fill_p99_us": _percentile(latencies, 0.99) * 1e6,
+        "total_pnl": tracker.get_total_pnl(),
+        "seconds": elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=50_000)
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--order-every", type=int, default=2)
+    parser.add_argument("--quantity", type=float, default=10.0)
+    parser.add_argument("--limit-share", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--slippage-bps", type=float, default=1.0)
+    parser.add_argument("--impact-bps", type=float, default=0.1)
+    parser.add_argument("--liquidity", type=float, default=None)
+    parser.add_argument("--reject-probability", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    result = asyncio.run(run(args))
+    for key, value in result.items():
+        print(f"{key:>14}: {value:,.2f}" if isinstance(value, float) else f"{key:>14}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
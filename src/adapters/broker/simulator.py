@@ -0,0 +1,225 @@
+import asyncio
+import heapq
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from ...domain.events import FillEvent, OrderEvent, OrderRejectedEvent, TickEvent
+from ...infrastructure.clock import Scheduler
+from ...ports.broker import BrokerPort, ExecutionReport
+
+
+@dataclass
+class SimulatorStats:
+    submitted: int = 0
+    rejected: int = 0
+    fills: int = 0
+    filled_quantity: float = 0.0
+    cancelled: int = 0
+
+
+class _Resting:
+    __slots__ = ("order", "key", "remaining", "cancelled")
+
+    def __init__(self, order: OrderEvent) -> None:
+        self.order = order
+        self.key = order.client_order_id
+        self.remaining = float(order.quantity)
+        self.cancelled = False
+
+
+class _SymbolBook:
+    __slots__ = ("last_price", "available", "market", "bids", "asks")
+
+    def __init__(self) -> None:
+        self.last_price: Optional[float] = None
+        self.available = 0.0
+        self.market: Deque[_Resting] = deque()
+        self.bids: List[Tuple[float, int, _Resting]] = []
+        self.asks: List[Tuple[float, int, _Resting]] = []
+
+
+class SimulatedBroker(BrokerPort):
+    """In-process matching engine that fills orders against a tick stream.
+
+    Feed it ticks through ``on_tick`` (subscribe it to a live or replayed
+    market data stream). Orders and cancels reach the matching engine after
+    ``latency`` plus up to ``jitter`` seconds of scheduler time; with both
+    zero they are handled inline. A ``reject_probability`` share of orders
+    is rejected at submission. Market orders fill at the last price moved
+    against the order by ``slippage_bps`` plus ``impact_bps`` per unit of
+    filled quantity; limit orders rest in per-symbol price-time books and
+    fill at their limit or better once a tick trades through them. Each
+    tick makes ``liquidity`` units available per symbol (None is
+    unlimited), so large orders fill partially across ticks. Fills and
+    OrderRejectedEvents are queued for ``stream_fills``. The RNG is seeded
+    for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        slippage_bps: float = 0.0,
+        impact_bps: float = 0.0,
+        liquidity: Optional[float] = None,
+        reject_probability: float = 0.0,
+        seed: Optional[int] = None,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must be non-negative")
+        if not 0.0 <= reject_probability <= 1.0:
+            raise ValueError("reject_probability must be between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.slippage_bps = slippage_bps
+        self.impact_bps = impact_bps
+        self.liquidity = float("inf") if liquidity is None else liquidity
+        self.reject_probability = reject_probability
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self.stats = SimulatorStats()
+        self.rejected: List[UUID] = []
+        self._rng = random.Random(seed)
+        self._books: Dict[str, _SymbolBook] = {}
+        self._open: Dict[UUID, _Resting] = {}
+        self._sequence = 0
+        self._reports: asyncio.Queue[ExecutionReport] = asyncio.Queue()
+
+    @property
+    def open_orders(self) -> int:
+        return len(self._open)
+
+    def last_price(self, symbol: str) -> Optional[float]:
+        book = self._books.get(symbol)
+        return book.last_price if book is not None else None
+
+    async def submit_order(self, order: OrderEvent) -> None:
+        self.stats.submitted += 1
+        if self.reject_probability and self._rng.random() < self.reject_probability:
+            self.stats.rejected += 1
+            self.rejected.append(order.client_order_id)
+            self._reports.put_nowait(
+                OrderRejectedEvent(
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=order.quantity,
+                    client_order_id=order.client_order_id,
+                    reason="Rejected by simulator",
+                )
+            )
+            return
+        resting = _Resting(order)
+        self._open[resting.key] = resting
+        self._after_latency(self._arrive, resting)
+
+    async def cancel_order(self, client_order_id: Union[str, UUID]) -> None:
+        key = client_order_id if isinstance(client_order_id, UUID) else UUID(client_order_id)
+        self._after_latency(self._cancel, key)
+
+    async def stream_fills(self) -> ExecutionReport:
+        return await self._reports.get()
+
+    async def on_tick(self, event: TickEvent) -> None:
+        book = self._book(event.symbol)
+        price = event.price
+        book.last_price = price
+        book.available = self.liquidity
+        market = book.market
+        while market and book.available > 0:
+            resting = market[0]
+            if not resting.cancelled:
+                self._execute(book, resting)
+                if resting.remaining > 0:
+                    break
+            market.popleft()
+        bids = book.bids
+        while bids and book.available > 0:
+            resting = bids[0][2]
+            if not resting.cancelled:
+                if resting.order.price < price:  # type: ignore[operator]
+                    break
+                self._execute(book, resting)
+                if resting.remaining > 0:
+                    break
+            heapq.heappop(bids)
+        asks = book.asks
+        while asks and book.available > 0:
+            resting = asks[0][2]
+            if not resting.cancelled:
+                if resting.order.price > price:  # type: ignore[operator]
+                    break
+                self._execute(book, resting)
+                if resting.remaining > 0:
+                    break
+            heapq.heappop(asks)
+
+    def _after_latency(self, callback: Callable[[Any], None], argument: Any) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._rng.random() * self.jitter
+        if delay > 0:
+            self.scheduler.call_later(delay, callback, argument)
+        else:
+            callback(argument)
+
+    def _book(self, symbol: str) -> _SymbolBook:
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = _SymbolBook()
+        return book
+
+    def _arrive(self, resting: _Resting) -> None:
+        if resting.cancelled:
+            return
+        order = resting.order
+        book = self._book(order.symbol)
+        if book.last_price is not None and book.available > 0:
+            self._execute(book, resting)
+        if resting.remaining <= 0:
+            return
+        if order.price is None:
+            book.market.append(resting)
+            return
+        self._sequence += 1
+        if order.side == "BUY":
+            heapq.heappush(book.bids, (-order.price, self._sequence, resting))
+        else:
+            heapq.heappush(book.asks, (order.price, self._sequence, resting))
+
+    def _cancel(self, key: UUID) -> None:
+        resting = self._open.pop(key, None)
+        if resting is not None:
+            resting.cancelled = True
+            self.stats.cancelled += 1
+
+    def _execute(self, book: _SymbolBook, resting: _Resting) -> None:
+        order = resting.order
+        last = book.last_price
+        assert last is not None
+        buy = order.side == "BUY"
+        if order.price is not None and ((buy and order.price < last) or (not buy and order.price > last)):
+            return
+        quantity = min(resting.remaining, book.available)
+        if order.price is None:
+            slip = (self.slippage_bps + self.impact_bps * quantity) / 10_000
+            price = last * (1 + slip) if buy else last * (1 - slip)
+        else:
+            price = last
+        book.available -= quantity
+        resting.remaining -= quantity
+        if resting.remaining <= 0:
+            self._open.pop(resting.key, None)
+        self.stats.fills += 1
+        self.stats.filled_quantity += quantity
+        self._reports.put_nowait(
+            FillEvent(
+                symbol=order.symbol,
+                side=order.side,
+                quantity=quantity,
+                price=price,
+                client_order_id=order.client_order_id,
+            )
+        )
@@ -0,0 +1,150 @@
+import json
+import os
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from ...ports.history import HistoricalDataPort
+
+SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    "bars": ("timestamp", "open", "high", "low", "close", "volume"),
+    "ticks": ("timestamp", "price", "size"),
+}
+DTYPE = np.dtype("<f8")
+MANIFEST = "manifest.json"
+
+
+class ColumnarHistoryStore(HistoricalDataPort):
+    """Local columnar store of bars and ticks read through memory maps.
+
+    Every (kind, symbol) pair owns one append-only raw float64 file per
+    column under ``root/kind/symbol/``; days are appended in order and the
+    manifest records each day's row range. Range queries binary search the
+    memory-mapped timestamp column and return slices of the maps, so no
+    parsing or copying happens and a warm cache is served from the page
+    cache. Open maps are reused until the symbol is appended to again.
+    Nothing is created under ``root`` until the first append.
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        self._manifest: Dict[str, Dict[str, Dict[str, Any]]] = self._read_manifest()
+        self._maps: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        self._deferred = False
+
+    async def load(
+        self, kind: str, symbols: Sequence[str], start: float, end: float
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        return self.read(kind, symbols, start, end)
+
+    async def append(self, kind: str, symbol: str, day: date, columns: Mapping[str, np.ndarray]) -> None:
+        self.write_day(kind, symbol, day, columns)
+
+    def read(self, kind: str, symbols: Sequence[str], start: float, end: float) -> Dict[str, Dict[str, np.ndarray]]:
+        """Return column views for rows with ``start <= timestamp < end`` per stored symbol."""
+
+        result: Dict[str, Dict[str, np.ndarray]] = {}
+        for symbol in symbols:
+            maps = self._columns(kind, symbol)
+            if maps is None:
+                continue
+            timestamps = maps["timestamp"]
+            lo = int(np.searchsorted(timestamps, start, "left"))
+            hi = int(np.searchsorted(timestamps, end, "left"))
+            result[symbol] = {name: column[lo:hi] for name, column in maps.items()}
+        return result
+
+    def write_day(self, kind: str, symbol: str, day: date, columns: Mapping[str, np.ndarray]) -> None:
+        """Append one day of rows; days must be written in increasing order."""
+
+        schema = self._schema(kind)
+        if set(columns) != set(schema):
+            raise ValueError(f"{kind} columns must be exactly {schema}")
+        arrays = {name: np.ascontiguousarray(columns[name], dtype=DTYPE) for name in schema}
+        rows = len(arrays["timestamp"])
+        if any(len(array) != rows for array in arrays.values()):
+            raise ValueError("All columns must have the same length")
+        if rows and np.any(np.diff(arrays["timestamp"]) < 0):
+            raise ValueError("Timestamps must be sorted within a day")
+        entry = self._manifest.setdefault(kind, {}).setdefault(symbol, {"rows": 0, "days": {}})
+        key = day.isoformat()
+        if entry["days"] and key <= max(entry["days"]):
+            raise ValueError(f"{symbol} {kind} already has data on or after {key}")
+        directory = self._directory(kind, symbol)
+        directory.mkdir(parents=True, exist_ok=True)
+        expected = entry["rows"] * DTYPE.itemsize
+        for name, array in arrays.items():
+            path = directory / f"{name}.f64"
+            # Drop bytes from an append that never made it into the manifest.
+            if path.exists() and path.stat().st_size != expected:
+                os.truncate(path, expected)
+            with open(path, "ab") as handle:
+                handle.write(array.tobytes())
+        entry["days"][key] = [entry["rows"], entry["rows"] + rows]
+        entry["rows"] += rows
+        self._maps.pop((kind, symbol), None)
+        if not self._deferred:
+            self._write_manifest()
+
+    @contextmanager
+    def batch(self) -> Iterator["ColumnarHistoryStore"]:
+        """Defer manifest writes until the block exits, for bulk appends."""
+
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self._write_manifest()
+
+    def symbols(self, kind: str) -> List[str]:
+        return sorted(self._manifest.get(kind, {}))
+
+    def days(self, kind: str, symbol: str) -> List[date]:
+        days = self._manifest.get(kind, {}).get(symbol, {}).get("days", {})
+        return [date.fromisoformat(day) for day in sorted(days)]
+
+    def _columns(self, kind: str, symbol: str) -> Union[Dict[str, np.ndarray], None]:
+        maps = self._maps.get((kind, symbol))
+        if maps is not None:
+            return maps
+        entry = self._manifest.get(kind, {}).get(symbol)
+        if entry is None:
+            return None
+        rows = entry["rows"]
+        directory = self._directory(kind, symbol)
+        if rows:
+            maps = {
+                name: np.memmap(directory / f"{name}.f64", dtype=DTYPE, mode="r", shape=(rows,))
+                for name in self._schema(kind)
+            }
+        else:
+            maps = {name: np.empty(0, dtype=DTYPE) for name in self._schema(kind)}
+        self._maps[(kind, symbol)] = maps
+        return maps
+
+    def _directory(self, kind: str, symbol: str) -> Path:
+        return self.root / kind / symbol
+
+    @staticmethod
+    def _schema(kind: str) -> Tuple[str, ...]:
+        schema = SCHEMAS.get(kind)
+        if schema is None:
+            raise ValueError(f"Unknown history kind {kind}")
+        return schema
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        path = self.root / MANIFEST
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def _write_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / MANIFEST
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._manifest))
+        os.replace(tmp, path)
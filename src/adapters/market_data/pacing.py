@@ -0,0 +1,38 @@
+from typing import Optional
+
+from ...infrastructure.clock import Scheduler
+
+
+class Pacer:
+    """Releases work in step with an event-time offset.
+
+    Callers emit ticks in chunks and call ``wait`` with the event-time
+    offset (seconds since the start of the feed) reached by the chunk.
+    With ``speed`` set the pacer sleeps until ``offset / speed`` seconds of
+    scheduler time have passed, so the long-run rate is exact without a
+    sleep per tick. With ``speed=None`` it only yields to the loop.
+    """
+
+    def __init__(self, speed: Optional[float] = 1.0, scheduler: Optional[Scheduler] = None) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self._started: Optional[float] = None
+
+    def start(self) -> None:
+        self._started = self.scheduler.now()
+
+    def elapsed(self) -> float:
+        if self._started is None:
+            return 0.0
+        return self.scheduler.now() - self._started
+
+    async def wait(self, offset: float) -> None:
+        if self._started is None:
+            self.start()
+        if self.speed is None:
+            await self.scheduler.sleep(0)
+            return
+        delay = offset / self.speed - self.elapsed()
+        await self.scheduler.sleep(delay if delay > 0 else 0)
@@ -0,0 +1,112 @@
+import csv
+import gzip
+import io
+from itertools import islice
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from ...domain.events import TickEvent
+from ...infrastructure.clock import Scheduler
+from ...ports.market_data import MarketDataPort
+from .pacing import Pacer
+
+Row = Tuple[str, float, float]
+
+
+def _open_text(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), newline="")
+    return open(path, newline="")
+
+
+def read_tick_chunks(path: Union[str, Path], chunk_size: int = 10_000) -> Iterator[List[Row]]:
+    """Yield ``(symbol, price, timestamp)`` rows from a CSV(.gz) file in chunks.
+
+    The file needs ``symbol``, ``price`` and ``timestamp`` columns; a header
+    row naming them is used if present, otherwise that column order is
+    assumed.
+    """
+
+    with _open_text(Path(path)) as handle:
+        reader = csv.reader(handle)
+        first = next(reader, None)
+        if first is None:
+            return
+        if "symbol" in first:
+            columns = (first.index("symbol"), first.index("price"), first.index("timestamp"))
+            pending: List[List[str]] = []
+        else:
+            columns = (0, 1, 2)
+            pending = [first]
+        sym_col, price_col, ts_col = columns
+        while True:
+            rows = pending + list(islice(reader, chunk_size - len(pending)))
+            pending = []
+            if not rows:
+                return
+            yield [(row[sym_col], float(row[price_col]), float(row[ts_col])) for row in rows]
+
+
+class FileReplayStream(MarketDataPort):
+    """Replays recorded ticks from local CSV files for load generation.
+
+    Files are streamed in chunks of ``chunk_size`` rows so memory stays
+    flat regardless of file size. Pacing follows, in order of precedence:
+    a fixed ``rate`` in ticks per second, the recorded timestamps scaled by
+    ``speed``, or no pacing at all when both are None.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Union[str, Path]],
+        rate: Optional[float] = None,
+        speed: Optional[float] = None,
+        chunk_size: int = 10_000,
+        pace_every: int = 256,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.paths = [Path(path) for path in paths]
+        self.rate = rate
+        self.chunk_size = chunk_size
+        self.pace_every = pace_every
+        self.pacer = Pacer(speed=1.0 if rate is not None else speed, scheduler=scheduler)
+        self.emitted = 0
+        self._handlers: Dict[str, Callable[[TickEvent], Awaitable[None]]] = {}
+        self._running = False
+
+    async def subscribe(self, symbol: str, handler: Callable[[TickEvent], Awaitable[None]]) -> None:
+        self._handlers[symbol] = handler
+
+    def stop(self) -> None:
+        self._running = False
+
+    @property
+    def achieved_rate(self) -> float:
+        elapsed = self.pacer.elapsed()
+        return self.emitted / elapsed if elapsed > 0 else 0.0
+
+    async def start(self) -> None:
+        self._running = True
+        self.pacer.start()
+        handlers = self._handlers
+        first_timestamp: Optional[float] = None
+        for path in self.paths:
+            for chunk in read_tick_chunks(path, self.chunk_size):
+                if first_timestamp is None:
+                    first_timestamp = chunk[0][2]
+                for start in range(0, len(chunk), self.pace_every):
+                    if not self._running:
+                        return
+                    batch = chunk[start : start + self.pace_every]
+                    for symbol, price, timestamp in batch:
+                        handler = handlers.get(symbol)
+                        if handler is not None:
+                            await handler(TickEvent(symbol=symbol, price=price, timestamp=timestamp))
+                    self.emitted += len(batch)
+                    if self.rate is not None:
+                        await self.pacer.wait(self.emitted / self.rate)
+                    else:
+                        await self.pacer.wait(batch[-1][2] - first_timestamp)
+        self._running = False
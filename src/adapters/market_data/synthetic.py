@@ -0,0 +1,165 @@
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Literal, Optional, Sequence
+
+import numpy as np
+
+from ...domain.events import TickEvent
+from ...infrastructure.clock import Scheduler
+from ...ports.market_data import MarketDataPort
+from .pacing import Pacer
+
+PriceModel = Literal["gbm", "random_walk"]
+
+TRADING_SECONDS_PER_YEAR = 252 * 6.5 * 3600
+SESSION_SECONDS = 6.5 * 3600
+# Unthrottled chunks span this fraction of the session so the profile stays resolved.
+_UNTHROTTLED_SPAN = 0.001
+_MAX_CHUNK = 65_536
+
+
+@dataclass(frozen=True)
+class SyntheticSymbol:
+    """Generator parameters for one symbol; drift and volatility are annualized."""
+
+    symbol: str
+    price: float = 100.0
+    rate: float = 1.0
+    drift: float = 0.0
+    volatility: float = 0.2
+
+
+def flat_profile(session_fraction: float) -> float:
+    return 1.0
+
+
+def u_shaped_profile(open_boost: float = 4.0, close_boost: float = 3.0, width: float = 0.05) -> Callable[[float], float]:
+    """Rate multiplier with bursts decaying away from the open and into the close."""
+
+    def profile(session_fraction: float) -> float:
+        fraction = min(max(session_fraction, 0.0), 1.0)
+        return (
+            1.0
+            + open_boost * math.exp(-fraction / width)
+            + close_boost * math.exp(-(1.0 - fraction) / width)
+        )
+
+    return profile
+
+
+class SyntheticStream(MarketDataPort):
+    """Configurable synthetic tick feed for load generation.
+
+    Ticks are generated in vectorized chunks. The combined arrival rate is
+    the sum of per-symbol ``rate`` values scaled by ``profile`` evaluated at
+    the fraction of ``session_seconds`` elapsed in event time; each tick is
+    assigned to a symbol in proportion to its rate. Prices follow GBM or an
+    arithmetic random walk. Event time is paced against the scheduler at
+    ``speed`` (1.0 = real time) or, with ``speed=None``, runs unthrottled.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[SyntheticSymbol],
+        model: PriceModel = "gbm",
+        profile: Callable[[float], float] = flat_profile,
+        session_seconds: float = SESSION_SECONDS,
+        start_timestamp: float = 0.0,
+        speed: Optional[float] = 1.0,
+        max_ticks: Optional[int] = None,
+        duration: Optional[float] = None,
+        chunk_seconds: float = 0.001,
+        seed: Optional[int] = None,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
+        if not symbols:
+            raise ValueError("SyntheticStream needs at least one symbol")
+        if model not in ("gbm", "random_walk"):
+            raise ValueError(f"Unknown price model {model}")
+        self.symbols = list(symbols)
+        self.model = model
+        self.profile = profile
+        self.session_seconds = session_seconds
+        self.start_timestamp = start_timestamp
+        self.max_ticks = max_ticks
+        self.duration = duration
+        self.chunk_seconds = chunk_seconds
+        self.pacer = Pacer(speed=speed, scheduler=scheduler)
+        self.emitted = 0
+        self._rng = np.random.default_rng(seed)
+        self._handlers: Dict[str, Callable[[TickEvent], Awaitable[None]]] = {}
+        self._names = [spec.symbol for spec in self.symbols]
+        self._rates = np.array([spec.rate for spec in self.symbols], dtype=np.float64)
+        if (self._rates <= 0).any():
+            raise ValueError("Symbol rates must be positive")
+        self._weights = self._rates / self._rates.sum()
+        drift = np.array([spec.drift for spec in self.symbols]) / TRADING_SECONDS_PER_YEAR
+        sigma = np.array([spec.volatility for spec in self.symbols]) / math.sqrt(TRADING_SECONDS_PER_YEAR)
+        initial = np.array([spec.price for spec in self.symbols], dtype=np.float64)
+        # Each symbol steps over its own mean inter-arrival time.
+        step = 1.0 / self._rates
+        if model == "gbm":
+            self._mean = (drift - 0.5 * sigma**2) * step
+            self._scale = sigma * np.sqrt(step)
+            self._level = np.log(initial)
+        else:
+            self._mean = drift * initial * step
+            self._scale = sigma * initial * np.sqrt(step)
+            self._level = initial.copy()
+        self._running = False
+
+    async def subscribe(self, symbol: str, handler: Callable[[TickEvent], Awaitable[None]]) -> None:
+        self._handlers[symbol] = handler
+
+    def stop(self) -> None:
+        self._running = False
+
+    @property
+    def achieved_rate(self) -> float:
+        elapsed = self.pacer.elapsed()
+        return self.emitted / elapsed if elapsed > 0 else 0.0
+
+    async def start(self) -> None:
+        self._running = True
+        self.pacer.start()
+        names = self._names
+        handlers = [self._handlers.get(name) for name in names]
+        base_rate = float(self._rates.sum())
+        offset = 0.0
+        while self._running:
+            rate = base_rate * self.profile(offset / self.session_seconds)
+            span = self.chunk_seconds if self.pacer.speed is not None else self.session_seconds * _UNTHROTTLED_SPAN
+            count = min(max(1, int(rate * span)), _MAX_CHUNK)
+            if self.max_ticks is not None:
+                count = min(count, self.max_ticks - self.emitted)
+            if self.duration is not None:
+                count = min(count, int((self.duration - offset) * rate))
+            if count <= 0:
+                break
+            times = offset + np.arange(1, count + 1) / rate
+            prices, chosen = self._generate(count)
+            timestamps = (self.start_timestamp + times).tolist()
+            for idx, price, timestamp in zip(chosen.tolist(), prices.tolist(), timestamps):
+                handler = handlers[idx]
+                if handler is not None:
+                    await handler(TickEvent(symbol=names[idx], price=price, timestamp=timestamp))
+            self.emitted += count
+            offset = float(times[-1])
+            await self.pacer.wait(offset)
+        self._running = False
+
+    def _generate(self, count: int) -> "tuple[np.ndarray, np.ndarray]":
+        chosen = self._rng.choice(len(self._names), size=count, p=self._weights)
+        steps = self._mean[chosen] + self._scale[chosen] * self._rng.standard_normal(count)
+        # Cumulate steps per symbol: sort by symbol, run one cumsum and reset it at group starts.
+        order = np.argsort(chosen, kind="stable")
+        grouped = chosen[order]
+        running = np.cumsum(steps[order])
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        group_offset = np.repeat(running[starts] - steps[order][starts], np.diff(np.r_[starts, count]))
+        levels = np.empty(count)
+        levels[order] = self._level[grouped] + running - group_offset
+        last = np.r_[starts[1:] - 1, count - 1]
+        self._level[grouped[last]] = levels[order][last]
+        prices = np.exp(levels) if self.model == "gbm" else levels
+        return prices, chosen
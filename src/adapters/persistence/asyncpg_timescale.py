@@ -0,0 +1,265 @@
+import asyncio
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from ...domain.events import FillEvent, OrderEvent, SignalEvent, TickEvent
+from ...domain.models import Bucket
+from ...infrastructure.clock import Clock, Scheduler, SystemClock
+from ...infrastructure.logging import get_logger
+from ...ports.persistence import PersistencePort
+
+logger = get_logger(__name__)
+
+Record = Tuple[Any, ...]
+
+# Columns written by COPY for each typed table; recorded_at is left to its default.
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "ticks": ("time", "symbol", "price"),
+    "signals": ("time", "symbol", "strategy_id", "side", "strength", "signal_id"),
+    "orders": ("time", "symbol", "side", "quantity", "price", "client_order_id"),
+    "fills": ("time", "symbol", "side", "quantity", "price", "client_order_id"),
+}
+
+TABLES: Dict[Type[Any], str] = {
+    TickEvent: "ticks",
+    SignalEvent: "signals",
+    OrderEvent: "orders",
+    FillEvent: "fills",
+}
+
+# Column summarized by ``downsample`` for each typed table.
+VALUE_COLUMNS: Dict[str, str] = {"ticks": "price", "signals": "strength", "orders": "price", "fills": "price"}
+
+_INSERT_EVENT = "INSERT INTO events (event_type, payload, valid_time) VALUES ($1, $2::jsonb, $3)"
+
+
+def _timestamp(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+def to_record(event: Any, now: float) -> Tuple[Optional[str], Record]:
+    """Map an event to its typed table and COPY record.
+
+    Events without a typed table map to ``None`` and an ``events`` row of
+    ``(event_type, payload_json, valid_time)``.
+    """
+
+    if isinstance(event, TickEvent):
+        return "ticks", (_timestamp(event.timestamp), event.symbol, event.price)
+    if isinstance(event, SignalEvent):
+        return "signals", (
+            _timestamp(event.timestamp),
+            event.symbol,
+            event.strategy_id,
+            event.side,
+            event.strength,
+            event.signal_id,
+        )
+    if isinstance(event, OrderEvent):
+        return "orders", (
+            _timestamp(now),
+            event.symbol,
+            event.side,
+            event.quantity,
+            event.price,
+            event.client_order_id,
+        )
+    if isinstance(event, FillEvent):
+        return "fills", (
+            _timestamp(now),
+            event.symbol,
+            event.side,
+            event.quantity,
+            event.price,
+            event.client_order_id,
+        )
+    payload = asdict(event) if is_dataclass(event) else {"value": event}
+    valid_time = payload.get("timestamp", now)
+    return None, (type(event).__name__, json.dumps(payload, default=str), _timestamp(valid_time))
+
+
+def from_record(table: str, row: Any) -> Any:
+    """Rebuild the event for a row selected as ``TABLE_COLUMNS[table]``."""
+
+    time = row[0].timestamp()
+    if table == "ticks":
+        return TickEvent(symbol=row[1], price=row[2], timestamp=time)
+    if table == "signals":
+        return SignalEvent(
+            symbol=row[1], strategy_id=row[2], timestamp=time, side=row[3], strength=row[4], signal_id=row[5]
+        )
+    factory: Callable[..., Any] = OrderEvent if table == "orders" else FillEvent
+    return factory(symbol=row[1], side=row[2], quantity=row[3], price=row[4], client_order_id=row[5])
+
+
+def _table(event_type: Type[Any]) -> str:
+    table = TABLES.get(event_type)
+    if table is None:
+        raise ValueError(f"No typed table for {event_type.__name__}")
+    return table
+
+
+class AsyncpgTimescaleRepository(PersistencePort):
+    """Timescale persistence over a pooled asyncpg connection.
+
+    ``persist_event`` only appends a record to an in-memory batch per
+    table. Batches are written with binary COPY (``copy_records_to_table``)
+    when they reach ``batch_size`` or every ``flush_interval`` seconds from
+    a background task; events without a typed table go to the JSONB
+    ``events`` table through a prepared ``executemany``. Once
+    ``max_pending`` records are buffered, callers wait for a flush instead
+    of growing the buffer. A batch that fails to write is logged, counted
+    in ``failed`` and dropped. asyncpg is imported on ``connect`` so the
+    dependency is only needed when this backend is selected;
+    ``pool_factory`` replaces ``asyncpg.create_pool`` (same arguments).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 2,
+        max_size: int = 10,
+        batch_size: int = 5_000,
+        flush_interval: float = 0.5,
+        max_pending: int = 200_000,
+        clock: Optional[Clock] = None,
+        scheduler: Optional[Scheduler] = None,
+        pool_factory: Optional[Callable[..., Awaitable[Any]]] = None,
+    ) -> None:
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.clock: Clock = clock if clock is not None else SystemClock()
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self.pool_factory = pool_factory
+        self.written = 0
+        self.failed = 0
+        self._pool: Any = None
+        self._pending: Dict[Optional[str], List[Record]] = {}
+        self._pending_count = 0
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task[None]] = None
+        self._inflight: Set[asyncio.Task[None]] = set()
+
+    async def connect(self) -> None:
+        if self._pool is not None:
+            return
+        create_pool = self.pool_factory
+        if create_pool is None:
+            try:
+                import asyncpg
+            except ImportError as exc:  # pragma: no cover - depends on the deployment image
+                raise RuntimeError("asyncpg is required for TIMESCALE_BACKEND=asyncpg") from exc
+            create_pool = asyncpg.create_pool
+        self._pool = await create_pool(self.dsn, min_size=self.min_size, max_size=self.max_size)
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._pool is None:
+            return
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+        await self.flush()
+        await self._pool.close()
+        self._pool = None
+
+    async def persist_event(self, event: Any) -> None:
+        self._require_pool()
+        table, record = to_record(event, self.clock.now())
+        batch = self._pending.get(table)
+        if batch is None:
+            batch = self._pending[table] = []
+        batch.append(record)
+        self._pending_count += 1
+        if self._pending_count >= self.max_pending:
+            await self.flush()
+        elif len(batch) >= self.batch_size:
+            task = asyncio.create_task(self.flush())
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def stream_events(
+        self,
+        event_type: Type[Any],
+        start: float,
+        end: float,
+        symbols: Optional[Sequence[str]] = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[List[Any]]:
+        table = _table(event_type)
+        self._require_pool()
+        query = f"SELECT {', '.join(TABLE_COLUMNS[table])} FROM {table} WHERE time >= $1 AND time < $2"
+        args: List[Any] = [_timestamp(start), _timestamp(end)]
+        if symbols is not None:
+            query += " AND symbol = ANY($3::text[])"
+            args.append(list(symbols))
+        query += " ORDER BY time"
+        async with self._pool.acquire() as connection:
+            async with connection.transaction(readonly=True):
+                cursor = await connection.cursor(query, *args)
+                while True:
+                    rows = await cursor.fetch(chunk_size)
+                    if not rows:
+                        return
+                    yield [from_record(table, row) for row in rows]
+
+    async def downsample(
+        self, event_type: Type[Any], symbol: str, start: float, end: float, interval: float
+    ) -> List[Bucket]:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        table = _table(event_type)
+        column = VALUE_COLUMNS[table]
+        self._require_pool()
+        query = (
+            f"SELECT time_bucket($1::interval, time, TIMESTAMPTZ 'epoch') AS bucket, "
+            f"first({column}, time), max({column}), min({column}), last({column}, time), count(*) "
+            f"FROM {table} WHERE symbol = $2 AND time >= $3 AND time < $4 AND {column} IS NOT NULL "
+            "GROUP BY bucket ORDER BY bucket"
+        )
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                query, timedelta(seconds=interval), symbol, _timestamp(start), _timestamp(end)
+            )
+        return [Bucket(symbol, row[0].timestamp(), row[1], row[2], row[3], row[4], row[5]) for row in rows]
+
+    def _require_pool(self) -> None:
+        if self._pool is None:
+            raise RuntimeError("AsyncpgTimescaleRepository.connect() must be awaited first")
+
+    async def flush(self) -> None:
+        """Write every buffered batch, one pooled connection per table."""
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+            if not pending:
+                return
+            await asyncio.gather(*(self._write(table, records) for table, records in pending.items()))
+
+    async def _write(self, table: Optional[str], records: List[Record]) -> None:
+        try:
+            async with self._pool.acquire() as connection:
+                if table is None:
+                    statement = await connection.prepare(_INSERT_EVENT)
+                    await statement.executemany(records)
+                else:
+                    await connection.copy_records_to_table(table, records=records, columns=TABLE_COLUMNS[table])
+        except Exception as exc:
+            self.failed += len(records)
+            logger.error("timescale_write_failed", table=table or "events", rows=len(records), error=str(exc))
+            return
+        self.written += len(records)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await self.scheduler.sleep(self.flush_interval)
+            await self.flush()
@@ -1,14 +1,122 @@
-from typing import Any, List
+import bisect
+import heapq
+import math
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type
 
+from ...domain.events import FillEvent, OrderEvent, SignalEvent, TickEvent
+from ...domain.models import Bucket
+from ...infrastructure.clock import Clock, SystemClock
 from ...ports.persistence import PersistencePort
 
+# Field summarized by ``downsample`` for each event type.
+VALUE_FIELDS: Dict[Type[Any], str] = {
+    TickEvent: "price",
+    SignalEvent: "strength",
+    OrderEvent: "price",
+    FillEvent: "price",
+}
+
+
+class _Series:
+    __slots__ = ("times", "events")
+
+    def __init__(self) -> None:
+        self.times: List[float] = []
+        self.events: List[Any] = []
+
+    def add(self, time: float, event: Any) -> None:
+        if not self.times or time >= self.times[-1]:
+            self.times.append(time)
+            self.events.append(event)
+        else:
+            index = bisect.bisect_right(self.times, time)
+            self.times.insert(index, time)
+            self.events.insert(index, event)
+
+    def window(self, start: float, end: float) -> Tuple[int, int]:
+        return bisect.bisect_left(self.times, start), bisect.bisect_left(self.times, end)
+
 
 class TimescaleRepository(PersistencePort):
-    """In-memory persistence stub mimicking Timescale writes."""
+    """In-memory persistence stub mimicking Timescale writes.
+
+    Events are also indexed per (event type, symbol) in time order, where
+    time is the event's ``timestamp`` or the clock time it was persisted,
+    so range reads and downsampling binary search instead of scanning.
+    """
 
-    def __init__(self, dsn: str) -> None:
+    def __init__(self, dsn: str, clock: Optional[Clock] = None) -> None:
         self.dsn = dsn
+        self.clock: Clock = clock if clock is not None else SystemClock()
         self.events: List[Any] = []
+        self._series: Dict[Type[Any], Dict[str, _Series]] = {}
 
     async def persist_event(self, event: Any) -> None:
         self.events.append(event)
+        symbol = getattr(event, "symbol", None)
+        if symbol is None:
+            return
+        time = getattr(event, "timestamp", None)
+        by_symbol = self._series.setdefault(type(event), {})
+        series = by_symbol.get(symbol)
+        if series is None:
+            series = by_symbol[symbol] = _Series()
+        series.add(time if time is not None else self.clock.now(), event)
+
+    async def stream_events(
+        self,
+        event_type: Type[Any],
+        start: float,
+        end: float,
+        symbols: Optional[Sequence[str]] = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[List[Any]]:
+        by_symbol = self._series.get(event_type, {})
+        selected = [by_symbol[s] for s in (symbols if symbols is not None else by_symbol) if s in by_symbol]
+        slices = []
+        for series in selected:
+            lo, hi = series.window(start, end)
+            if lo < hi:
+                slices.append(zip(series.times[lo:hi], series.events[lo:hi]))
+        merged = slices[0] if len(slices) == 1 else heapq.merge(*slices, key=lambda item: item[0])
+        chunk: List[Any] = []
+        for _, event in merged:
+            chunk.append(event)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def downsample(
+        self, event_type: Type[Any], symbol: str, start: float, end: float, interval: float
+    ) -> List[Bucket]:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        field = VALUE_FIELDS.get(event_type)
+        if field is None:
+            raise ValueError(f"Cannot downsample {event_type.__name__}")
+        series = self._series.get(event_type, {}).get(symbol)
+        if series is None:
+            return []
+        lo, hi = series.window(start, end)
+        buckets: List[Bucket] = []
+        current: Optional[float] = None
+        open_ = high = low = close = 0.0
+        count = 0
+        for time, event in zip(series.times[lo:hi], series.events[lo:hi]):
+            value = getattr(event, field)
+            if value is None:
+                continue
+            bucket = math.floor(time / interval) * interval
+            if bucket != current:
+                if current is not None:
+                    buckets.append(Bucket(symbol, current, open_, high, low, close, count))
+                current, open_, high, low, count = bucket, value, value, value, 0
+            high = max(high, value)
+            low = min(low, value)
+            close = value
+            count += 1
+        if current is not None:
+            buckets.append(Bucket(symbol, current, open_, high, low, close, count))
+        return buckets
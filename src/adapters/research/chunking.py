@@ -0,0 +1,64 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+TEXT_SUFFIXES = (".txt", ".md")
+SUPPORTED_SUFFIXES = (".pdf",) + TEXT_SUFFIXES
+
+_SYMBOL = re.compile(r"^([A-Z]{1,5})(?:[_\-. ]|$)")
+_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def extract_text(path: Path) -> str:
+    if path.suffix.lower() in TEXT_SUFFIXES:
+        return path.read_text(errors="replace")
+    try:
+        import fitz  # PyMuPDF
+    except ImportError as exc:  # pragma: no cover - depends on the deployment image
+        raise RuntimeError("PyMuPDF is required to ingest PDF files") from exc
+    with fitz.open(path) as document:
+        return "\n".join(page.get_text() for page in document)
+
+
+def chunk_words(text: str, size: int = 1000, overlap: int = 150) -> List[str]:
+    """Split text into windows of ``size`` whitespace tokens overlapping by ``overlap``."""
+
+    if overlap >= size:
+        raise ValueError("overlap must be smaller than size")
+    words = text.split()
+    if not words:
+        return []
+    step = size - overlap
+    return [" ".join(words[start : start + size]) for start in range(0, max(len(words) - overlap, 1), step)]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def filename_metadata(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Read ``(symbol, date)`` from names like ``AAPL_2024-05-01_note.pdf``."""
+
+    symbol = _SYMBOL.match(path.stem)
+    date = _DATE.search(path.stem)
+    return (symbol.group(1) if symbol else None, date.group(1) if date else None)
+
+
+def parse_document(path: str, size: int, overlap: int) -> Tuple[str, List[Tuple[str, str]]]:
+    """Extract and chunk one file; returns the file hash and ``(content_hash, text)`` per chunk.
+
+    Module-level so it can run in a process pool.
+    """
+
+    source = Path(path)
+    chunks = chunk_words(extract_text(source), size, overlap)
+    return file_hash(source), [(content_hash(chunk), chunk) for chunk in chunks]
@@ -0,0 +1,114 @@
+import zlib
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ...ports.research import EmbedderPort
+
+DTYPE = np.dtype("<f4")
+
+
+class HashingEmbedder(EmbedderPort):
+    """Deterministic offline embedder based on signed feature hashing.
+
+    Each lower-cased token adds +/-1 to a bucket chosen by its CRC32, and
+    rows are L2-normalized, so texts sharing vocabulary have high cosine
+    similarity. Useful for tests, benchmarks and offline runs; it carries
+    no semantics beyond word overlap.
+    """
+
+    def __init__(self, dimension: int = 384) -> None:
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return self.embed_sync(texts)
+
+    def embed_sync(self, texts: Sequence[str]) -> np.ndarray:
+        dimension = self.dimension
+        tokenized = [text.lower().split() for text in texts]
+        # Hash each distinct token once per batch; vocabulary repeats heavily.
+        vocabulary = {token: zlib.crc32(token.encode()) for token in set().union(*tokenized)}
+        lengths = np.fromiter(map(len, tokenized), dtype=np.int64, count=len(tokenized))
+        hashes = np.fromiter(
+            map(vocabulary.__getitem__, chain.from_iterable(tokenized)), dtype=np.int64, count=int(lengths.sum())
+        )
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        signs = np.where(hashes & (1 << 31), -1.0, 1.0)
+        flat = np.bincount(rows * dimension + hashes % dimension, weights=signs, minlength=len(texts) * dimension)
+        vectors = flat.reshape(len(texts), dimension).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class EmbeddingCache:
+    """On-disk map from chunk content hash to embedding vector.
+
+    Vectors are appended to one raw float32 file and their hashes to a
+    parallel key file, so a cache of any size loads with one read of the
+    keys and a memory map of the vectors. Vectors are written before keys;
+    on load any rows without both are ignored and overwritten.
+    """
+
+    def __init__(self, root: Union[str, Path], dimension: int) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dimension = dimension
+        self._vectors_path = self.root / "vectors.f32"
+        self._keys_path = self.root / "keys.txt"
+        text = self._keys_path.read_text() if self._keys_path.exists() else ""
+        keys = text.split()
+        row_bytes = dimension * DTYPE.itemsize
+        size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        self._keys: List[str] = keys[: min(len(keys), size // row_bytes)]
+        self._rows: Dict[str, int] = {key: row for row, key in enumerate(self._keys)}
+        self._map: Union[np.ndarray, None] = None
+        # Only repair files left behind by an interrupted append; a clean cache opens read-only.
+        if size != len(self._keys) * row_bytes:
+            with open(self._vectors_path, "r+b") as handle:
+                handle.truncate(len(self._keys) * row_bytes)
+        expected = "".join(f"{key}\n" for key in self._keys)
+        if text != expected:
+            with open(self._keys_path, "w") as handle:
+                handle.write(expected)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._rows
+
+    def get_many(self, hashes: Sequence[str]) -> np.ndarray:
+        """Return vectors for hashes that must all be cached, in order."""
+
+        rows = [self._rows[content_hash] for content_hash in hashes]
+        if not rows:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.asarray(self._vectors()[rows], dtype=np.float32)
+
+    def put_many(self, hashes: Sequence[str], vectors: np.ndarray) -> None:
+        new: List[Tuple[int, str]] = []
+        seen: Set[str] = set()
+        for idx, content_hash in enumerate(hashes):
+            if content_hash not in self._rows and content_hash not in seen:
+                seen.add(content_hash)
+                new.append((idx, content_hash))
+        if not new:
+            return
+        block = np.ascontiguousarray(vectors[[idx for idx, _ in new]], dtype=DTYPE)
+        with open(self._vectors_path, "ab") as handle:
+            handle.write(block.tobytes())
+        with open(self._keys_path, "a") as handle:
+            handle.write("".join(f"{content_hash}\n" for _, content_hash in new))
+        for _, content_hash in new:
+            self._rows[content_hash] = len(self._keys)
+            self._keys.append(content_hash)
+        self._map = None
+
+    def _vectors(self) -> np.ndarray:
+        if self._map is None:
+            self._map = np.memmap(self._vectors_path, dtype=DTYPE, mode="r", shape=(len(self._keys), self.dimension))
+        return self._map
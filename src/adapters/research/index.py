@@ -0,0 +1,396 @@
+import json
+import math
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+VECTOR_DTYPE = np.dtype("<f4")
+INT_DTYPE = np.dtype("<i4")
+NO_VALUE = -1
+# Exact scoring walks the vectors in blocks of this many rows.
+_BLOCK = 65_536
+
+Hit = Tuple[str, float]
+
+
+class FlatIndex:
+    """Exact cosine-similarity index over memory-mapped float32 vectors.
+
+    Rows are append-only: vectors go to ``vectors.f32`` and per-row
+    metadata (symbol code, date ordinal, liveness) to parallel raw files,
+    with ids written last so a row counts only once every file has it.
+    Removing an id marks its row dead. Vectors are expected to be
+    L2-normalized, so inner product is cosine similarity. Searches can be
+    restricted to a set of symbols and an inclusive date range; rows
+    without a date never match a date filter.
+    """
+
+    _COLUMNS = ("symbols", "dates", "alive")
+
+    def __init__(self, root: Union[str, Path], dimension: int) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dimension = dimension
+        meta = self._read_meta()
+        if meta.get("dimension", dimension) != dimension:
+            raise ValueError(f"Index at {self.root} has dimension {meta['dimension']}, not {dimension}")
+        self._symbol_names: List[str] = meta.get("symbols", [])
+        self._symbol_codes: Dict[str, int] = {name: code for code, name in enumerate(self._symbol_names)}
+        ids_path = self.root / "ids.txt"
+        ids = ids_path.read_text().splitlines() if ids_path.exists() else []
+        count = min(
+            [len(ids), self._file_rows("vectors.f32", dimension * VECTOR_DTYPE.itemsize)]
+            + [self._file_rows(name, size) for name, size in self._row_files()]
+        )
+        self._ids: List[str] = ids[:count]
+        self._truncate(count)
+        self._symbols = self._load("symbols", INT_DTYPE, count)
+        self._dates = self._load("dates", INT_DTYPE, count)
+        self._alive = self._load("alive", np.dtype("u1"), count).astype(bool)
+        self._rows: Dict[str, int] = {
+            row_id: row for row, row_id in enumerate(self._ids) if self._alive[row]
+        }
+        self._map: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def rows(self) -> int:
+        return len(self._ids)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        symbols: Optional[Sequence[Optional[str]]] = None,
+        dates: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """Append rows; an id that is already present is replaced."""
+
+        count = len(ids)
+        if not count:
+            return
+        vectors = np.ascontiguousarray(vectors, dtype=VECTOR_DTYPE).reshape(count, self.dimension)
+        symbol_codes = np.array(
+            [self._symbol_code(symbol) for symbol in (symbols or [None] * count)], dtype=INT_DTYPE
+        )
+        date_ordinals = np.array(
+            [date.fromisoformat(day).toordinal() if day else NO_VALUE for day in (dates or [None] * count)],
+            dtype=INT_DTYPE,
+        )
+        self.remove([row_id for row_id in ids if row_id in self._rows])
+        start = len(self._ids)
+        self._append("vectors.f32", vectors)
+        self._append("symbols.i32", symbol_codes)
+        self._append("dates.i32", date_ordinals)
+        self._append("alive.u1", np.ones(count, dtype="u1"))
+        self._append_columns(vectors, start)
+        with open(self.root / "ids.txt", "a") as handle:
+            handle.write("".join(f"{row_id}\n" for row_id in ids))
+        self._ids.extend(ids)
+        self._symbols = np.concatenate([self._symbols, symbol_codes])
+        self._dates = np.concatenate([self._dates, date_ordinals])
+        self._alive = np.concatenate([self._alive, np.ones(count, dtype=bool)])
+        for offset, row_id in enumerate(ids):
+            self._rows[row_id] = start + offset
+        self._map = None
+        self._write_meta()
+
+    def remove(self, ids: Sequence[str]) -> None:
+        rows = [self._rows.pop(row_id) for row_id in ids if row_id in self._rows]
+        if not rows:
+            return
+        self._alive[rows] = False
+        with open(self.root / "alive.u1", "r+b") as handle:
+            for row in rows:
+                handle.seek(row)
+                handle.write(b"\x00")
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int = 5,
+        symbols: Optional[Sequence[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[Hit]:
+        """Return up to ``top_k`` ``(id, score)`` pairs by descending similarity."""
+
+        mask = self._mask(symbols, start, end)
+        if mask is None:
+            return []
+        return self._exact(np.asarray(query, dtype=VECTOR_DTYPE), top_k, mask)
+
+    def _exact(self, query: np.ndarray, top_k: int, mask: np.ndarray) -> List[Hit]:
+        selected = np.flatnonzero(mask)
+        if len(selected) * 4 <= len(mask):
+            # Selective filters: gather the matching rows instead of scanning all of them.
+            return self._score(selected, query, top_k)
+        vectors = self._vectors()
+        best_rows: List[np.ndarray] = []
+        best_scores: List[np.ndarray] = []
+        for begin in range(0, len(self._ids), _BLOCK):
+            block_mask = mask[begin : begin + _BLOCK]
+            if not block_mask.any():
+                continue
+            scores = vectors[begin : begin + _BLOCK] @ query
+            scores[~block_mask] = -np.inf
+            keep = min(top_k, int(block_mask.sum()))
+            top = np.argpartition(-scores, keep - 1)[:keep]
+            best_rows.append(top + begin)
+            best_scores.append(scores[top])
+        if not best_rows:
+            return []
+        return self._top(np.concatenate(best_rows), np.concatenate(best_scores), top_k)
+
+    def _score(self, rows: np.ndarray, query: np.ndarray, top_k: int) -> List[Hit]:
+        if not len(rows):
+            return []
+        vectors = self._vectors()
+        scores = np.concatenate(
+            [vectors[rows[begin : begin + _BLOCK]] @ query for begin in range(0, len(rows), _BLOCK)]
+        )
+        return self._top(rows, scores, top_k)
+
+    def _top(self, rows: np.ndarray, scores: np.ndarray, top_k: int) -> List[Hit]:
+        if len(rows) > top_k:
+            keep = np.argpartition(-scores, top_k - 1)[:top_k]
+            rows, scores = rows[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")
+        return [(self._ids[row], float(score)) for row, score in zip(rows[order].tolist(), scores[order].tolist())]
+
+    def _mask(
+        self, symbols: Optional[Sequence[str]], start: Optional[date], end: Optional[date]
+    ) -> Optional[np.ndarray]:
+        mask = self._alive.copy()
+        if symbols is not None:
+            codes = [self._symbol_codes[symbol] for symbol in symbols if symbol in self._symbol_codes]
+            if not codes:
+                return None
+            mask &= np.isin(self._symbols, codes)
+        if start is not None:
+            mask &= self._dates >= start.toordinal()
+        if end is not None:
+            mask &= (self._dates <= end.toordinal()) & (self._dates != NO_VALUE)
+        return mask if mask.any() else None
+
+    def _append_columns(self, vectors: np.ndarray, start: int) -> None:
+        """Hook for subclasses that keep extra per-row files."""
+
+    def _row_files(self) -> List[Tuple[str, int]]:
+        return [("symbols.i32", 4), ("dates.i32", 4), ("alive.u1", 1)]
+
+    def _symbol_code(self, symbol: Optional[str]) -> int:
+        if symbol is None:
+            return NO_VALUE
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = self._symbol_codes[symbol] = len(self._symbol_names)
+            self._symbol_names.append(symbol)
+        return code
+
+    def _vectors(self) -> np.ndarray:
+        if self._map is None:
+            self._map = np.memmap(
+                self.root / "vectors.f32", dtype=VECTOR_DTYPE, mode="r", shape=(len(self._ids), self.dimension)
+            )
+        return self._map
+
+    def _append(self, name: str, array: np.ndarray) -> None:
+        with open(self.root / name, "ab") as handle:
+            handle.write(array.tobytes())
+
+    def _load(self, column: str, dtype: np.dtype, count: int) -> np.ndarray:
+        name = next(name for name, _ in self._row_files() if name.startswith(column))
+        path = self.root / name
+        if not count:
+            return np.empty(0, dtype=dtype)
+        return np.fromfile(path, dtype=dtype, count=count)
+
+    def _file_rows(self, name: str, row_bytes: int) -> int:
+        path = self.root / name
+        return path.stat().st_size // row_bytes if path.exists() else 0
+
+    def _truncate(self, count: int) -> None:
+        files = [("vectors.f32", self.dimension * VECTOR_DTYPE.itemsize), *self._row_files()]
+        for name, row_bytes in files:
+            path = self.root / name
+            if path.exists() and path.stat().st_size != count * row_bytes:
+                os.truncate(path, count * row_bytes)
+        ids_path = self.root / "ids.txt"
+        if ids_path.exists():
+            ids_path.write_text("".join(f"{row_id}\n" for row_id in self._ids))
+
+    def _read_meta(self) -> Dict:
+        path = self.root / "meta.json"
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    def _write_meta(self) -> None:
+        path = self.root / "meta.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._meta()))
+        os.replace(tmp, path)
+
+    def _meta(self) -> Dict:
+        return {"dimension": self.dimension, "symbols": self._symbol_names}
+
+
+class IVFIndex(FlatIndex):
+    """Inverted-file approximate index layered on FlatIndex storage.
+
+    Below ``min_train`` rows searches stay exact. The ``add`` that brings
+    the index to it runs spherical k-means over a sample of the rows to
+    pick ``n_lists`` centroids (``4 * sqrt(rows)`` by default), so queries
+    never pay for training; every row, including later inserts, is
+    assigned to its nearest centroid. A query scores the ``n_probe``
+    closest centroids and then only the rows in those lists; more probes
+    trade latency for recall. Call ``train`` to retrain after heavy growth.
+    Training commits its centroids and list assignments through temporary
+    files, and opening the index finishes or discards an interrupted
+    commit, so the two always match.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        dimension: int,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        min_train: int = 20_000,
+        seed: int = 0,
+    ) -> None:
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train = min_train
+        self.seed = seed
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._recover_training(Path(root))
+        super().__init__(root, dimension)
+        self._assignments = self._load("lists", INT_DTYPE, len(self._ids))
+        centroids = self.root / "centroids.npy"
+        if centroids.exists():
+            self._centroids = np.load(centroids)
+            unassigned = np.flatnonzero(self._assignments == NO_VALUE)
+            if len(unassigned):
+                # Rows added before the centroids were committed: assign them now.
+                self._assignments[unassigned] = self._nearest(self._vectors()[unassigned], self._centroids)
+                self._assignments.tofile(self.root / "lists.i32.tmp")
+                os.replace(self.root / "lists.i32.tmp", self.root / "lists.i32")
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        symbols: Optional[Sequence[Optional[str]]] = None,
+        dates: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        super().add(ids, vectors, symbols, dates)
+        if self._centroids is None and len(self._ids) >= self.min_train:
+            self.train()
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def train(self, iterations: int = 10, sample: int = 64) -> None:
+        """Fit centroids on up to ``sample`` rows per list and reassign every row."""
+
+        rows = len(self._ids)
+        if not rows:
+            return
+        n_lists = self.n_lists or max(1, int(4 * math.sqrt(rows)))
+        n_lists = min(n_lists, rows)
+        rng = np.random.default_rng(self.seed)
+        vectors = self._vectors()
+        chosen = np.sort(rng.choice(rows, size=min(rows, n_lists * sample), replace=False))
+        training = np.asarray(vectors[chosen], dtype=VECTOR_DTYPE)
+        centroids = training[rng.choice(len(training), size=n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assigned = self._nearest(training, centroids)
+            order = np.argsort(assigned, kind="stable")
+            lists, starts = np.unique(assigned[order], return_index=True)
+            sums = centroids.copy()
+            sums[lists] = np.add.reduceat(training[order], starts, axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(VECTOR_DTYPE)
+        assignments = self._nearest(vectors, centroids)
+        # Both files are staged first; centroids.npy is the commit point that _recover_training rolls forward from.
+        assignments.tofile(self.root / "lists.i32.tmp")
+        np.save(self.root / "centroids.tmp.npy", centroids)
+        os.replace(self.root / "centroids.tmp.npy", self.root / "centroids.npy")
+        os.replace(self.root / "lists.i32.tmp", self.root / "lists.i32")
+        self._centroids = centroids
+        self._assignments = assignments
+        self._lists = None
+        self._inverted_lists()
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int = 5,
+        symbols: Optional[Sequence[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        n_probe: Optional[int] = None,
+    ) -> List[Hit]:
+        mask = self._mask(symbols, start, end)
+        if mask is None:
+            return []
+        query = np.asarray(query, dtype=VECTOR_DTYPE)
+        if self._centroids is None:
+            return self._exact(query, top_k, mask)
+        selected = int(mask.sum())
+        lists = len(self._centroids)
+        # A filter keeps only a fraction of each list, so probe proportionally more lists.
+        probes = min(lists, math.ceil((n_probe or self.n_probe) * len(self._rows) / selected))
+        if selected <= probes * len(self._ids) / lists:
+            return self._score(np.flatnonzero(mask), query, top_k)
+        nearest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+        order, bounds = self._inverted_lists()
+        candidates = np.concatenate([order[bounds[idx] : bounds[idx + 1]] for idx in nearest])
+        return self._score(np.sort(candidates[mask[candidates]]), query, top_k)
+
+    @staticmethod
+    def _recover_training(root: Path) -> None:
+        staged_lists, staged_centroids = root / "lists.i32.tmp", root / "centroids.tmp.npy"
+        if staged_centroids.exists():
+            # Interrupted before the commit point: the previous training stays in effect.
+            staged_centroids.unlink()
+            staged_lists.unlink(missing_ok=True)
+        elif staged_lists.exists():
+            os.replace(staged_lists, root / "lists.i32")
+
+    def _inverted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._lists is None:
+            assert self._centroids is not None
+            order = np.argsort(self._assignments, kind="stable")
+            bounds = np.searchsorted(self._assignments[order], np.arange(len(self._centroids) + 1))
+            self._lists = (order, bounds)
+        return self._lists
+
+    def _append_columns(self, vectors: np.ndarray, start: int) -> None:
+        if self._centroids is None:
+            assigned = np.full(len(vectors), NO_VALUE, dtype=INT_DTYPE)
+        else:
+            assigned = self._nearest(vectors, self._centroids)
+        self._append("lists.i32", assigned)
+        self._assignments = np.concatenate([self._assignments, assigned])
+        self._lists = None
+
+    def _row_files(self) -> List[Tuple[str, int]]:
+        return [*super()._row_files(), ("lists.i32", 4)]
+
+    @staticmethod
+    def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        # Bound the (rows x lists) score matrix to about 64 MB.
+        step = max(1, (1 << 24) // len(centroids))
+        nearest = np.empty(len(vectors), dtype=INT_DTYPE)
+        for begin in range(0, len(vectors), step):
+            nearest[begin : begin + step] = np.argmax(np.asarray(vectors[begin : begin + step]) @ centroids.T, axis=1)
+        return nearest
@@ -0,0 +1,342 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from ...infrastructure.logging import get_logger
+from ...ports.research import Chunk, EmbedderPort, IngestResult, QueryHit, QueryResult, ResearchPort
+from .chunking import SUPPORTED_SUFFIXES, content_hash, filename_metadata, parse_document
+from .embedding import EmbeddingCache
+from .index import FlatIndex, IVFIndex
+
+logger = get_logger(__name__)
+
+MANIFEST = "manifest.json"
+Metadata = Callable[[Path], Tuple[Optional[str], Optional[str]]]
+Parsed = Tuple[str, List[Tuple[str, str]]]
+IndexFactory = Callable[[Path, int], FlatIndex]
+
+
+class _LRU:
+    """Small least-recently-used map."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.capacity <= 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class LocalResearch(ResearchPort):
+    """Research corpus stored under ``root`` with a parallel ingest pipeline.
+
+    Files are parsed and chunked (``chunk_size`` words overlapping by
+    ``chunk_overlap``) in a process pool of ``workers`` processes. A
+    manifest records each file's size, mtime and content hash: files whose
+    size and mtime are unchanged are skipped without being opened, and
+    files whose content hash is unchanged are not re-chunked. Chunks are
+    embedded in batches of ``embed_batch`` through ``embedder``, and only
+    chunks whose content hash is missing from the on-disk embedding cache
+    are sent, so re-ingesting an unchanged corpus embeds nothing.
+    ``metadata`` maps a path to its ``(symbol, date)``; by default they are
+    read from file names like ``AAPL_2024-05-01_note.pdf``.
+
+    Embedded chunks are added to the index that ``index`` builds from a
+    directory under ``root/index`` and the embedding dimension (an
+    IVFIndex by default) as they are ingested, and a changed file's old
+    chunks are removed from it. ``query`` keeps the embeddings of the
+    last ``query_cache`` questions and their results in LRU caches; the
+    result cache is cleared whenever an ingest changes the corpus.
+
+    Nothing under ``root`` is read or written until ``open``, which the
+    first ingest or query calls.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        embedder: EmbedderPort,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 150,
+        workers: Optional[int] = None,
+        embed_batch: int = 256,
+        metadata: Metadata = filename_metadata,
+        index: IndexFactory = IVFIndex,
+        query_cache: int = 256,
+    ) -> None:
+        self.root = Path(root)
+        self.embedder = embedder
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.embed_batch = embed_batch
+        self.metadata = metadata
+        self.index_factory = index
+        self._documents = self.root / "documents"
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._cache: Optional[EmbeddingCache] = None
+        self._vector_index: Optional[FlatIndex] = None
+        self._query_vectors = _LRU(query_cache)
+        self._results = _LRU(query_cache)
+        self._queries = _LRU(query_cache)
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self.open()._cache  # type: ignore[return-value]
+
+    @property
+    def index(self) -> FlatIndex:
+        return self.open()._vector_index  # type: ignore[return-value]
+
+    def open(self) -> "LocalResearch":
+        """Create the store, load the manifest, embedding cache and index, and backfill the index if empty."""
+
+        if self._vector_index is not None:
+            return self
+        self._documents.mkdir(parents=True, exist_ok=True)
+        manifest = self.root / MANIFEST
+        self._manifest = json.loads(manifest.read_text()) if manifest.exists() else {}
+        self._cache = EmbeddingCache(self.root / "embeddings" / self.embedder.name, self.embedder.dimension)
+        self._vector_index = self.index_factory(self.root / "index" / self.embedder.name, self.embedder.dimension)
+        if not self._vector_index.rows and self._manifest:
+            # Corpus ingested before it had an index, or with another embedder.
+            for key in self._manifest:
+                self._index([chunk for chunk in self._read_document(key) if chunk.content_hash in self._cache])
+        return self
+
+    async def ingest(self, paths: Iterable[Union[str, Path]]) -> IngestResult:
+        started = time.perf_counter()
+        self.open()
+        pending: List[Tuple[Path, os.stat_result]] = []
+        skipped = 0
+        for path in self._expand(paths):
+            stat = path.stat()
+            entry = self._manifest.get(str(path))
+            if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                skipped += 1
+                continue
+            pending.append((path, stat))
+
+        documents = failed = chunks = cached = embedded = 0
+        seen: Set[str] = set()
+        batch: Dict[str, str] = {}
+        indexed: List[Chunk] = []
+        # Embed while later files are still being parsed in the pool.
+        async for (path, stat), parsed in self._parse(pending):
+            if parsed is None:
+                failed += 1
+                continue
+            digest, pairs = parsed
+            key = str(path)
+            previous = self._manifest.get(key)
+            self._manifest[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+            if previous is not None and previous["hash"] == digest:
+                skipped += 1
+                continue
+            documents += 1
+            chunks += len(pairs)
+            symbol, day = self.metadata(path)
+            if previous is not None:
+                self.index.remove([self._chunk_id(chunk) for chunk in self._read_document(key)])
+            document = [Chunk(chunk_hash, key, idx, text, symbol, day) for idx, (chunk_hash, text) in enumerate(pairs)]
+            self._write_document(key, document)
+            indexed.extend(document)
+            for chunk_hash, text in pairs:
+                if chunk_hash in seen:
+                    continue
+                seen.add(chunk_hash)
+                if chunk_hash in self.cache:
+                    cached += 1
+                else:
+                    batch[chunk_hash] = text
+            if len(batch) >= self.embed_batch:
+                embedded += await self._embed(batch)
+                batch = {}
+                self._index(indexed)
+                indexed = []
+        embedded += await self._embed(batch)
+        self._index(indexed)
+        self._write_manifest()
+        if documents:
+            self._results.clear()
+
+        result = IngestResult(
+            documents=documents,
+            skipped=skipped,
+            failed=failed,
+            chunks=chunks,
+            embedded=embedded,
+            cached=cached,
+            seconds=time.perf_counter() - started,
+        )
+        logger.info("research_ingest", **asdict(result))
+        return result
+
+    async def query(
+        self,
+        question: str,
+        top_k: int = 5,
+        symbols: Optional[Sequence[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> QueryResult:
+        started = time.perf_counter()
+        key = (question, top_k, tuple(symbols) if symbols is not None else None, start, end)
+        hits = self._results.get(key)
+        cached = hits is not None
+        if hits is None:
+            vector = self._query_vectors.get(question)
+            if vector is None:
+                vector = (await self.embedder.embed([question]))[0]
+                self._query_vectors.put(question, vector)
+            hits = self._resolve(self.index.search(vector, top_k, symbols, start, end))
+            self._results.put(key, hits)
+        result = QueryResult(
+            query_id=uuid.uuid4().hex,
+            question=question,
+            hits=hits,
+            seconds=time.perf_counter() - started,
+            cached=cached,
+        )
+        self._queries.put(result.query_id, result)
+        logger.info("research_query", query_id=result.query_id, hits=len(hits), cached=cached, seconds=result.seconds)
+        return result
+
+    async def rate(self, query_id: str, rating: int) -> None:
+        if not 1 <= rating <= 5:
+            raise ValueError("rating must be between 1 and 5")
+        result = self._queries.get(query_id)
+        if result is None:
+            raise KeyError(f"Unknown or expired query: {query_id}")
+        record = {
+            "query_id": query_id,
+            "question": result.question,
+            "rating": rating,
+            "hits": [self._chunk_id(hit.chunk) for hit in result.hits],
+            "timestamp": time.time(),
+        }
+        with open(self.root / "ratings.jsonl", "a") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+    def chunks(self, path: Union[str, Path]) -> List[Chunk]:
+        """Return the stored chunks of an ingested file."""
+
+        key = str(Path(path).resolve())
+        if key not in self.open()._manifest:
+            return []
+        return self._read_document(key)
+
+    def _expand(self, paths: Iterable[Union[str, Path]]) -> List[Path]:
+        files: List[Path] = []
+        for path in map(Path, paths):
+            if path.is_dir():
+                files.extend(
+                    sorted(child for child in path.rglob("*") if child.suffix.lower() in SUPPORTED_SUFFIXES)
+                )
+            else:
+                files.append(path)
+        return [path.resolve() for path in files]
+
+    async def _parse(
+        self, pending: List[Tuple[Path, os.stat_result]]
+    ) -> AsyncIterator[Tuple[Tuple[Path, os.stat_result], Optional[Parsed]]]:
+        """Yield each pending file with its parse result as soon as it is ready; None on failure."""
+
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+        executor: Optional[Executor] = None
+        if self.workers > 1 and len(pending) > 1:
+            # Spawned workers do not inherit the parent's threads or locks.
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, len(pending)), mp_context=multiprocessing.get_context("spawn")
+            )
+
+        async def parse(item: Tuple[Path, os.stat_result]) -> Tuple[Tuple[Path, os.stat_result], Optional[Parsed]]:
+            try:
+                return item, await loop.run_in_executor(
+                    executor, parse_document, str(item[0]), self.chunk_size, self.chunk_overlap
+                )
+            except Exception as exc:
+                logger.error("research_parse_failed", path=str(item[0]), error=str(exc))
+                return item, None
+
+        try:
+            for next_done in asyncio.as_completed([parse(item) for item in pending]):
+                yield await next_done
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    async def _embed(self, texts: Dict[str, str]) -> int:
+        if not texts:
+            return 0
+        hashes = list(texts)
+        vectors = await self.embedder.embed([texts[content_hash] for content_hash in hashes])
+        self.cache.put_many(hashes, vectors)
+        return len(hashes)
+
+    def _index(self, chunks: List[Chunk]) -> None:
+        if not chunks:
+            return
+        self.index.add(
+            [self._chunk_id(chunk) for chunk in chunks],
+            self.cache.get_many([chunk.content_hash for chunk in chunks]),
+            [chunk.symbol for chunk in chunks],
+            [chunk.date for chunk in chunks],
+        )
+
+    def _resolve(self, matches: List[Tuple[str, float]]) -> Tuple[QueryHit, ...]:
+        documents: Dict[str, List[Chunk]] = {}
+        hits: List[QueryHit] = []
+        for chunk_id, score in matches:
+            source, _, idx = chunk_id.rpartition("#")
+            if source not in documents:
+                documents[source] = self._read_document(source)
+            document = documents[source]
+            if int(idx) < len(document):
+                hits.append(QueryHit(document[int(idx)], score))
+        return tuple(hits)
+
+    @staticmethod
+    def _chunk_id(chunk: Chunk) -> str:
+        return f"{chunk.source}#{chunk.index}"
+
+    def _document_path(self, key: str) -> Path:
+        return self._documents / f"{content_hash(key)}.json"
+
+    def _write_document(self, key: str, chunks: List[Chunk]) -> None:
+        self._document_path(key).write_text(json.dumps([asdict(chunk) for chunk in chunks]))
+
+    def _read_document(self, key: str) -> List[Chunk]:
+        path = self._document_path(key)
+        return [Chunk(**item) for item in json.loads(path.read_text())] if path.exists() else []
+
+    def _write_manifest(self) -> None:
+        path = self.root / MANIFEST
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._manifest))
+        os.replace(tmp, path)
@@ -1,14 +1,17 @@
 import asyncio
 from collections import defaultdict
-from typing import Any, Awaitable, Callable, DefaultDict, List, Type
+from typing import Any, Awaitable, Callable, DefaultDict, List, Optional, Type
+
+from ..infrastructure.profiling import HandlerProfiler
 
 
 class EventBus:
     """Async event bus for pub/sub communication."""
 
-    def __init__(self) -> None:
+    def __init__(self, profiler: Optional[HandlerProfiler] = None) -> None:
         self._handlers: DefaultDict[Type[Any], List[Callable[[Any], Awaitable[None]]]] = defaultdict(list)
         self._lock = asyncio.Lock()
+        self.profiler = profiler
 
     async def subscribe(self, event_type: Type[Any], handler: Callable[[Any], Awaitable[None]]) -> None:
         async with self._lock:
@@ -17,4 +20,4 @@ class EventBus:
     async def publish(self, event: Any) -> None:
         handlers = list(self._handlers[type(event)])
         for handler in handlers:
-            await handler(event)
+            await HandlerProfiler.dispatch(self.profiler, handler, event)
@@ -0,0 +1,280 @@
+"""Cold-path services (persistence, news, fundamentals, logging) and the process that can host them."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from typing import Any, Callable, Mapping, MutableMapping, Optional, Sequence
+
+from ..infrastructure.clock import Scheduler
+from ..infrastructure.event_codec import decode, encode
+from ..infrastructure.logging import AsyncLogSink, configure_async_logging, get_logger
+from ..infrastructure.shm_ring import SharedRing
+from ..ports.fundamentals import FundamentalsPort
+from ..ports.news import NewsPort
+from ..ports.persistence import EventSinkPort
+
+logger = get_logger(__name__)
+
+
+class ColdPathService:
+    """Everything the trading loop hands off and never waits for.
+
+    ``handle`` persists domain events and forwards log event dicts to
+    ``log_sink``; ``run_polls`` fetches news and fundamentals for
+    ``symbols`` every ``poll_interval`` seconds. The same service runs
+    in-process in single mode and inside ColdPathProcess in split mode.
+    """
+
+    def __init__(
+        self,
+        persistence: EventSinkPort,
+        news: Optional[NewsPort] = None,
+        fundamentals: Optional[FundamentalsPort] = None,
+        symbols: Sequence[str] = (),
+        poll_interval: float = 60.0,
+        log_sink: Optional[AsyncLogSink] = None,
+    ) -> None:
+        self.persistence = persistence
+        self.news = news
+        self.fundamentals = fundamentals
+        self.symbols = list(symbols)
+        self.poll_interval = poll_interval
+        self.log_sink = log_sink
+        self.handled = 0
+
+    async def start(self) -> None:
+        await self.persistence.connect()
+
+    async def close(self) -> None:
+        await self.persistence.close()
+
+    async def handle(self, item: Any) -> None:
+        self.handled += 1
+        if isinstance(item, dict):
+            if self.log_sink is not None:
+                self.log_sink.submit(item)
+            return
+        await self.persistence.persist_event(item)
+
+    async def run_polls(self) -> None:
+        if not self.symbols or (self.news is None and self.fundamentals is None):
+            return
+        while True:
+            for symbol in self.symbols:
+                try:
+                    if self.news is not None:
+                        headlines = await self.news.fetch_headlines(symbol)
+                        logger.info("news_headlines", symbol=symbol, count=len(headlines))
+                    if self.fundamentals is not None:
+                        ratios = await self.fundamentals.fetch_ratios(symbol)
+                        logger.info("fundamentals_ratios", symbol=symbol, ratios=ratios)
+                except Exception as exc:
+                    logger.error("cold_poll_failed", symbol=symbol, error=str(exc))
+            await asyncio.sleep(self.poll_interval)
+
+
+def build_cold_path_service(log_sink: Optional[AsyncLogSink] = None) -> ColdPathService:
+    """Default ColdPathProcess factory: cold-path adapters from the environment's settings."""
+
+    from .. import config
+
+    settings = config.load_settings()
+    components = config.build_cold_components(settings)
+    return ColdPathService(
+        persistence=components["persistence"],
+        news=components["news"],
+        fundamentals=components["fundamentals"],
+        symbols=settings.deployment.cold_symbols,
+        poll_interval=settings.deployment.cold_poll_interval,
+        log_sink=log_sink,
+    )
+
+
+ServiceFactory = Callable[[Optional[AsyncLogSink]], ColdPathService]
+
+
+class ColdPathProcess:
+    """Runs a ColdPathService in a child process fed through a SharedRing.
+
+    The hot process only ever calls ``publish``, which encodes the item and
+    writes it to the ring without blocking; if the child has fallen a full
+    ring behind, the item is dropped and counted in ``dropped``. Neither
+    drops nor the child exiting interrupt the hot path: ``monitor`` polls
+    ``check`` every few seconds, which logs ``cold_path_dropped`` and
+    ``cold_path_died`` so they are still visible. ``factory``
+    must be a module-level function (it is pickled into a spawned child)
+    that builds the service from a log sink. ``sample_every`` and
+    ``rate_limits`` configure that sink as in configure_async_logging, so
+    forwarded events are thinned in the child. The child drains the ring in
+    batches, sleeping ``idle_sleep`` seconds whenever it is empty.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 8 << 20,
+        factory: ServiceFactory = build_cold_path_service,
+        idle_sleep: float = 0.001,
+        sample_every: Optional[Mapping[str, int]] = None,
+        rate_limits: Optional[Mapping[str, float]] = None,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.factory = factory
+        self.idle_sleep = idle_sleep
+        self.sample_every = dict(sample_every or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self._ring: Optional[SharedRing] = None
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._reported_drops = 0
+        self._died = False
+
+    @property
+    def dropped(self) -> int:
+        return self._ring.dropped if self._ring is not None else 0
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> "ColdPathProcess":
+        if self._process is None:
+            self._ring = SharedRing.create(self.capacity)
+            # Spawned, not forked, so the child starts without the hot process's heap.
+            context = multiprocessing.get_context("spawn")
+            self._process = context.Process(
+                target=_run_child,
+                args=(self._ring.name, self.factory, self.idle_sleep, self.sample_every, self.rate_limits),
+                name="cold-path",
+                daemon=True,
+            )
+            self._process.start()
+        return self
+
+    def publish(self, item: Any) -> bool:
+        """Hand an event or log event dict to the child; False if it was dropped."""
+
+        ring = self._ring
+        if ring is None:
+            raise RuntimeError("ColdPathProcess is not started")
+        return ring.try_write(encode(item))
+
+    def check(self) -> bool:
+        """Log drops since the last check and, once, a dead child; False once the child is gone."""
+
+        ring, process = self._ring, self._process
+        if ring is None or process is None:
+            return False
+        if not process.is_alive() and not self._died:
+            # Set first so this and later log events bypass the ring nobody is reading.
+            self._died = True
+            logger.error("cold_path_died", exitcode=process.exitcode)
+        self._report_drops(ring)
+        return not self._died
+
+    async def monitor(self, interval: float = 5.0) -> None:
+        """Call ``check`` every ``interval`` seconds until the child is gone or stopped."""
+
+        while self.check():
+            await self.scheduler.sleep(interval)
+
+    def log_processor(self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]) -> Any:
+        """Structlog processor that ships events to the child's log sink.
+
+        Before ``start``, after ``stop`` and once ``check`` has found the child
+        dead, events pass through to the next processor.
+        """
+
+        import structlog
+
+        if self._ring is None or self._died:
+            return event_dict
+        event_dict.setdefault("timestamp", time.time())
+        try:
+            self.publish(dict(event_dict))
+        except Exception:  # unpicklable values are sent as their repr
+            self.publish({key: _plain(value) for key, value in event_dict.items()})
+        raise structlog.DropEvent
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Let the child drain the ring and exit, then release the ring."""
+
+        ring, process = self._ring, self._process
+        if ring is None or process is None:
+            return
+        ring.close_writer()
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        self._ring = self._process = None
+        self._report_drops(ring)
+        ring.close()
+        self._reported_drops = 0
+        self._died = False
+
+    def _report_drops(self, ring: SharedRing) -> None:
+        dropped = ring.dropped
+        if dropped > self._reported_drops:
+            logger.warning("cold_path_dropped", dropped=dropped - self._reported_drops, total=dropped)
+            self._reported_drops = dropped
+
+
+def _plain(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+
+
+def _run_child(
+    ring_name: str,
+    factory: ServiceFactory,
+    idle_sleep: float,
+    sample_every: Mapping[str, int],
+    rate_limits: Mapping[str, float],
+) -> None:
+    sink = configure_async_logging(sample_every=sample_every, rate_limits=rate_limits)
+    ring = SharedRing.attach(ring_name)
+    try:
+        asyncio.run(_consume(ring, factory(sink), idle_sleep))
+    finally:
+        ring.close()
+        sink.close()
+
+
+async def _consume(ring: SharedRing, service: ColdPathService, idle_sleep: float) -> None:
+    await service.start()
+    polls = asyncio.create_task(service.run_polls())
+    try:
+        while True:
+            records = ring.read_many()
+            if records:
+                for record in records:
+                    try:
+                        await service.handle(decode(record))
+                    except Exception as exc:
+                        logger.error("cold_path_handle_failed", error=str(exc))
+            elif ring.closed:
+                # close_writer was set after the last write; drain once more.
+                if not ring.pending:
+                    break
+            else:
+                await asyncio.sleep(idle_sleep)
+    finally:
+        polls.cancel()
+        await asyncio.gather(polls, return_exceptions=True)
+        await service.close()
+
+
+class ColdPathPersistence(EventSinkPort):
+    """Hot-process EventSinkPort that forwards writes to a ColdPathProcess.
+
+    Reads live with the child's repository, so the hot side only gets the
+    write half of PersistencePort.
+    """
+
+    def __init__(self, cold_path: ColdPathProcess) -> None:
+        self.cold_path = cold_path
+
+    async def persist_event(self, event: Any) -> None:
+        self.cold_path.publish(event)
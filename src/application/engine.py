@@ -1,30 +1,305 @@
 import asyncio
-from collections import defaultdict
-from typing import Any, Awaitable, Callable, DefaultDict, Dict
+import bisect
+import hashlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Literal, Optional
 
 from ..domain.events import TickEvent
+from ..infrastructure.clock import Clock, SystemClock
+from ..infrastructure.logging import get_logger
+from ..infrastructure.profiling import HandlerProfiler
+
+logger = get_logger(__name__)
+
+BackpressurePolicy = Literal["block", "drop_oldest", "conflate", "drop_new"]
+
+_RING_REPLICAS = 64
+_POOL_BATCH = 16
+
+
+@dataclass
+class QueueStats:
+    """Per-symbol queue health counters."""
+
+    depth: int = 0
+    lag: float = 0.0
+    processed: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    conflating: bool = False
+
+
+class _SymbolQueue:
+    __slots__ = ("queue", "stats", "scheduled", "last_active")
+
+    def __init__(self, maxsize: int, stats: QueueStats) -> None:
+        self.queue: asyncio.Queue[TickEvent] = asyncio.Queue(maxsize)
+        self.stats = stats
+        self.scheduled = False
+        self.last_active = 0.0
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
 
 
 class PartitionedEngine:
-    """Routes events to symbol specific workers to maintain ordering."""
+    """Routes events to symbol specific workers to maintain ordering.
+
+    Each symbol with a registered handler gets its own queue bounded by
+    ``maxsize`` (0 means unbounded); ticks for any other symbol are
+    discarded, so a symbol nobody consumes never fills a queue or blocks
+    the feed. When a queue is full ``policy`` decides what happens:
+    ``block`` waits for room, ``drop_oldest`` evicts the head, ``drop_new``
+    discards the incoming tick and ``conflate`` replaces everything queued
+    with the latest tick. If ``conflate_lag_threshold`` is set, a symbol
+    whose lag (clock time minus tick timestamp at dequeue) exceeds it is
+    switched to conflation until it catches up below half the threshold.
+
+    By default every registered symbol owns a dedicated worker task. With
+    ``workers`` set, symbols are instead multiplexed onto a fixed pool by
+    consistent hashing, so a symbol is always served by the same worker and
+    keeps its ordering. Pool workers and symbol queues are created when a
+    symbol first receives a tick and reclaimed after ``idle_timeout``
+    seconds without activity.
+
+    Handler calls go through ``profiler`` while it is enabled. A handler
+    that raises is logged and the worker moves on to the next tick, so one
+    failing symbol never stalls the others sharing its worker.
+    """
 
-    def __init__(self) -> None:
-        self._queues: DefaultDict[str, asyncio.Queue[TickEvent]] = defaultdict(asyncio.Queue)
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: BackpressurePolicy = "block",
+        clock: Optional[Clock] = None,
+        conflate_lag_threshold: Optional[float] = None,
+        workers: Optional[int] = None,
+        idle_timeout: float = 30.0,
+        profiler: Optional[HandlerProfiler] = None,
+    ) -> None:
+        if policy not in ("block", "drop_oldest", "conflate", "drop_new"):
+            raise ValueError(f"Unknown backpressure policy {policy}")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.clock: Clock = clock if clock is not None else SystemClock()
+        self.conflate_lag_threshold = conflate_lag_threshold
+        self.pool_size = workers
+        self.idle_timeout = idle_timeout
+        self.profiler = profiler
+        self._queues: Dict[str, _SymbolQueue] = {}
+        self._stats: Dict[str, QueueStats] = {}
         self._workers: Dict[str, asyncio.Task[None]] = {}
         self._handlers: Dict[str, Callable[[TickEvent], Awaitable[None]]] = {}
+        self._pool: Dict[int, asyncio.Task[None]] = {}
+        self._ready: Dict[int, asyncio.Queue[str]] = {}
+        self._assigned: Dict[int, int] = {}
+        self._symbol_worker: Dict[str, int] = {}
+        self._janitor: Optional[asyncio.Task[None]] = None
+        self._ring_keys: List[int] = []
+        self._ring_workers: List[int] = []
+        if workers is not None:
+            points = sorted(
+                (_ring_hash(f"worker-{index}:{replica}"), index)
+                for index in range(workers)
+                for replica in range(_RING_REPLICAS)
+            )
+            self._ring_keys = [point for point, _ in points]
+            self._ring_workers = [index for _, index in points]
+
+    @property
+    def active_symbols(self) -> int:
+        return len(self._queues)
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._pool) if self.pool_size is not None else len(self._workers)
 
     def register_handler(self, symbol: str, handler: Callable[[TickEvent], Awaitable[None]]) -> None:
         self._handlers[symbol] = handler
-        if symbol not in self._workers:
+        if self.pool_size is None and symbol not in self._workers:
             self._workers[symbol] = asyncio.create_task(self._worker(symbol))
 
+    def unregister_handler(self, symbol: str) -> None:
+        """Stop routing a symbol and discard anything still queued for it."""
+
+        self._handlers.pop(symbol, None)
+        self._stats.pop(symbol, None)
+        worker = self._workers.pop(symbol, None)
+        if worker is not None:
+            worker.cancel()
+        state = self._queues.get(symbol)
+        if state is not None:
+            # Frees an enqueue blocked on the full queue; its tick lands in the discarded queue.
+            self._drain(state.queue)
+        self._release(symbol)
+
     async def enqueue(self, event: TickEvent) -> None:
-        await self._queues[event.symbol].put(event)
+        if event.symbol not in self._handlers:
+            return
+        pooled = self.pool_size is not None
+        state = self._queue_for(event.symbol)
+        queue = state.queue
+        if state.stats.conflating or self.policy == "conflate":
+            state.stats.conflated += self._drain(queue)
+            queue.put_nowait(event)
+        elif not queue.full():
+            queue.put_nowait(event)
+        elif self.policy == "block":
+            await queue.put(event)
+        elif self.policy == "drop_oldest":
+            queue.get_nowait()
+            queue.task_done()
+            state.stats.dropped += 1
+            queue.put_nowait(event)
+        else:
+            state.stats.dropped += 1
+        if pooled and not state.scheduled:
+            state.scheduled = True
+            self._ready_queue(event.symbol).put_nowait(event.symbol)
+
+    def stats(self, symbol: str) -> QueueStats:
+        """Return a snapshot of queue depth, lag and drop counters for a symbol."""
+
+        stats = self._stats.get(symbol)
+        if stats is None:
+            return QueueStats()
+        state = self._queues.get(symbol)
+        return QueueStats(
+            depth=state.queue.qsize() if state is not None else 0,
+            lag=stats.lag,
+            processed=stats.processed,
+            dropped=stats.dropped,
+            conflated=stats.conflated,
+            conflating=stats.conflating,
+        )
+
+    def all_stats(self) -> Dict[str, QueueStats]:
+        return {symbol: self.stats(symbol) for symbol in self._stats}
+
+    async def shutdown(self) -> None:
+        """Cancel every worker task and wait for them to exit."""
+
+        tasks = [*self._workers.values(), *self._pool.values()]
+        if self._janitor is not None:
+            tasks.append(self._janitor)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
+        self._pool.clear()
+        self._janitor = None
+
+    def _queue_for(self, symbol: str) -> _SymbolQueue:
+        state = self._queues.get(symbol)
+        if state is None:
+            stats = self._stats.get(symbol)
+            if stats is None:
+                stats = self._stats[symbol] = QueueStats()
+            state = self._queues[symbol] = _SymbolQueue(self.maxsize, stats)
+            if self.pool_size is not None:
+                index = self._worker_index(symbol)
+                self._assigned[index] = self._assigned.get(index, 0) + 1
+        return state
+
+    def _release(self, symbol: str) -> None:
+        if self._queues.pop(symbol, None) is not None and self.pool_size is not None:
+            self._assigned[self._worker_index(symbol)] -= 1
+
+    def _worker_index(self, symbol: str) -> int:
+        index = self._symbol_worker.get(symbol)
+        if index is None:
+            position = bisect.bisect(self._ring_keys, _ring_hash(symbol)) % len(self._ring_keys)
+            index = self._symbol_worker[symbol] = self._ring_workers[position]
+        return index
+
+    def _ready_queue(self, symbol: str) -> "asyncio.Queue[str]":
+        index = self._worker_index(symbol)
+        if index not in self._pool:
+            self._ready[index] = asyncio.Queue()
+            self._pool[index] = asyncio.create_task(self._pool_worker(index))
+            if self._janitor is None:
+                self._janitor = asyncio.create_task(self._reclaim_idle())
+        return self._ready[index]
+
+    @staticmethod
+    def _drain(queue: "asyncio.Queue[TickEvent]") -> int:
+        drained = 0
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+            drained += 1
+        return drained
+
+    def _observe_lag(self, stats: QueueStats, event: TickEvent) -> None:
+        stats.lag = self.clock.now() - event.timestamp
+        threshold = self.conflate_lag_threshold
+        if threshold is None:
+            return
+        if stats.lag > threshold:
+            stats.conflating = True
+        elif stats.conflating and stats.lag < threshold / 2:
+            stats.conflating = False
+
+    async def _handle(
+        self, symbol: str, handler: Callable[[TickEvent], Awaitable[None]], stats: QueueStats, event: TickEvent
+    ) -> None:
+        self._observe_lag(stats, event)
+        try:
+            await HandlerProfiler.dispatch(self.profiler, handler, event)
+        except Exception as exc:
+            logger.error("engine_handler_failed", symbol=symbol, error=str(exc))
+        stats.processed += 1
 
     async def _worker(self, symbol: str) -> None:
-        queue = self._queues[symbol]
+        state = self._queue_for(symbol)
+        queue = state.queue
+        stats = state.stats
         handler = self._handlers[symbol]
         while True:
             event = await queue.get()
-            await handler(event)
+            await self._handle(symbol, handler, stats, event)
             queue.task_done()
+
+    async def _pool_worker(self, index: int) -> None:
+        ready = self._ready[index]
+        while True:
+            symbol = await ready.get()
+            state = self._queues.get(symbol)
+            handler = self._handlers.get(symbol)
+            if state is None or handler is None:
+                continue
+            queue = state.queue
+            stats = state.stats
+            for _ in range(_POOL_BATCH):
+                if queue.empty():
+                    break
+                event = queue.get_nowait()
+                await self._handle(symbol, handler, stats, event)
+                queue.task_done()
+                if self._queues.get(symbol) is not state:
+                    break
+            if self._queues.get(symbol) is not state:
+                continue
+            if queue.empty():
+                state.scheduled = False
+                state.last_active = self.clock.now()
+            else:
+                ready.put_nowait(symbol)
+
+    async def _reclaim_idle(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_timeout)
+            cutoff = self.clock.now() - self.idle_timeout
+            for symbol, state in list(self._queues.items()):
+                if not state.scheduled and state.queue.empty() and state.last_active <= cutoff:
+                    self._release(symbol)
+            for index in [index for index in self._pool if not self._assigned.get(index)]:
+                if self._ready[index].empty():
+                    self._pool.pop(index).cancel()
+                    del self._ready[index]
+            if not self._pool:
+                self._janitor = None
+                return
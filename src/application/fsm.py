@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from ..domain.models import Order
 
@@ -15,13 +15,45 @@ VALID_TRANSITIONS: Dict[str, set[str]] = {
     "CANCEL_PENDING": {"CANCELLED"},
 }
 
+# Integer encoding of VALID_TRANSITIONS: STATES[i] is the name of state i and
+# TRANSITION_MASKS[i] has bit j set when state i may move to state j.
+STATES: Tuple[str, ...] = (
+    "PENDING",
+    "SUBMITTED",
+    "PARTIALLY_FILLED",
+    "CANCEL_PENDING",
+    "FILLED",
+    "REJECTED",
+    "CANCELLED",
+)
+STATE_INDEX: Dict[str, int] = {name: idx for idx, name in enumerate(STATES)}
+
+
+def compile_transitions(transitions: Dict[str, set[str]]) -> List[int]:
+    """Compile a state -> allowed states mapping into per-state bitmasks."""
+
+    masks = [0] * len(STATES)
+    for source, targets in transitions.items():
+        for target in targets:
+            masks[STATE_INDEX[source]] |= 1 << STATE_INDEX[target]
+    return masks
+
+
+TRANSITION_MASKS: List[int] = compile_transitions(VALID_TRANSITIONS)
+TERMINAL_MASK: int = sum(1 << idx for idx, mask in enumerate(TRANSITION_MASKS) if not mask)
+
+
+def can_transition(source: int, target: int) -> bool:
+    return bool(TRANSITION_MASKS[source] >> target & 1)
+
 
 @dataclass
 class OrderStateMachine:
     order: Order
 
     def transition(self, new_state: str) -> None:
-        allowed = VALID_TRANSITIONS.get(self.order.state, set())
-        if new_state not in allowed:
+        source = STATE_INDEX.get(self.order.state)
+        target = STATE_INDEX.get(new_state)
+        if source is None or target is None or not can_transition(source, target):
             raise InvalidOrderState(f"Cannot transition from {self.order.state} to {new_state}")
         self.order.state = new_state
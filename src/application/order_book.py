@@ -0,0 +1,236 @@
+"""Indexed book of live orders with compiled state transitions."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import DefaultDict, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from ..domain.events import FillEvent, OrderEvent
+from ..domain.models import Order
+from .fsm import STATE_INDEX, STATES, TERMINAL_MASK, TRANSITION_MASKS, InvalidOrderState
+
+_SUBMITTED = STATE_INDEX["SUBMITTED"]
+_PARTIALLY_FILLED = STATE_INDEX["PARTIALLY_FILLED"]
+_FILLED = STATE_INDEX["FILLED"]
+_FILL_EPSILON = 1e-9
+
+
+class UnknownOrder(KeyError):
+    """Raised when a client_order_id is not in the book."""
+
+
+class _Entry:
+    __slots__ = ("order", "state", "filled")
+
+    def __init__(self, order: Order, state: int) -> None:
+        self.order = order
+        self.state = state
+        self.filled = 0.0
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.order.quantity - self.filled)
+
+
+@dataclass(frozen=True)
+class TransitionFailure:
+    client_order_id: Hashable
+    target: str
+    reason: str
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of applying a batch of broker fills to the book."""
+
+    applied: int = 0
+    unknown: List[Hashable] = field(default_factory=list)
+    rejected: List[TransitionFailure] = field(default_factory=list)
+    overfilled: List[Hashable] = field(default_factory=list)
+
+
+class OrderBook:
+    """Tracks live orders keyed by client_order_id.
+
+    Orders are indexed by symbol and by state, and open (unfilled, non
+    terminal) quantity is maintained per symbol and side so risk checks
+    can read it in O(1). States are held as integers and validated against
+    the bitmasks compiled from VALID_TRANSITIONS; each Order's string
+    ``state`` is kept in sync for code that still reads it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._by_symbol: DefaultDict[str, Set[Hashable]] = defaultdict(set)
+        self._by_state: List[Set[Hashable]] = [set() for _ in STATES]
+        self._open_buy: DefaultDict[str, float] = defaultdict(float)
+        self._open_sell: DefaultDict[str, float] = defaultdict(float)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, client_order_id: Hashable) -> bool:
+        return client_order_id in self._entries
+
+    def add(self, order: Order) -> None:
+        """Insert an order in its current state."""
+
+        key = order.client_order_id
+        if key in self._entries:
+            raise ValueError(f"Duplicate client_order_id {key}")
+        state = STATE_INDEX.get(order.state)
+        if state is None:
+            raise InvalidOrderState(f"Unknown order state {order.state}")
+        self._entries[key] = _Entry(order, state)
+        self._by_symbol[order.symbol].add(key)
+        self._by_state[state].add(key)
+        if not TERMINAL_MASK >> state & 1:
+            self._adjust_open(order, order.quantity)
+
+    def add_event(self, event: OrderEvent, state: str = "PENDING") -> Order:
+        """Create and insert an Order from an OrderEvent."""
+
+        order = Order(
+            symbol=event.symbol,
+            side=event.side,
+            quantity=event.quantity,
+            price=event.price,
+            client_order_id=event.client_order_id,
+            state=state,
+        )
+        self.add(order)
+        return order
+
+    def get(self, client_order_id: Hashable) -> Order:
+        return self._entry(client_order_id).order
+
+    def filled_quantity(self, client_order_id: Hashable) -> float:
+        return self._entry(client_order_id).filled
+
+    def transition(self, client_order_id: Hashable, new_state: str) -> None:
+        """Move one order to a new state, raising on invalid transitions."""
+
+        reason = self._transition(self._entry(client_order_id), new_state)
+        if reason is not None:
+            raise InvalidOrderState(reason)
+
+    def transition_many(self, updates: Iterable[Tuple[Hashable, str]]) -> List[TransitionFailure]:
+        """Apply a batch of state updates, returning failures instead of raising."""
+
+        failures: List[TransitionFailure] = []
+        entries = self._entries
+        for client_order_id, new_state in updates:
+            entry = entries.get(client_order_id)
+            if entry is None:
+                failures.append(TransitionFailure(client_order_id, new_state, "unknown order"))
+                continue
+            reason = self._transition(entry, new_state)
+            if reason is not None:
+                failures.append(TransitionFailure(client_order_id, new_state, reason))
+        return failures
+
+    def apply_fill(self, fill: FillEvent) -> None:
+        """Apply a single fill, raising on unknown orders or invalid states."""
+
+        reason = self._fill(self._entry(fill.client_order_id), fill.quantity)
+        if reason is not None:
+            raise InvalidOrderState(reason)
+
+    def reconcile(self, fills: Iterable[FillEvent]) -> ReconcileReport:
+        """Apply a batch of broker fills and report anything that did not match."""
+
+        report = ReconcileReport()
+        entries = self._entries
+        for fill in fills:
+            entry = entries.get(fill.client_order_id)
+            if entry is None:
+                report.unknown.append(fill.client_order_id)
+                continue
+            if fill.quantity > entry.remaining + _FILL_EPSILON:
+                report.overfilled.append(fill.client_order_id)
+            reason = self._fill(entry, fill.quantity)
+            if reason is None:
+                report.applied += 1
+            else:
+                report.rejected.append(TransitionFailure(fill.client_order_id, "FILLED", reason))
+        return report
+
+    def open_quantity(self, symbol: str) -> float:
+        """Net open quantity for a symbol (open buys minus open sells)."""
+
+        return self._open_buy.get(symbol, 0.0) - self._open_sell.get(symbol, 0.0)
+
+    def open_buy_quantity(self, symbol: str) -> float:
+        return self._open_buy.get(symbol, 0.0)
+
+    def open_sell_quantity(self, symbol: str) -> float:
+        return self._open_sell.get(symbol, 0.0)
+
+    def orders_for_symbol(self, symbol: str) -> Tuple[Order, ...]:
+        keys = self._by_symbol.get(symbol, ())
+        return tuple(self._entries[key].order for key in keys)
+
+    def orders_in_state(self, state: str) -> Tuple[Order, ...]:
+        keys = self._by_state[STATE_INDEX[state]]
+        return tuple(self._entries[key].order for key in keys)
+
+    def open_orders(self) -> Tuple[Order, ...]:
+        return tuple(entry.order for entry in self._entries.values() if not TERMINAL_MASK >> entry.state & 1)
+
+    def prune_terminal(self) -> int:
+        """Drop filled, rejected and cancelled orders; return how many were removed."""
+
+        removed = 0
+        for state, keys in enumerate(self._by_state):
+            if not TERMINAL_MASK >> state & 1:
+                continue
+            for key in keys:
+                entry = self._entries.pop(key)
+                symbol_keys = self._by_symbol[entry.order.symbol]
+                symbol_keys.discard(key)
+                if not symbol_keys:
+                    del self._by_symbol[entry.order.symbol]
+                removed += 1
+            keys.clear()
+        return removed
+
+    def _entry(self, client_order_id: Hashable) -> _Entry:
+        entry = self._entries.get(client_order_id)
+        if entry is None:
+            raise UnknownOrder(client_order_id)
+        return entry
+
+    def _transition(self, entry: _Entry, new_state: str) -> Optional[str]:
+        target = STATE_INDEX.get(new_state)
+        if target is None or not TRANSITION_MASKS[entry.state] >> target & 1:
+            return f"Cannot transition from {STATES[entry.state]} to {new_state}"
+        self._set_state(entry, target)
+        return None
+
+    def _fill(self, entry: _Entry, quantity: float) -> Optional[str]:
+        if entry.state != _SUBMITTED and entry.state != _PARTIALLY_FILLED:
+            return f"Cannot fill order in state {STATES[entry.state]}"
+        applied = min(quantity, entry.remaining)
+        entry.filled += applied
+        self._adjust_open(entry.order, -applied)
+        if entry.remaining <= _FILL_EPSILON:
+            self._set_state(entry, _FILLED)
+        elif entry.state != _PARTIALLY_FILLED:
+            self._set_state(entry, _PARTIALLY_FILLED)
+        return None
+
+    def _set_state(self, entry: _Entry, target: int) -> None:
+        key = entry.order.client_order_id
+        self._by_state[entry.state].discard(key)
+        self._by_state[target].add(key)
+        if TERMINAL_MASK >> target & 1 and not TERMINAL_MASK >> entry.state & 1:
+            self._adjust_open(entry.order, -entry.remaining)
+        entry.state = target
+        entry.order.state = STATES[target]
+
+    def _adjust_open(self, order: Order, delta: float) -> None:
+        if order.side == "BUY":
+            self._open_buy[order.symbol] += delta
+        else:
+            self._open_sell[order.symbol] += delta
@@ -0,0 +1,243 @@
+"""Incrementally maintained portfolio risk metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from ..domain.events import FillEvent, PortfolioMetricsEvent
+from ..domain.models import Position
+from ..infrastructure.clock import Clock, Scheduler, SystemClock
+from .bus import EventBus
+
+
+class _SymbolState:
+    __slots__ = ("position", "last_price", "unrealized", "exposure")
+
+    def __init__(self, symbol: str) -> None:
+        self.position = Position(symbol=symbol)
+        self.last_price: Optional[float] = None
+        self.unrealized = 0.0
+        self.exposure = 0.0
+
+
+class PortfolioMetrics:
+    """Portfolio P&L, drawdown, volatility, exposure and broker uptime.
+
+    ``on_fill`` and ``on_price`` only touch the affected symbol and adjust
+    running totals by its change in contribution, so every update is O(1)
+    in the number of symbols. Total P&L is sampled every
+    ``volatility_interval`` seconds of clock time when an update arrives;
+    the standard deviation of the last ``volatility_window`` sample-to-sample
+    changes is kept from running sums. Realized P&L and position averaging
+    follow PositionTracker.
+
+    The high-water mark and max drawdown are intraday: the first update in
+    a new ``day_length``-second period of clock time (UTC days by default)
+    calls ``reset_day``, which callers with another session calendar can
+    also call directly.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        volatility_interval: float = 1.0,
+        volatility_window: int = 300,
+        day_length: float = 86_400.0,
+    ) -> None:
+        if volatility_window < 2:
+            raise ValueError("volatility_window must be at least 2")
+        self.clock: Clock = clock if clock is not None else SystemClock()
+        self.volatility_interval = volatility_interval
+        self.day_length = day_length
+        self._symbols: Dict[str, _SymbolState] = {}
+        self._realized = 0.0
+        self._unrealized = 0.0
+        self._gross = 0.0
+        self._net = 0.0
+        self._high_water = 0.0
+        self._max_drawdown = 0.0
+        self._changes: Deque[float] = deque(maxlen=volatility_window)
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._last_sample_pnl = 0.0
+        self._next_sample = self.clock.now() + volatility_interval
+        self._day = self.clock.now() // day_length
+        self._connected = True
+        self._disconnected_since: Optional[float] = None
+
+    def on_fill(self, fill: FillEvent) -> None:
+        state = self._state(fill.symbol)
+        position = state.position
+        if fill.side == "SELL":
+            self._realized += (fill.price - position.average_price) * fill.quantity
+        position.apply_fill(fill.side, fill.quantity, fill.price)
+        self._mark(state, fill.price)
+
+    def on_price(self, symbol: str, price: float) -> None:
+        self._mark(self._state(symbol), price)
+
+    def reset_day(self) -> None:
+        """Start a new trading day: the high-water mark restarts at the current P&L."""
+
+        self._high_water = self.total_pnl
+        self._max_drawdown = 0.0
+
+    def set_broker_connected(self, connected: bool) -> None:
+        if connected:
+            self._disconnected_since = None
+        elif self._connected:
+            self._disconnected_since = self.clock.now()
+        self._connected = connected
+
+    @property
+    def realized_pnl(self) -> float:
+        return self._realized
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self._unrealized
+
+    @property
+    def total_pnl(self) -> float:
+        return self._realized + self._unrealized
+
+    @property
+    def high_water_mark(self) -> float:
+        return self._high_water
+
+    @property
+    def drawdown(self) -> float:
+        return self._high_water - self.total_pnl
+
+    @property
+    def max_drawdown(self) -> float:
+        return self._max_drawdown
+
+    @property
+    def pnl_volatility(self) -> float:
+        count = len(self._changes)
+        if count < 2:
+            return 0.0
+        variance = (self._sum_squares - self._sum * self._sum / count) / (count - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+    @property
+    def gross_exposure(self) -> float:
+        return self._gross
+
+    @property
+    def net_exposure(self) -> float:
+        return self._net
+
+    def exposure(self, symbol: str) -> float:
+        state = self._symbols.get(symbol)
+        return state.exposure if state is not None else 0.0
+
+    @property
+    def broker_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def broker_disconnected_seconds(self) -> float:
+        if self._disconnected_since is None:
+            return 0.0
+        return self.clock.now() - self._disconnected_since
+
+    def snapshot(self) -> PortfolioMetricsEvent:
+        return PortfolioMetricsEvent(
+            timestamp=self.clock.now(),
+            realized_pnl=self._realized,
+            unrealized_pnl=self._unrealized,
+            total_pnl=self.total_pnl,
+            high_water_mark=self._high_water,
+            drawdown=self.drawdown,
+            max_drawdown=self._max_drawdown,
+            pnl_volatility=self.pnl_volatility,
+            gross_exposure=self._gross,
+            net_exposure=self._net,
+            exposures=tuple((symbol, state.exposure) for symbol, state in self._symbols.items() if state.exposure),
+            broker_connected=self._connected,
+            broker_disconnected_seconds=self.broker_disconnected_seconds,
+        )
+
+    def _state(self, symbol: str) -> _SymbolState:
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._symbols[symbol] = _SymbolState(symbol)
+        return state
+
+    def _mark(self, state: _SymbolState, price: float) -> None:
+        now = self.clock.now()
+        day = now // self.day_length
+        if day != self._day:
+            # The new day's high-water mark starts from the P&L carried over, before this update.
+            self._day = day
+            self.reset_day()
+        position = state.position
+        unrealized = (price - position.average_price) * position.quantity
+        exposure = price * position.quantity
+        self._unrealized += unrealized - state.unrealized
+        self._net += exposure - state.exposure
+        self._gross += abs(exposure) - abs(state.exposure)
+        state.last_price = price
+        state.unrealized = unrealized
+        state.exposure = exposure
+
+        total = self._realized + self._unrealized
+        if total > self._high_water:
+            self._high_water = total
+        elif self._high_water - total > self._max_drawdown:
+            self._max_drawdown = self._high_water - total
+        if now >= self._next_sample:
+            self._sample(total - self._last_sample_pnl)
+            self._last_sample_pnl = total
+            self._next_sample = now + self.volatility_interval
+
+    def _sample(self, change: float) -> None:
+        changes = self._changes
+        if len(changes) == changes.maxlen:
+            evicted = changes[0]
+            self._sum -= evicted
+            self._sum_squares -= evicted * evicted
+        changes.append(change)
+        self._sum += change
+        self._sum_squares += change * change
+
+
+class MetricsPublisher:
+    """Publishes PortfolioMetricsEvent snapshots on the bus at a fixed interval.
+
+    Runs as its own task so snapshot construction and subscriber work stay
+    off the tick and fill handlers.
+    """
+
+    def __init__(
+        self,
+        metrics: PortfolioMetrics,
+        bus: EventBus,
+        interval: float = 1.0,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
+        self.metrics = metrics
+        self.bus = bus
+        self.interval = interval
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def run(self) -> None:
+        while True:
+            await self.scheduler.sleep(self.interval)
+            await self.bus.publish(self.metrics.snapshot())
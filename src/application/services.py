@@ -1,32 +1,270 @@
-from typing import Iterable, Optional
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from ..domain.events import FillEvent, OrderEvent, SignalEvent
 from ..domain.models import Order, Position
-from ..domain.risk.kill_switch import KillSwitch, KillSwitchEngaged
-from ..domain.risk.rules import RiskViolation, evaluate_risk
-from ..ports.broker import BrokerPort
+from ..domain.risk.kill_switch import KillSwitch, KillSwitchEngaged, PortfolioRiskView
+from ..domain.risk.rules import MaxNotionalRule, MaxPositionRule, RiskViolation, evaluate_risk
+from ..domain.strategy.cross_section import SignalBatch
+from ..infrastructure.clock import Scheduler
+from ..infrastructure.logging import get_logger
+from ..ports.broker import BrokerPort, ExecutionReport
+from .order_book import OrderBook
+
+logger = get_logger(__name__)
+
+# Errors from a broker call that mean the broker could not be reached.
+BROKER_CONNECTION_ERRORS = (OSError, asyncio.TimeoutError)
+
+
+@dataclass(frozen=True)
+class RiskDecision:
+    accepted: bool
+    reason: Optional[str] = None
 
 
 class RiskService:
-    """Applies risk checks including kill switch before order submission."""
+    """Applies risk checks including kill switch before order submission.
+
+    With ``metrics`` set the kill switch reads P&L, drawdown and broker
+    connectivity from it and the ``pnl``/``broker_connected`` arguments are
+    ignored. With ``order_book`` set, position limits count a symbol's open
+    order quantity as already held, so orders still working at the broker
+    cannot be stacked past a limit.
+    """
 
-    def __init__(self, kill_switch: KillSwitch, rules: Iterable[object]) -> None:
+    def __init__(
+        self,
+        kill_switch: KillSwitch,
+        rules: Iterable[object],
+        metrics: Optional[PortfolioRiskView] = None,
+        order_book: Optional[OrderBook] = None,
+    ) -> None:
         self.kill_switch = kill_switch
         self.rules = list(rules)
+        self.metrics = metrics
+        self.order_book = order_book
 
     def validate(self, signal: SignalEvent, positions: Iterable[Position], pnl: float, broker_connected: bool) -> None:
-        self.kill_switch.check(pnl=pnl, broker_connected=broker_connected)
-        evaluate_risk(self.rules, positions, signal)
+        self._check_kill_switch(pnl, broker_connected)
+        if self.order_book is None:
+            evaluate_risk(self.rules, positions, signal)
+            return
+        positions = list(positions)
+        committed = self._with_open_orders(positions)
+        for rule in self.rules:
+            if hasattr(rule, "evaluate"):
+                rule.evaluate(committed if isinstance(rule, MaxPositionRule) else positions, signal)
+
+    def validate_batch(
+        self,
+        candidates: Sequence[Union[SignalEvent, OrderEvent]],
+        positions: Iterable[Position],
+        pnl: float,
+        broker_connected: bool,
+        prices: Optional[Mapping[str, float]] = None,
+        default_quantity: float = 1.0,
+    ) -> List[RiskDecision]:
+        """Validate many signals or orders at once without raising.
+
+        Candidates are checked in order as if each accepted one had already
+        filled: quantity and notional limits see the running effect of
+        earlier accepted candidates in the batch, and position limits also
+        count open orders in ``order_book``. One pass keeps running
+        per-symbol quantity and total notional, so a batch costs O(n) however
+        many candidates are rejected. Signals use ``default_quantity``;
+        candidates are priced from the order price, then ``prices``, then the
+        position's average price; when a MaxNotionalRule is configured a
+        candidate with none of these is rejected, since its exposure is
+        unknown. Other rule types are evaluated per candidate against the
+        starting positions. When several rules are breached the reason comes
+        from the first in ``rules``.
+        """
+
+        return self._validate_columns(
+            [candidate.symbol for candidate in candidates],
+            [candidate.side == "BUY" for candidate in candidates],
+            [getattr(candidate, "quantity", default_quantity) for candidate in candidates],
+            [getattr(candidate, "price", None) for candidate in candidates],
+            candidates.__getitem__,
+            positions,
+            pnl,
+            broker_connected,
+            prices,
+        )
+
+    def validate_signal_batch(
+        self,
+        batch: SignalBatch,
+        id_generator: Callable[[str, str, float], object],
+        positions: Iterable[Position],
+        pnl: float,
+        broker_connected: bool,
+        prices: Optional[Mapping[str, float]] = None,
+        default_quantity: float = 1.0,
+    ) -> List[RiskDecision]:
+        """``validate_batch`` over a SignalBatch, read straight from its columns.
+
+        No Signal is built for a candidate that position or notional limits
+        reject; other rule types get one made with ``id_generator``.
+        """
+
+        count = len(batch)
+        return self._validate_columns(
+            batch.symbols,
+            batch.buy.tolist(),
+            [default_quantity] * count,
+            [None] * count,
+            lambda index: batch.signal(index, id_generator),
+            positions,
+            pnl,
+            broker_connected,
+            prices,
+        )
+
+    def _validate_columns(
+        self,
+        symbols: Sequence[str],
+        buys: Sequence[bool],
+        order_quantities: Sequence[float],
+        order_prices: Sequence[Optional[float]],
+        candidate: Callable[[int], object],
+        positions: Iterable[Position],
+        pnl: float,
+        broker_connected: bool,
+        prices: Optional[Mapping[str, float]],
+    ) -> List[RiskDecision]:
+        count = len(symbols)
+        if not count:
+            return []
+        try:
+            self._check_kill_switch(pnl, broker_connected)
+        except KillSwitchEngaged as exc:
+            return [RiskDecision(False, str(exc))] * count
+
+        positions = list(positions)
+        held: Dict[str, Position] = {position.symbol: position for position in positions}
+        prices = prices or {}
+        position_limits: Dict[str, List[Tuple[int, float]]] = {}
+        notional_limits: List[Tuple[int, float]] = []
+        other_rules = []
+        for rank, rule in enumerate(self.rules):
+            if isinstance(rule, MaxPositionRule):
+                position_limits.setdefault(rule.symbol, []).append((rank, rule.max_quantity))
+            elif isinstance(rule, MaxNotionalRule):
+                notional_limits.append((rank, rule.max_notional))
+            elif hasattr(rule, "evaluate"):
+                other_rules.append(rule)
+        quantities: Dict[str, float] = {}
+        notional = sum(p.average_price * p.quantity for p in positions)
+
+        accepted = RiskDecision(True)
+        no_rank = len(self.rules)
+        decisions: List[RiskDecision] = []
+        for index, (symbol, buy, order_quantity, order_price) in enumerate(
+            zip(symbols, buys, order_quantities, order_prices)
+        ):
+            quantity = quantities.get(symbol)
+            if quantity is None:
+                quantity = self._open_quantity(symbol) + (held[symbol].quantity if symbol in held else 0.0)
+            price = 0.0
+            if notional_limits:
+                price = self._price(symbol, order_price, held, prices)
+                if math.isnan(price):
+                    decisions.append(RiskDecision(False, f"No price for {symbol}"))
+                    continue
+            # Limits are in rule order, so the first breach of each kind is the one to report.
+            rank, reason = no_rank, None
+            if buy:
+                for limit_rank, limit in position_limits.get(symbol, ()):
+                    if quantity >= limit:
+                        rank, reason = limit_rank, f"Max position exceeded for {symbol}"
+                        break
+            for limit_rank, limit in notional_limits:
+                if notional > limit:
+                    if limit_rank < rank:
+                        reason = "Max notional exposure exceeded"
+                    break
+            if reason is not None:
+                decisions.append(RiskDecision(False, reason))
+                continue
+            try:
+                for rule in other_rules:
+                    rule.evaluate(positions, candidate(index))
+            except RiskViolation as exc:
+                decisions.append(RiskDecision(False, str(exc)))
+                continue
+            delta = order_quantity if buy else -order_quantity
+            quantities[symbol] = quantity + delta
+            notional += delta * price
+            decisions.append(accepted)
+        return decisions
+
+    def _check_kill_switch(self, pnl: float, broker_connected: bool) -> None:
+        if self.metrics is not None:
+            self.kill_switch.check_metrics(self.metrics)
+        else:
+            self.kill_switch.check(pnl=pnl, broker_connected=broker_connected)
+
+    def _open_quantity(self, symbol: str) -> float:
+        return self.order_book.open_quantity(symbol) if self.order_book is not None else 0.0
+
+    def _with_open_orders(self, positions: List[Position]) -> List[Position]:
+        symbols = {position.symbol for position in positions}
+        symbols.update(rule.symbol for rule in self.rules if isinstance(rule, MaxPositionRule))
+        held = {position.symbol: position for position in positions}
+        committed = []
+        for symbol in symbols:
+            position = held.get(symbol, Position(symbol=symbol))
+            committed.append(
+                Position(
+                    symbol=symbol,
+                    quantity=position.quantity + self._open_quantity(symbol),
+                    average_price=position.average_price,
+                )
+            )
+        return committed
+
+    @staticmethod
+    def _price(
+        symbol: str, order_price: Optional[float], held: Mapping[str, Position], prices: Mapping[str, float]
+    ) -> float:
+        if order_price is not None:
+            return order_price
+        if symbol in prices:
+            return prices[symbol]
+        position = held.get(symbol)
+        return position.average_price if position is not None else float("nan")
 
 
 class ExecutionService:
-    """Submits orders through the broker port."""
+    """Submits orders through the broker port.
+
+    ``on_connection`` is told whether the broker is reachable (for example
+    ``PortfolioMetrics.set_broker_connected``): every successful submit or
+    received fill reports True, and a connection error from either reports
+    False.
+    """
 
-    def __init__(self, broker: BrokerPort) -> None:
+    def __init__(
+        self,
+        broker: BrokerPort,
+        on_connection: Optional[Callable[[bool], None]] = None,
+        scheduler: Optional[Scheduler] = None,
+    ) -> None:
         self.broker = broker
+        self.on_connection = on_connection
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
 
     async def submit(self, order_event: OrderEvent) -> None:
-        await self.broker.submit_order(order_event)
+        try:
+            await self.broker.submit_order(order_event)
+        except BROKER_CONNECTION_ERRORS:
+            self._connection(False)
+            raise
+        self._connection(True)
 
     async def cancel(self, client_order_id: str) -> None:
         await self.broker.cancel_order(client_order_id)
@@ -34,3 +272,23 @@ class ExecutionService:
     async def listen_fills(self, handler) -> None:
         fill = await self.broker.stream_fills()
         await handler(fill)
+
+    async def pump_fills(
+        self, handler: Callable[[ExecutionReport], Awaitable[None]], retry_delay: float = 1.0
+    ) -> None:
+        """Forward every fill and rejection to ``handler`` until cancelled, retrying after connection errors."""
+
+        while True:
+            try:
+                fill = await self.broker.stream_fills()
+            except BROKER_CONNECTION_ERRORS as exc:
+                self._connection(False)
+                logger.warning("broker_stream_failed", error=str(exc), retry_in=retry_delay)
+                await self.scheduler.sleep(retry_delay)
+                continue
+            self._connection(True)
+            await handler(fill)
+
+    def _connection(self, connected: bool) -> None:
+        if self.on_connection is not None:
+            self.on_connection(connected)
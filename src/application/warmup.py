@@ -0,0 +1,65 @@
+"""Strategy warmup from historical data before the live feed is attached."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from ..domain.strategy.base import StrategyBase
+from ..infrastructure.clock import Clock, SystemClock
+from ..infrastructure.logging import get_logger
+from ..ports.history import HistoricalDataPort
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    symbol: str
+    rows: int
+    seconds: float
+    last_timestamp: Optional[float]
+
+
+class WarmupService:
+    """Primes per-symbol strategies from recent history.
+
+    History for every symbol is fetched in one ``load`` call, so a store
+    that serves a request synchronously (such as the memory-mapped
+    ColumnarHistoryStore) is asked once rather than once per symbol.
+    """
+
+    def __init__(
+        self,
+        history: HistoricalDataPort,
+        clock: Optional[Clock] = None,
+        kind: str = "bars",
+        field: str = "close",
+    ) -> None:
+        self.history = history
+        self.clock: Clock = clock if clock is not None else SystemClock()
+        self.kind = kind
+        self.field = field
+
+    async def warm(self, strategies: Mapping[str, StrategyBase], lookback: float) -> Dict[str, WarmupResult]:
+        """Load ``lookback`` seconds of history for every symbol and prime its strategy."""
+
+        end = self.clock.now()
+        started = time.perf_counter()
+        loaded = await self.history.load(self.kind, list(strategies), end - lookback, end)
+        logger.info("history_loaded", symbols=len(strategies), seconds=time.perf_counter() - started)
+        results: Dict[str, WarmupResult] = {}
+        for symbol, strategy in strategies.items():
+            started = time.perf_counter()
+            columns = loaded.get(symbol)
+            rows = 0
+            last_timestamp = None
+            if columns is not None and len(columns["timestamp"]):
+                timestamps = columns["timestamp"]
+                strategy.warmup(symbol, columns[self.field], timestamps)
+                rows = len(timestamps)
+                last_timestamp = float(timestamps[-1])
+            results[symbol] = WarmupResult(symbol, rows, time.perf_counter() - started, last_timestamp)
+            logger.info("strategy_warmup", symbol=symbol, rows=rows, seconds=results[symbol].seconds)
+        return results
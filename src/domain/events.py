@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 
 from .models import OrderSide
@@ -38,3 +38,29 @@ class FillEvent:
     quantity: float
     price: float
     client_order_id: UUID
+
+
+@dataclass(frozen=True)
+class OrderRejectedEvent:
+    symbol: str
+    side: OrderSide
+    quantity: float
+    client_order_id: UUID
+    reason: str
+
+
+@dataclass(frozen=True)
+class PortfolioMetricsEvent:
+    timestamp: float
+    realized_pnl: float
+    unrealized_pnl: float
+    total_pnl: float
+    high_water_mark: float
+    drawdown: float
+    max_drawdown: float
+    pnl_volatility: float
+    gross_exposure: float
+    net_exposure: float
+    exposures: Tuple[Tuple[str, float], ...]
+    broker_connected: bool
+    broker_disconnected_seconds: float
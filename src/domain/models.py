@@ -58,3 +58,16 @@ class Position:
             if self.quantity <= 0:
                 self.quantity = 0.0
                 self.average_price = 0.0
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """OHLC summary of one symbol's values over ``[start, start + interval)``; close is the last value."""
+
+    symbol: str
+    start: float
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
@@ -1,11 +1,31 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Protocol
 
 
 class KillSwitchEngaged(Exception):
     """Raised when trading must be halted."""
 
 
+class PortfolioRiskView(Protocol):
+    """Read-only portfolio metrics the kill switch can check directly."""
+
+    @property
+    def total_pnl(self) -> float:
+        ...
+
+    @property
+    def drawdown(self) -> float:
+        ...
+
+    @property
+    def broker_connected(self) -> bool:
+        ...
+
+    @property
+    def broker_disconnected_seconds(self) -> float:
+        ...
+
+
 @dataclass
 class KillSwitch:
     """Kill switch checks multiple guardrails to halt trading."""
@@ -13,6 +33,7 @@ class KillSwitch:
     daily_loss_limit: float
     broker_disconnected_seconds: int = 0
     manual_triggered: bool = False
+    max_drawdown: Optional[float] = None
 
     def check(self, pnl: float, broker_connected: bool) -> None:
         if -pnl > self.daily_loss_limit:
@@ -22,5 +43,12 @@ class KillSwitch:
         if self.manual_triggered:
             raise KillSwitchEngaged("Manual halt triggered")
 
+    def check_metrics(self, metrics: PortfolioRiskView) -> None:
+        """Check guardrails against incrementally maintained portfolio metrics."""
+        self.broker_disconnected_seconds = int(metrics.broker_disconnected_seconds)
+        self.check(pnl=metrics.total_pnl, broker_connected=metrics.broker_connected)
+        if self.max_drawdown is not None and metrics.drawdown > self.max_drawdown:
+            raise KillSwitchEngaged("Max intraday drawdown exceeded")
+
     def trigger_manual(self) -> None:
         self.manual_triggered = True
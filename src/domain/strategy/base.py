@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 
 from ..models import Signal, Tick
 
@@ -11,3 +11,8 @@ class StrategyBase(ABC):
     def on_tick(self, tick: Tick) -> Optional[Signal]:
         """Process an incoming tick and optionally emit a Signal."""
         raise NotImplementedError
+
+    def warmup(self, symbol: str, prices: Sequence[float], timestamps: Sequence[float]) -> None:
+        """Prime state from historical prices; signals produced while replaying are discarded."""
+        for price, timestamp in zip(prices, timestamps):
+            self.on_tick(Tick(symbol=symbol, price=float(price), timestamp=float(timestamp)))
@@ -0,0 +1,204 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models import OrderSide, Signal, Tick
+from .base import StrategyBase
+
+_SIDES: Sequence[OrderSide] = ("SELL", "BUY")
+
+
+@dataclass(frozen=True)
+class SignalBatch:
+    """Signals from one vectorized step, as parallel arrays in tick order."""
+
+    strategy_id: str
+    symbols: List[str]
+    timestamps: np.ndarray
+    buy: np.ndarray
+    strengths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def signal(self, index: int, id_generator: Callable[[str, str, float], object]) -> Signal:
+        """Materialize the signal at ``index`` alone."""
+
+        symbol = self.symbols[index]
+        timestamp = float(self.timestamps[index])
+        return Signal(
+            symbol=symbol,
+            strategy_id=self.strategy_id,
+            timestamp=timestamp,
+            side=_SIDES[bool(self.buy[index])],
+            strength=float(self.strengths[index]),
+            signal_id=id_generator(symbol, self.strategy_id, timestamp),  # type: ignore[arg-type]
+        )
+
+    def signals(
+        self, id_generator: Callable[[str, str, float], object], indices: Optional[Sequence[int]] = None
+    ) -> List[Signal]:
+        """Materialize Signal objects, all of them or only those at ``indices``.
+
+        Ids are generated per signal as in GoldenCrossStrategy.
+        """
+
+        symbols, timestamps, buys, strengths = self.symbols, self.timestamps, self.buy, self.strengths
+        if indices is not None:
+            symbols = [symbols[index] for index in indices]
+            selected = np.asarray(indices, dtype=np.int64)
+            timestamps, buys, strengths = timestamps[selected], buys[selected], strengths[selected]
+        return [
+            Signal(
+                symbol=symbol,
+                strategy_id=self.strategy_id,
+                timestamp=timestamp,
+                side=_SIDES[buy],
+                strength=strength,
+                signal_id=id_generator(symbol, self.strategy_id, timestamp),  # type: ignore[arg-type]
+            )
+            for symbol, timestamp, buy, strength in zip(
+                symbols, timestamps.tolist(), buys.tolist(), strengths.tolist()
+            )
+        ]
+
+
+class CrossSectionalGoldenCross(StrategyBase):
+    """GoldenCrossStrategy for a whole universe, updated one price matrix at a time.
+
+    Each symbol owns a row of an ``(n_symbols, window)`` ring buffer of its
+    last prices. ``on_batch`` takes any number of ticks across symbols and
+    applies them in rounds, where round ``k`` holds every symbol's ``k``-th
+    tick of the batch, so a symbol's ticks are still applied in order and
+    produce exactly the signals GoldenCrossStrategy would: one per tick
+    once both windows are full, BUY when the short average is above the
+    long one. Averages are summed oldest-first like ``sum(deque)`` so the
+    strengths match bit for bit. New symbols get a row on first sight.
+    """
+
+    def __init__(
+        self,
+        strategy_id: str,
+        short_window: int = 3,
+        long_window: int = 5,
+        id_generator: Optional[Callable[[str, str, float], object]] = None,
+        capacity: int = 1024,
+    ) -> None:
+        self.strategy_id = strategy_id
+        self.short_window = short_window
+        self.long_window = long_window
+        self.id_generator = id_generator
+        self.window = max(short_window, long_window)
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._prices = np.zeros((capacity, self.window))
+        self._seen = np.zeros(capacity, dtype=np.int64)
+        self._warm_until = np.full(capacity, -np.inf)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def index_of(self, symbol: str) -> int:
+        """Return the symbol's row, adding it to the universe if new."""
+
+        row = self._index.get(symbol)
+        if row is None:
+            row = self._index[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+            if row == len(self._seen):
+                self._grow()
+        return row
+
+    def warmup(self, symbol: str, prices: Sequence[float], timestamps: Sequence[float]) -> None:
+        closes = np.asarray(prices, dtype=np.float64)
+        if not len(closes):
+            return
+        row = self.index_of(symbol)
+        for price in closes[-self.window :]:
+            self._prices[row, self._seen[row] % self.window] = price
+            self._seen[row] += 1
+        self._warm_until[row] = max(self._warm_until[row], float(timestamps[-1]))
+
+    def on_tick(self, tick: Tick) -> Optional[Signal]:
+        batch = self.on_batch(
+            np.array([self.index_of(tick.symbol)]), np.array([tick.price]), np.array([tick.timestamp])
+        )
+        if not len(batch):
+            return None
+        if not self.id_generator:
+            raise RuntimeError("id_generator must be provided for deterministic signals")
+        return batch.signals(self.id_generator)[0]
+
+    def on_batch(self, rows: np.ndarray, prices: np.ndarray, timestamps: np.ndarray) -> SignalBatch:
+        """Apply ticks given as parallel arrays of symbol rows (from ``index_of``), prices and timestamps."""
+
+        rows = np.asarray(rows, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        live = timestamps > self._warm_until[rows]
+        if not live.all():
+            rows, prices, timestamps = rows[live], prices[live], timestamps[live]
+        if not len(rows):
+            return self._empty()
+        # Stable sort by row so each symbol's ticks stay in arrival order,
+        # then number them within the symbol to form the rounds.
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+        lengths = np.diff(np.r_[starts, len(sorted_rows)])
+        ranks = np.empty(len(rows), dtype=np.int64)
+        ranks[order] = np.arange(len(rows)) - np.repeat(starts, lengths)
+
+        emitted: List[np.ndarray] = []
+        buys: List[np.ndarray] = []
+        strengths: List[np.ndarray] = []
+        round_order = np.argsort(ranks, kind="stable")
+        bounds = np.searchsorted(ranks[round_order], np.arange(int(lengths.max()) + 1))
+        for step in range(len(bounds) - 1):
+            ticks = round_order[bounds[step] : bounds[step + 1]]
+            buy, strength, ready = self._step(rows[ticks], prices[ticks])
+            emitted.append(ticks[ready])
+            buys.append(buy)
+            strengths.append(strength)
+        ticks = np.concatenate(emitted)
+        # Emit in the order the ticks arrived.
+        arrival = np.argsort(ticks, kind="stable")
+        ticks = ticks[arrival]
+        symbols = self._symbols
+        return SignalBatch(
+            strategy_id=self.strategy_id,
+            symbols=[symbols[row] for row in rows[ticks].tolist()],
+            timestamps=timestamps[ticks],
+            buy=np.concatenate(buys)[arrival],
+            strengths=np.concatenate(strengths)[arrival],
+        )
+
+    def _step(self, rows: np.ndarray, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Push one price into each (distinct) row and evaluate the rows whose windows are full."""
+
+        window = self.window
+        seen = self._seen[rows]
+        self._prices[rows, seen % window] = prices
+        seen += 1
+        self._seen[rows] = seen
+        ready = seen >= window
+        rows, seen = rows[ready], seen[ready]
+        # Gather each ready row oldest-first and sum left to right, matching sum(deque).
+        columns = (seen[:, None] + np.arange(window)) % window
+        history = self._prices[rows[:, None], columns]
+        short_avg = np.cumsum(history[:, window - self.short_window :], axis=1)[:, -1] / self.short_window
+        long_avg = np.cumsum(history[:, window - self.long_window :], axis=1)[:, -1] / self.long_window
+        return short_avg > long_avg, np.abs(short_avg - long_avg), ready
+
+    def _grow(self) -> None:
+        capacity = len(self._seen) * 2
+        prices = np.zeros((capacity, self.window))
+        prices[: len(self._prices)] = self._prices
+        self._prices = prices
+        self._seen = np.concatenate([self._seen, np.zeros(capacity - len(self._seen), dtype=np.int64)])
+        self._warm_until = np.concatenate([self._warm_until, np.full(capacity - len(self._warm_until), -np.inf)])
+
+    def _empty(self) -> SignalBatch:
+        return SignalBatch(self.strategy_id, [], np.empty(0), np.empty(0, dtype=bool), np.empty(0))
@@ -1,5 +1,7 @@
 from collections import deque
-from typing import Callable, Deque, Optional
+from typing import Callable, Deque, Optional, Sequence
+
+import numpy as np
 
 from ..models import OrderSide, Signal, Tick
 from .base import StrategyBase
@@ -21,8 +23,25 @@ class GoldenCrossStrategy(StrategyBase):
         self.id_generator = id_generator
         self._short: Deque[float] = deque(maxlen=short_window)
         self._long: Deque[float] = deque(maxlen=long_window)
+        self._warm_until = float("-inf")
+
+    def warmup(self, symbol: str, prices: Sequence[float], timestamps: Sequence[float]) -> None:
+        """Load the trailing windows from history in one slice.
+
+        Live ticks stamped at or before the last historical timestamp are
+        ignored afterwards so the overlap is not counted twice.
+        """
+        closes = np.asarray(prices, dtype=np.float64)
+        if not len(closes):
+            return
+        tail = closes[-self.long_window :].tolist()
+        self._long.extend(tail)
+        self._short.extend(tail[-self.short_window :])
+        self._warm_until = max(self._warm_until, float(timestamps[-1]))
 
     def on_tick(self, tick: Tick) -> Optional[Signal]:
+        if tick.timestamp <= self._warm_until:
+            return None
         self._short.append(tick.price)
         self._long.append(tick.price)
         if len(self._short) < self.short_window or len(self._long) < self.long_window:
@@ -0,0 +1,106 @@
+import math
+import pickle
+import struct
+from typing import Any, Callable, Dict, Tuple, Type
+from uuid import UUID
+
+from ..domain.events import FillEvent, OrderEvent, SignalEvent, TickEvent
+
+# One tag byte, then fixed-width fields, then the UTF-8 strings the
+# fixed part gives lengths for. Anything else is pickled under tag 0.
+_PICKLE = 0
+_TICK = 1
+_SIGNAL = 2
+_ORDER = 3
+_FILL = 4
+
+_SIDES = {"BUY": 0, "SELL": 1}
+_SIDE_NAMES = ("BUY", "SELL")
+
+_TICK_FORMAT = struct.Struct("<BddB")
+_SIGNAL_FORMAT = struct.Struct("<Bdd16sBBB")
+_TRADE_FORMAT = struct.Struct("<Bdd16sBB")
+
+
+def _encode_tick(event: TickEvent) -> bytes:
+    symbol = event.symbol.encode()
+    return _TICK_FORMAT.pack(_TICK, event.price, event.timestamp, len(symbol)) + symbol
+
+
+def _encode_signal(event: SignalEvent) -> bytes:
+    symbol = event.symbol.encode()
+    strategy = event.strategy_id.encode()
+    return (
+        _SIGNAL_FORMAT.pack(
+            _SIGNAL,
+            event.timestamp,
+            event.strength,
+            event.signal_id.bytes,
+            _SIDES[event.side],
+            len(symbol),
+            len(strategy),
+        )
+        + symbol
+        + strategy
+    )
+
+
+def _encode_trade(tag: int, price: float, event: Any) -> bytes:
+    symbol = event.symbol.encode()
+    return (
+        _TRADE_FORMAT.pack(tag, event.quantity, price, event.client_order_id.bytes, _SIDES[event.side], len(symbol))
+        + symbol
+    )
+
+
+_ENCODERS: Dict[Type[Any], Callable[[Any], bytes]] = {
+    TickEvent: _encode_tick,
+    SignalEvent: _encode_signal,
+    # NaN stands in for a market order's missing price.
+    OrderEvent: lambda event: _encode_trade(_ORDER, math.nan if event.price is None else event.price, event),
+    FillEvent: lambda event: _encode_trade(_FILL, event.price, event),
+}
+
+
+def encode(obj: Any) -> bytes:
+    """Serialize a domain event compactly; other picklable objects fall back to pickle."""
+
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is not None:
+        try:
+            return encoder(obj)
+        except (KeyError, struct.error):
+            pass  # unexpected side or over-long string
+    return bytes((_PICKLE,)) + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode(data: bytes) -> Any:
+    tag = data[0]
+    if tag == _TICK:
+        _, price, timestamp, symbol_length = _TICK_FORMAT.unpack_from(data)
+        offset = _TICK_FORMAT.size
+        return TickEvent(data[offset : offset + symbol_length].decode(), price, timestamp)
+    if tag == _SIGNAL:
+        _, timestamp, strength, signal_id, side, symbol_length, strategy_length = _SIGNAL_FORMAT.unpack_from(data)
+        offset = _SIGNAL_FORMAT.size
+        symbol, strategy = _strings(data, offset, symbol_length, strategy_length)
+        return SignalEvent(symbol, strategy, timestamp, _SIDE_NAMES[side], strength, UUID(bytes=signal_id))
+    if tag in (_ORDER, _FILL):
+        _, quantity, price, order_id, side, symbol_length = _TRADE_FORMAT.unpack_from(data)
+        symbol = data[_TRADE_FORMAT.size : _TRADE_FORMAT.size + symbol_length].decode()
+        if tag == _ORDER:
+            return OrderEvent(
+                symbol, _SIDE_NAMES[side], quantity, None if math.isnan(price) else price, UUID(bytes=order_id)
+            )
+        return FillEvent(symbol, _SIDE_NAMES[side], quantity, price, UUID(bytes=order_id))
+    if tag == _PICKLE:
+        return pickle.loads(data[1:])
+    raise ValueError(f"Unknown event tag {tag}")
+
+
+def _strings(data: bytes, offset: int, *lengths: int) -> Tuple[str, ...]:
+    values = []
+    for length in lengths:
+        values.append(data[offset : offset + length].decode())
+        offset += length
+    return tuple(values)
@@ -1,8 +1,239 @@
+import atexit
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, TextIO
+
 import structlog
 from structlog.stdlib import BoundLogger
 
+Renderer = Callable[[Any, str, MutableMapping[str, Any]], str]
+
+# Run on the logging thread before an event is handed off: bound contextvars,
+# exception info and stack info only exist there.
+CALL_SITE_PROCESSORS: List[Any] = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.dev.set_exc_info,
+    structlog.processors.format_exc_info,
+]
+
+_STOP = object()
+_FLUSH = object()
+
 
 def get_logger(name: str) -> BoundLogger:
     """Return a structlog bound logger for the given module name."""
 
     return structlog.get_logger(name)
+
+
+class _TokenBucket:
+    """Per-event rate limiter refilled from a monotonic clock."""
+
+    __slots__ = ("rate", "tokens", "updated")
+
+    def __init__(self, rate: float, now: float) -> None:
+        self.rate = rate
+        self.tokens = rate
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class AsyncLogSink:
+    """Structlog processor that moves rendering and I/O off the calling thread.
+
+    On the hot path the raw event dict is stamped, passed through per-event
+    sampling and rate limits, and enqueued without blocking. A daemon thread
+    renders and writes queued events and periodically emits a
+    ``log_events_suppressed`` summary for everything that was sampled out,
+    rate limited or dropped because the queue was full.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        renderer: Optional[Renderer] = None,
+        sample_every: Optional[Mapping[str, int]] = None,
+        rate_limits: Optional[Mapping[str, float]] = None,
+        max_queue: int = 100_000,
+        summary_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.renderer: Renderer = renderer or structlog.processors.JSONRenderer()
+        self.sample_every = dict(sample_every or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.summary_interval = summary_interval
+        self.clock = clock
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._seen: Dict[str, int] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._suppressed_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __call__(self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]) -> Any:
+        """Enqueue the event dict for background rendering and drop it from the chain."""
+
+        self.submit(event_dict)
+        raise structlog.DropEvent
+
+    def submit(self, event_dict: MutableMapping[str, Any]) -> None:
+        """Enqueue an already-built event dict, e.g. one forwarded from another process."""
+
+        if not self._closed:
+            event = event_dict.get("event")
+            if self._admit(event):
+                event_dict.setdefault("timestamp", time.time())
+                try:
+                    self._queue.put_nowait(event_dict)
+                except queue.Full:
+                    self._suppress("log_queue_full")
+
+    def _admit(self, event: Any) -> bool:
+        every = self.sample_every.get(event)
+        if every is not None and every > 1:
+            seen = self._seen.get(event, 0)
+            self._seen[event] = seen + 1
+            if seen % every:
+                self._suppress(event)
+                return False
+        rate = self.rate_limits.get(event)
+        if rate is not None:
+            now = self.clock()
+            bucket = self._buckets.get(event)
+            if bucket is None:
+                bucket = self._buckets[event] = _TokenBucket(rate, now)
+            if not bucket.take(now):
+                self._suppress(event)
+                return False
+        return True
+
+    def _suppress(self, event: Any) -> None:
+        key = str(event)
+        with self._suppressed_lock:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+
+    def start(self) -> "AsyncLogSink":
+        """Start the background writer thread if it is not running."""
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="async-log-sink", daemon=True)
+            self._thread.start()
+        return self
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until everything enqueued so far has been written."""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop accepting events, write everything still queued and join the thread."""
+
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        else:
+            self._drain()
+        self._write_summary()
+        self.stream.flush()
+
+    def _run(self) -> None:
+        next_summary = self.clock() + self.summary_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=self.summary_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._drain()
+                return
+            if isinstance(item, tuple) and item and item[0] is _FLUSH:
+                self._drain()
+                self.stream.flush()
+                item[1].set()
+            elif item is not None:
+                self._write(item)
+            if self.clock() >= next_summary:
+                self._write_summary()
+                next_summary = self.clock() + self.summary_interval
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is _STOP:
+                continue
+            if isinstance(item, tuple) and item and item[0] is _FLUSH:
+                item[1].set()
+                continue
+            self._write(item)
+
+    def _write(self, event_dict: MutableMapping[str, Any]) -> None:
+        timestamp = event_dict.get("timestamp")
+        if isinstance(timestamp, float):
+            event_dict["timestamp"] = datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+        try:
+            line = self.renderer(None, event_dict.get("level", "info"), event_dict)
+        except Exception as exc:  # never let a bad event kill the writer thread
+            line = f"log_render_failed event={event_dict.get('event')!r} error={exc!r}"
+        self.stream.write(line + "\n")
+
+    def _write_summary(self) -> None:
+        with self._suppressed_lock:
+            suppressed, self._suppressed = self._suppressed, {}
+        if suppressed:
+            self._write(
+                {
+                    "event": "log_events_suppressed",
+                    "level": "info",
+                    "timestamp": time.time(),
+                    "counts": suppressed,
+                }
+            )
+
+
+def configure_async_logging(
+    stream: Optional[TextIO] = None,
+    sample_every: Optional[Mapping[str, int]] = None,
+    rate_limits: Optional[Mapping[str, float]] = None,
+    max_queue: int = 100_000,
+    summary_interval: float = 5.0,
+) -> AsyncLogSink:
+    """Route all structlog loggers through a started AsyncLogSink flushed at exit."""
+
+    sink = AsyncLogSink(
+        stream=stream,
+        sample_every=sample_every,
+        rate_limits=rate_limits,
+        max_queue=max_queue,
+        summary_interval=summary_interval,
+    ).start()
+    structlog.configure(
+        processors=[*CALL_SITE_PROCESSORS, sink],
+        cache_logger_on_first_use=True,
+    )
+    atexit.register(sink.close)
+    return sink
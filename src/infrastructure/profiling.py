@@ -0,0 +1,196 @@
+import asyncio
+import contextvars
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+_parent_children: contextvars.ContextVar[Optional[List[float]]] = contextvars.ContextVar(
+    "profiler_parent_children", default=None
+)
+
+
+@dataclass
+class HandlerStats:
+    """Accumulated wall time for one handler; self time excludes nested profiled handlers."""
+
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+    max: float = 0.0
+
+
+def _handler_name(handler: Callable[..., Any]) -> str:
+    module = getattr(handler, "__module__", None) or "?"
+    name = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    return f"{module}.{name}"
+
+
+class HandlerProfiler:
+    """Per-handler call counts and cumulative/self time, toggled at runtime.
+
+    EventBus and PartitionedEngine route handler calls through ``dispatch``,
+    which goes through ``run`` only while ``enabled`` is set, so a disabled
+    profiler costs one attribute check per dispatch. Nested dispatch in the same task (a tick handler
+    publishing a signal) is subtracted from the outer handler's self time.
+    Times are wall-clock and include any awaits inside the handler.
+    """
+
+    def __init__(self, enabled: bool = False, timer: Callable[[], float] = time.perf_counter) -> None:
+        self.enabled = enabled
+        self.timer = timer
+        self._stats: Dict[str, HandlerStats] = {}
+        self._names: Dict[Any, str] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    def snapshot(self) -> Dict[str, HandlerStats]:
+        return {
+            name: HandlerStats(stats.calls, stats.total, stats.self_time, stats.max)
+            for name, stats in self._stats.items()
+        }
+
+    @staticmethod
+    def dispatch(
+        profiler: Optional["HandlerProfiler"], handler: Callable[[Any], Awaitable[None]], event: Any
+    ) -> Awaitable[None]:
+        """Call ``handler(event)``, through ``profiler.run`` while a profiler is set and enabled."""
+
+        if profiler is not None and profiler.enabled:
+            return profiler.run(handler, event)
+        return handler(event)
+
+    async def run(self, handler: Callable[[Any], Awaitable[None]], event: Any) -> None:
+        name = self._names.get(handler)
+        if name is None:
+            name = self._names[handler] = _handler_name(handler)
+        children = [0.0]
+        token = _parent_children.set(children)
+        started = self.timer()
+        try:
+            await handler(event)
+        finally:
+            elapsed = self.timer() - started
+            _parent_children.reset(token)
+            parent = _parent_children.get()
+            if parent is not None:
+                parent[0] += elapsed
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = HandlerStats()
+            stats.calls += 1
+            stats.total += elapsed
+            stats.self_time += elapsed - children[0]
+            if elapsed > stats.max:
+                stats.max = elapsed
+
+    def calibrate(self, calls: int = 10_000) -> float:
+        """Measure the added cost of profiling one handler call, in seconds."""
+
+        async def noop(event: Any) -> None:
+            return None
+
+        def drive(coro: Awaitable[None]) -> None:
+            try:
+                coro.send(None)  # type: ignore[attr-defined]
+            except StopIteration:
+                pass
+
+        stats = dict(self._stats)
+        try:
+            started = self.timer()
+            for _ in range(calls):
+                drive(noop(None))
+            direct = self.timer() - started
+            started = self.timer()
+            for _ in range(calls):
+                drive(self.run(noop, None))
+            profiled = self.timer() - started
+        finally:
+            self._stats = stats
+        return max(0.0, (profiled - direct) / calls)
+
+
+class StackSampler:
+    """Low-rate sampler of one thread's Python stack into collapsed-stack counts.
+
+    A daemon thread wakes every ``interval`` seconds and records the target
+    thread's stack as ``outer;...;inner``, the format flamegraph.pl and
+    speedscope read. The time spent sampling is measured; whenever it
+    exceeds ``max_overhead`` of the interval the interval is doubled.
+    """
+
+    def __init__(
+        self, interval: float = 0.01, max_overhead: float = 0.01, thread_id: Optional[int] = None
+    ) -> None:
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter[str] = Counter()
+        self.sampling_time = 0.0
+        self.wall_time = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def overhead(self) -> float:
+        return self.sampling_time / self.wall_time if self.wall_time else 0.0
+
+    def start(self) -> "StackSampler":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> str:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.collapsed()
+
+    async def sample_for(self, duration: float) -> str:
+        """Sample while the caller's loop keeps running for ``duration`` seconds."""
+
+        self.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            self.stop()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+    def dump(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(self.collapsed() + "\n")
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            sample_started = time.perf_counter()
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+            del frame
+            now = time.perf_counter()
+            cost = now - sample_started
+            self.sampling_time += cost
+            self.wall_time = now - started
+            if cost > self.max_overhead * self.interval:
+                self.interval *= 2
@@ -1,5 +1,6 @@
-import asyncio
-from typing import Callable, TypeVar
+from typing import Callable, Optional, TypeVar
+
+from .clock import Scheduler
 
 T = TypeVar("T")
 
@@ -7,9 +8,12 @@ T = TypeVar("T")
 class CircuitBreaker:
     """Simple circuit breaker to guard external calls."""
 
-    def __init__(self, max_failures: int = 5, reset_timeout: float = 60.0) -> None:
+    def __init__(
+        self, max_failures: int = 5, reset_timeout: float = 60.0, scheduler: Optional[Scheduler] = None
+    ) -> None:
         self.max_failures = max_failures
         self.reset_timeout = reset_timeout
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
         self.failures = 0
         self.open = False
 
@@ -24,6 +28,6 @@ class CircuitBreaker:
             self.failures += 1
             if self.failures >= self.max_failures:
                 self.open = True
-                await asyncio.sleep(self.reset_timeout)
+                await self.scheduler.sleep(self.reset_timeout)
                 self.open = False
             raise
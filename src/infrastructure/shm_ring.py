@@ -0,0 +1,152 @@
+import struct
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+# Header fields sit on separate 64-byte lines so the producer and the
+# consumer never write to the same cache line.
+_HEAD = 0
+_TAIL = 64
+_DROPPED = 128
+_CLOSED = 192
+_DATA = 256
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_WRAP = 0xFFFFFFFF
+
+
+def _record_size(length: int) -> int:
+    return (_U32.size + length + 7) & ~7
+
+
+class SharedRing:
+    """Single-producer single-consumer byte ring in shared memory.
+
+    Records are length-prefixed and 8-byte aligned; a record that does not
+    fit before the end of the buffer is preceded by a wrap marker and
+    written at the start. ``head`` and ``tail`` are monotonically
+    increasing byte counters written only by the producer and the consumer
+    respectively, and the producer publishes ``head`` only after the record
+    bytes are in place, so neither side takes a lock. Writes never wait:
+    when the consumer has fallen a full buffer behind, ``try_write`` drops
+    the record and counts it in ``dropped``.
+
+    Relies on aligned 8-byte stores being atomic and not reordered with
+    earlier stores, which holds for CPython on x86-64.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool) -> None:
+        self._memory = memory
+        self._owner = owner
+        self._buf = memory.buf
+        self.capacity = memory.size - _DATA
+        # Each side caches its own counter; only the peer's is read from shared memory.
+        self._head = self._load(_HEAD)
+        self._tail = self._load(_TAIL)
+        self._dropped = self._load(_DROPPED)
+
+    @classmethod
+    def create(cls, capacity: int, name: Optional[str] = None) -> "SharedRing":
+        if capacity < 64:
+            raise ValueError("capacity must be at least 64 bytes")
+        capacity = _record_size(capacity - _U32.size)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=_DATA + capacity)
+        memory.buf[:_DATA] = bytes(_DATA)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRing":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def dropped(self) -> int:
+        return self._load(_DROPPED)
+
+    @property
+    def closed(self) -> bool:
+        """True once the producer has called ``close_writer``."""
+
+        return bool(self._load(_CLOSED))
+
+    @property
+    def pending(self) -> int:
+        """Bytes written but not yet consumed."""
+
+        return self._load(_HEAD) - self._load(_TAIL)
+
+    def try_write(self, payload: bytes) -> bool:
+        """Append one record without blocking; False if it was dropped."""
+
+        length = len(payload)
+        size = _record_size(length)
+        head = self._head
+        offset = head % self.capacity
+        skip = self.capacity - offset if offset + size > self.capacity else 0
+        if skip + size > self.capacity - (head - self._tail):
+            self._tail = self._load(_TAIL)
+            if skip + size > self.capacity - (head - self._tail):
+                self._dropped += 1
+                self._store(_DROPPED, self._dropped)
+                return False
+        if skip:
+            if skip >= _U32.size:
+                _U32.pack_into(self._buf, _DATA + offset, _WRAP)
+            head += skip
+            offset = 0
+        start = _DATA + offset
+        _U32.pack_into(self._buf, start, length)
+        self._buf[start + _U32.size : start + _U32.size + length] = payload
+        self._head = head + size
+        self._store(_HEAD, self._head)
+        return True
+
+    def read(self) -> Optional[bytes]:
+        """Pop the oldest record, or None if the ring is empty."""
+
+        records = self.read_many(1)
+        return records[0] if records else None
+
+    def read_many(self, limit: int = 1024) -> List[bytes]:
+        """Pop up to ``limit`` records in write order."""
+
+        head = self._load(_HEAD)
+        tail = self._tail
+        records: List[bytes] = []
+        while tail < head and len(records) < limit:
+            offset = tail % self.capacity
+            remaining = self.capacity - offset
+            if remaining < _U32.size:
+                tail += remaining
+                continue
+            (length,) = _U32.unpack_from(self._buf, _DATA + offset)
+            if length == _WRAP:
+                tail += remaining
+                continue
+            start = _DATA + offset + _U32.size
+            records.append(bytes(self._buf[start : start + length]))
+            tail += _record_size(length)
+        if tail != self._tail:
+            self._tail = tail
+            self._store(_TAIL, tail)
+        return records
+
+    def close_writer(self) -> None:
+        self._store(_CLOSED, 1)
+
+    def close(self) -> None:
+        """Release this process's mapping; the owner also unlinks the segment."""
+
+        self._buf = None  # type: ignore[assignment]
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def _load(self, offset: int) -> int:
+        return _U64.unpack_from(self._buf, offset)[0]
+
+    def _store(self, offset: int, value: int) -> None:
+        _U64.pack_into(self._buf, offset, value)
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Union
 
-from ..domain.events import FillEvent, OrderEvent
+from ..domain.events import FillEvent, OrderEvent, OrderRejectedEvent
+
+ExecutionReport = Union[FillEvent, OrderRejectedEvent]
 
 
 class BrokerPort(ABC):
@@ -15,5 +18,6 @@ class BrokerPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def stream_fills(self) -> FillEvent:
+    async def stream_fills(self) -> ExecutionReport:
+        """Wait for the next fill, or rejection of a submitted order."""
         raise NotImplementedError
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+
+class HistoricalDataPort(ABC):
+    """Abstract store of historical bars and ticks as NumPy columns."""
+
+    @abstractmethod
+    async def load(
+        self, kind: str, symbols: Sequence[str], start: float, end: float
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def append(self, kind: str, symbol: str, day: date, columns: Mapping[str, np.ndarray]) -> None:
+        raise NotImplementedError
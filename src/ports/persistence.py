@@ -1,10 +1,41 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, List, Optional, Sequence, Type
 
+from ..domain.models import Bucket
 
-class PersistencePort(ABC):
-    """Abstract persistence layer for events."""
+
+class EventSinkPort(ABC):
+    """Write side of persistence: where the trading loop records events."""
+
+    async def connect(self) -> None:
+        """Open connections; adapters without any keep this no-op."""
+
+    async def close(self) -> None:
+        """Flush buffered writes and release connections."""
 
     @abstractmethod
     async def persist_event(self, event: Any) -> None:
         raise NotImplementedError
+
+
+class PersistencePort(EventSinkPort):
+    """Abstract persistence layer for events: writes plus historical reads."""
+
+    @abstractmethod
+    def stream_events(
+        self,
+        event_type: Type[Any],
+        start: float,
+        end: float,
+        symbols: Optional[Sequence[str]] = None,
+        chunk_size: int = 10_000,
+    ) -> AsyncIterator[List[Any]]:
+        """Yield stored events with ``start <= time < end`` in time order, ``chunk_size`` at a time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def downsample(
+        self, event_type: Type[Any], symbol: str, start: float, end: float, interval: float
+    ) -> List[Bucket]:
+        """Summarize the event's value (price, or strength for signals) per ``interval`` seconds."""
+        raise NotImplementedError
@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """One overlapping window of a research document's text."""
+
+    content_hash: str
+    source: str
+    index: int
+    text: str
+    symbol: Optional[str] = None
+    date: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class IngestResult:
+    documents: int
+    skipped: int
+    failed: int
+    chunks: int
+    embedded: int
+    cached: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class QueryHit:
+    chunk: Chunk
+    score: float
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    query_id: str
+    question: str
+    hits: Tuple[QueryHit, ...]
+    seconds: float
+    cached: bool = False
+
+
+class EmbedderPort(ABC):
+    """Abstract text embedding model."""
+
+    name: str
+    dimension: int
+
+    @abstractmethod
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(texts), dimension)`` float32 array."""
+        raise NotImplementedError
+
+
+class ResearchPort(ABC):
+    """Abstract research corpus."""
+
+    @abstractmethod
+    async def ingest(self, paths: Iterable[Union[str, Path]]) -> IngestResult:
+        """Ingest documents; directories are searched recursively."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        question: str,
+        top_k: int = 5,
+        symbols: Optional[Sequence[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> QueryResult:
+        """Return the ``top_k`` chunks most similar to ``question``, optionally filtered by symbol and date."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rate(self, query_id: str, rating: int) -> None:
+        """Record feedback (1-5) on a previous query result."""
+        raise NotImplementedError
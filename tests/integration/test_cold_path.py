@@ -0,0 +1,121 @@
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+from uuid import uuid4
+
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from src.adapters.persistence.timescale import TimescaleRepository
+from src.application.cold_path import ColdPathPersistence, ColdPathProcess, ColdPathService
+from src.domain.events import FillEvent, TickEvent
+from src.infrastructure.event_codec import decode, encode
+from src.infrastructure.logging import AsyncLogSink
+
+
+class _RecordingRepository(TimescaleRepository):
+    """Writes what it received to COLD_PATH_TEST_OUTPUT on close so the parent can check it."""
+
+    def __init__(self) -> None:
+        super().__init__(dsn="memory://")
+        self.received: List[Any] = []
+
+    async def persist_event(self, event: Any) -> None:
+        self.received.append(event)
+        await super().persist_event(event)
+
+    async def close(self) -> None:
+        Path(os.environ["COLD_PATH_TEST_OUTPUT"]).write_text("\n".join(encode(e).hex() for e in self.received))
+
+
+def _recording_service(log_sink: Optional[AsyncLogSink]) -> ColdPathService:
+    return ColdPathService(_RecordingRepository(), log_sink=log_sink)
+
+
+def _sink_settings_service(log_sink: Optional[AsyncLogSink]) -> ColdPathService:
+    assert log_sink is not None
+    settings = {"sample_every": log_sink.sample_every, "rate_limits": log_sink.rate_limits}
+    Path(os.environ["COLD_PATH_TEST_OUTPUT"]).write_text(json.dumps(settings))
+    return ColdPathService(TimescaleRepository(dsn="memory://"), log_sink=log_sink)
+
+
+def _failing_service(log_sink: Optional[AsyncLogSink]) -> ColdPathService:
+    raise RuntimeError("cold-path adapters unavailable")
+
+
+@pytest.mark.integration
+def test_cold_path_process_persists_forwarded_events(tmp_path, monkeypatch):
+    output = tmp_path / "received.txt"
+    monkeypatch.setenv("COLD_PATH_TEST_OUTPUT", str(output))
+    cold_path = ColdPathProcess(capacity=1 << 16, factory=_recording_service).start()
+    persistence = ColdPathPersistence(cold_path)
+    events = [TickEvent(symbol="AAPL", price=100.0 + idx, timestamp=float(idx)) for idx in range(500)]
+    events.append(FillEvent(symbol="AAPL", side="BUY", quantity=1, price=100.0, client_order_id=uuid4()))
+
+    async def _run() -> None:
+        for event in events:
+            await persistence.persist_event(event)
+
+    asyncio.run(_run())
+    with pytest.raises(structlog.DropEvent):
+        cold_path.log_processor(None, "info", {"event": "forwarded", "level": "info"})
+    cold_path.stop()
+
+    assert not cold_path.alive
+    assert cold_path.dropped == 0
+    received = [decode(bytes.fromhex(line)) for line in output.read_text().splitlines()]
+    assert received == events
+
+
+@pytest.mark.integration
+def test_cold_path_child_log_sink_uses_sampling_and_rate_limits(tmp_path, monkeypatch):
+    output = tmp_path / "sink.json"
+    monkeypatch.setenv("COLD_PATH_TEST_OUTPUT", str(output))
+    cold_path = ColdPathProcess(
+        capacity=1 << 16,
+        factory=_sink_settings_service,
+        sample_every={"tick_received": 100},
+        rate_limits={"risk_validation_failed": 10.0},
+    ).start()
+    cold_path.stop()
+
+    assert json.loads(output.read_text()) == {
+        "sample_every": {"tick_received": 100},
+        "rate_limits": {"risk_validation_failed": 10.0},
+    }
+
+
+@pytest.mark.integration
+def test_cold_path_check_reports_drops_and_a_dead_child():
+    cold_path = ColdPathProcess(capacity=1 << 10, factory=_failing_service).start()
+    deadline = time.monotonic() + 30.0
+    while cold_path.alive and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for idx in range(100):
+        cold_path.publish(TickEvent(symbol="AAPL", price=100.0, timestamp=float(idx)))
+    dropped = cold_path.dropped
+    assert dropped > 0
+
+    with capture_logs() as logs:
+        assert not cold_path.check()
+        assert not cold_path.check()
+    event = {"event": "forwarded", "level": "info"}
+    assert cold_path.log_processor(None, "info", event) is event
+    cold_path.stop()
+
+    assert [log["event"] for log in logs] == ["cold_path_died", "cold_path_dropped"]
+    assert logs[0]["exitcode"] != 0
+    assert logs[1]["dropped"] == dropped
+
+
+@pytest.mark.integration
+def test_cold_path_log_processor_passes_events_through_when_not_running():
+    cold_path = ColdPathProcess()
+    event = {"event": "tick", "level": "info"}
+    assert cold_path.log_processor(None, "info", event) is event
+    with pytest.raises(RuntimeError):
+        cold_path.publish(event)
@@ -0,0 +1,62 @@
+import asyncio
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.adapters.history.columnar import ColumnarHistoryStore
+
+DAY = 86_400.0
+
+
+def _bars(day_index: int, count: int = 390) -> dict:
+    timestamps = day_index * DAY + np.arange(count) * 60.0
+    close = 100.0 + day_index + np.arange(count) / 1000.0
+    return {
+        "timestamp": timestamps,
+        "open": close,
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close,
+        "volume": np.full(count, 1000.0),
+    }
+
+
+@pytest.mark.integration
+def test_columnar_store_appends_days_and_reads_memmapped_ranges(tmp_path):
+    store = ColumnarHistoryStore(tmp_path / "store")
+    assert not (tmp_path / "store").exists()
+    with store.batch():
+        for day_index in range(3):
+            store.write_day("bars", "AAPL", date(2024, 1, 2 + day_index), _bars(day_index))
+    store.write_day("bars", "MSFT", date(2024, 1, 2), _bars(0, count=10))
+
+    reopened = ColumnarHistoryStore(tmp_path / "store")
+    assert reopened.days("bars", "AAPL") == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+    result = reopened.read("bars", ["AAPL", "MSFT", "NVDA"], start=DAY + 30.0, end=2 * DAY + 120.0)
+    assert set(result) == {"AAPL", "MSFT"}
+    aapl = result["AAPL"]
+    assert len(aapl["close"]) == 389 + 2
+    assert aapl["timestamp"][0] == DAY + 60.0
+    assert isinstance(aapl["close"].base, np.memmap)
+    assert len(result["MSFT"]["close"]) == 0
+
+    loaded = asyncio.run(reopened.load("bars", ["AAPL"], 0.0, 3 * DAY))
+    assert len(loaded["AAPL"]["timestamp"]) == 3 * 390
+
+
+@pytest.mark.integration
+def test_columnar_store_rejects_out_of_order_days_and_recovers_partial_writes(tmp_path):
+    store = ColumnarHistoryStore(tmp_path)
+    store.write_day("bars", "AAPL", date(2024, 1, 3), _bars(1))
+    with pytest.raises(ValueError):
+        store.write_day("bars", "AAPL", date(2024, 1, 2), _bars(0))
+
+    with open(tmp_path / "bars" / "AAPL" / "close.f64", "ab") as handle:
+        handle.write(b"\x00" * 64)
+    store.write_day("bars", "AAPL", date(2024, 1, 4), _bars(2))
+
+    closes = store.read("bars", ["AAPL"], 0.0, 10 * DAY)["AAPL"]["close"]
+    assert len(closes) == 780
+    assert closes[390] == pytest.approx(102.0)
@@ -0,0 +1,122 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from src.adapters.market_data.pacing import Pacer
+from src.adapters.market_data.replay import FileReplayStream, read_tick_chunks
+from src.adapters.market_data.synthetic import SyntheticStream, SyntheticSymbol, u_shaped_profile
+from src.domain.events import TickEvent
+from src.infrastructure.clock import Scheduler, VirtualClock
+
+
+def _collector():
+    received = defaultdict(list)
+
+    async def handler(event: TickEvent) -> None:
+        received[event.symbol].append(event)
+
+    return received, handler
+
+
+@pytest.mark.integration
+def test_synthetic_stream_paces_rates_in_virtual_time():
+    scheduler = Scheduler(VirtualClock())
+    stream = SyntheticStream(
+        [SyntheticSymbol("AAPL", rate=3000.0), SyntheticSymbol("MSFT", price=300.0, rate=1000.0)],
+        duration=5.0,
+        chunk_seconds=0.01,
+        seed=7,
+        scheduler=scheduler,
+    )
+    received, handler = _collector()
+
+    async def main() -> None:
+        await stream.subscribe("AAPL", handler)
+        await stream.subscribe("MSFT", handler)
+        await stream.start()
+
+    scheduler.run(main())
+
+    assert stream.emitted == pytest.approx(20_000, rel=0.01)
+    assert stream.pacer.elapsed() == pytest.approx(5.0, rel=0.01)
+    assert len(received["AAPL"]) / len(received["MSFT"]) == pytest.approx(3.0, rel=0.1)
+    timestamps = [tick.timestamp for tick in received["AAPL"]]
+    assert timestamps == sorted(timestamps)
+    assert all(tick.price > 0 for tick in received["MSFT"])
+    assert received["MSFT"][-1].price == pytest.approx(300.0, rel=0.05)
+
+
+@pytest.mark.integration
+def test_synthetic_stream_burst_profile_and_unthrottled_mode():
+    session = 100.0
+    stream = SyntheticStream(
+        [SyntheticSymbol("AAPL", rate=100.0)],
+        model="random_walk",
+        profile=u_shaped_profile(width=0.05),
+        session_seconds=session,
+        duration=session,
+        speed=None,
+        seed=1,
+    )
+    received, handler = _collector()
+
+    async def main() -> None:
+        await stream.subscribe("AAPL", handler)
+        await stream.start()
+
+    asyncio.run(main())
+
+    opening = sum(1 for tick in received["AAPL"] if tick.timestamp < 10.0)
+    midday = sum(1 for tick in received["AAPL"] if 45.0 <= tick.timestamp < 55.0)
+    assert opening > 2 * midday
+
+
+@pytest.mark.integration
+def test_file_replay_streams_chunks_at_fixed_rate(tmp_path):
+    path = tmp_path / "ticks.csv"
+    rows = ["timestamp,symbol,price"] + [f"{idx},{'AAPL' if idx % 2 else 'MSFT'},{100 + idx}" for idx in range(1000)]
+    path.write_text("\n".join(rows))
+    assert [len(chunk) for chunk in read_tick_chunks(path, chunk_size=400)] == [400, 400, 200]
+
+    scheduler = Scheduler(VirtualClock())
+    stream = FileReplayStream([path], rate=500.0, chunk_size=400, pace_every=50, scheduler=scheduler)
+    received, handler = _collector()
+
+    async def main() -> None:
+        await stream.subscribe("AAPL", handler)
+        await stream.start()
+
+    scheduler.run(main())
+
+    assert stream.emitted == 1000
+    assert [tick.price for tick in received["AAPL"]][:3] == [101.0, 103.0, 105.0]
+    assert stream.pacer.elapsed() == pytest.approx(2.0)
+
+
+class _RecordingScheduler(Scheduler):
+    def __init__(self) -> None:
+        super().__init__(VirtualClock())
+        self.sleeps = []
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        await super().sleep(delay)
+
+
+@pytest.mark.integration
+def test_pacer_sleeps_on_its_scheduler():
+    scheduler = _RecordingScheduler()
+    pacer = Pacer(speed=2.0, scheduler=scheduler)
+    unpaced = Pacer(speed=None, scheduler=scheduler)
+
+    async def main() -> None:
+        await pacer.wait(1.0)
+        await pacer.wait(3.0)
+        await pacer.wait(2.0)
+        await unpaced.wait(100.0)
+
+    scheduler.run(main())
+
+    assert scheduler.sleeps == [pytest.approx(0.5), pytest.approx(1.0), 0, 0]
+    assert pacer.elapsed() == pytest.approx(1.5)
@@ -0,0 +1,192 @@
+import asyncio
+import os
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.adapters.research.chunking import chunk_words, filename_metadata
+from src.adapters.research.embedding import HashingEmbedder
+from src.adapters.research.index import FlatIndex, IVFIndex
+from src.adapters.research.local import LocalResearch
+
+
+def _words(prefix: str, count: int) -> str:
+    return " ".join(f"{prefix}{idx}" for idx in range(count))
+
+
+@pytest.mark.integration
+def test_chunk_words_overlaps_windows():
+    chunks = chunk_words(_words("w", 2000), size=1000, overlap=150)
+    assert [len(chunk.split()) for chunk in chunks] == [1000, 1000, 300]
+    assert chunks[1].split()[0] == "w850"
+    assert chunk_words(_words("w", 100)) == [_words("w", 100)]
+    assert chunk_words("   ") == []
+
+
+@pytest.mark.integration
+def test_hashing_embedder_is_deterministic_and_normalized():
+    embedder = HashingEmbedder(dimension=64)
+    vectors = asyncio.run(embedder.embed(["alpha beta gamma", "alpha beta gamma", "delta", ""]))
+    assert vectors.shape == (4, 64)
+    assert np.array_equal(vectors[0], vectors[1])
+    assert np.linalg.norm(vectors[0]) == pytest.approx(1.0)
+    assert not vectors[3].any()
+
+
+@pytest.mark.integration
+def test_ingest_skips_unchanged_files_and_reuses_cached_embeddings(tmp_path):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "AAPL_2024-05-01_note.txt").write_text(_words("apple", 1200))
+    (corpus / "MSFT_2024-05-02_memo.md").write_text(_words("soft", 500))
+    (corpus / "ignored.csv").write_text("a,b")
+
+    def build() -> LocalResearch:
+        return LocalResearch(tmp_path / "store", HashingEmbedder(dimension=32), workers=2, embed_batch=2)
+
+    first_run = build()
+    assert not (tmp_path / "store").exists()
+    first = asyncio.run(first_run.ingest([corpus]))
+    assert (first.documents, first.chunks, first.embedded, first.cached) == (2, 3, 3, 0)
+
+    research = build()
+    again = asyncio.run(research.ingest([corpus]))
+    assert (again.documents, again.skipped, again.embedded) == (0, 2, 0)
+    chunks = research.chunks(corpus / "AAPL_2024-05-01_note.txt")
+    assert [(chunk.index, chunk.symbol, chunk.date) for chunk in chunks] == [
+        (0, "AAPL", "2024-05-01"),
+        (1, "AAPL", "2024-05-01"),
+    ]
+
+    memo = corpus / "MSFT_2024-05-02_memo.md"
+    stat = memo.stat()
+    os.utime(memo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (corpus / "copy.txt").write_text(_words("soft", 500))
+    (corpus / "AAPL_2024-05-01_note.txt").write_text(_words("apple", 1000) + " revised")
+    changed = asyncio.run(research.ingest([corpus]))
+    assert (changed.documents, changed.skipped, changed.chunks) == (2, 1, 3)
+    # The revised note keeps its first chunk; only the tail window is new.
+    assert (changed.embedded, changed.cached) == (1, 2)
+    assert filename_metadata(corpus / "copy.txt") == (None, None)
+
+
+@pytest.mark.integration
+def test_ingest_extracts_pdf_text(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    with fitz.open() as document:
+        for line in ("nvidia datacenter revenue", "gpu supply constraints"):
+            document.new_page().insert_text((72, 72), line)
+        document.save(corpus / "NVDA_2024-05-22_earnings.pdf")
+    (corpus / "AAPL_2024-05-01_note.txt").write_text("iphone margins services growth")
+    research = LocalResearch(tmp_path / "store", HashingEmbedder(dimension=64), workers=1)
+
+    report = asyncio.run(research.ingest([corpus]))
+
+    assert (report.documents, report.chunks) == (2, 2)
+    [chunk] = research.chunks(corpus / "NVDA_2024-05-22_earnings.pdf")
+    assert chunk.text.split() == "nvidia datacenter revenue gpu supply constraints".split()
+    result = asyncio.run(research.query("gpu datacenter", top_k=1))
+    assert [hit.chunk.symbol for hit in result.hits] == ["NVDA"]
+
+
+@pytest.mark.integration
+def test_ivf_index_matches_exact_search_and_filters(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(400, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"doc#{idx}" for idx in range(400)]
+    symbols = ["AAPL" if idx % 2 else "MSFT" for idx in range(400)]
+    dates = [f"2024-05-{1 + idx % 28:02d}" for idx in range(400)]
+    exact = FlatIndex(tmp_path / "flat", 16)
+    exact.add(ids, vectors, symbols, dates)
+    ivf = IVFIndex(tmp_path / "ivf", 16, n_lists=8, n_probe=8, min_train=100)
+    ivf.add(ids[:300], vectors[:300], symbols[:300], dates[:300])
+    ivf.train()
+    ivf.add(ids[300:], vectors[300:], symbols[300:], dates[300:])
+
+    query = vectors[7]
+    # Probing every list is exact.
+    assert ivf.search(query, 10) == exact.search(query, 10)
+    assert exact.search(query, 1)[0][0] == "doc#7"
+    filtered = exact.search(query, 50, symbols=["MSFT"], start=date(2024, 5, 10), end=date(2024, 5, 12))
+    assert filtered and all(int(hit[0][4:]) % 2 == 0 and 9 <= int(hit[0][4:]) % 28 <= 11 for hit in filtered)
+    assert exact.search(query, 5, symbols=["TSLA"]) == []
+
+    exact.remove(["doc#7"])
+    reopened = FlatIndex(tmp_path / "flat", 16)
+    assert len(reopened) == 399
+    assert reopened.search(query, 1)[0][0] != "doc#7"
+    reloaded = IVFIndex(tmp_path / "ivf", 16, n_lists=8, n_probe=8, min_train=100)
+    assert reloaded.trained
+    assert reloaded.search(query, 10) == ivf.search(query, 10)
+    assert reloaded.search(query, 10, n_probe=2)[0][0] == "doc#7"
+
+
+@pytest.mark.integration
+def test_ivf_index_trains_on_add_and_recovers_interrupted_training(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"doc#{idx}" for idx in range(300)]
+
+    def open_index() -> IVFIndex:
+        return IVFIndex(tmp_path / "ivf", 16, n_lists=8, n_probe=2, min_train=200)
+
+    index = open_index()
+    index.add(ids[:150], vectors[:150])
+    assert not index.trained
+    index.add(ids[150:], vectors[150:])
+    assert index.trained
+    expected = index.search(vectors[7], 5)
+    assert expected[0][0] == "doc#7"
+    lists = (tmp_path / "ivf" / "lists.i32").read_bytes()
+
+    # Crash after centroids.npy was committed but before lists.i32 was replaced.
+    (tmp_path / "ivf" / "lists.i32.tmp").write_bytes(lists)
+    np.full(300, -1, dtype="<i4").tofile(tmp_path / "ivf" / "lists.i32")
+    assert open_index().search(vectors[7], 5) == expected
+    assert not (tmp_path / "ivf" / "lists.i32.tmp").exists()
+
+    # Crash before the commit point: the staged retrain is discarded.
+    np.save(tmp_path / "ivf" / "centroids.tmp.npy", np.zeros((8, 16), dtype=np.float32))
+    (tmp_path / "ivf" / "lists.i32.tmp").write_bytes(np.zeros(300, dtype="<i4").tobytes())
+    assert open_index().search(vectors[7], 5) == expected
+
+    # Rows left unassigned by an older store are assigned on open.
+    np.full(300, -1, dtype="<i4").tofile(tmp_path / "ivf" / "lists.i32")
+    assert open_index().search(vectors[7], 5) == expected
+    assert (tmp_path / "ivf" / "lists.i32").read_bytes() == lists
+
+
+@pytest.mark.integration
+def test_query_returns_filtered_chunks_and_caches_results(tmp_path):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "AAPL_2024-05-01_note.txt").write_text("iphone margins services growth " * 50)
+    (corpus / "MSFT_2024-05-02_memo.md").write_text("azure cloud capex growth " * 50)
+    research = LocalResearch(tmp_path / "store", HashingEmbedder(dimension=64), workers=1)
+    asyncio.run(research.ingest([corpus]))
+
+    first = asyncio.run(research.query("azure cloud", top_k=2))
+    assert [hit.chunk.symbol for hit in first.hits] == ["MSFT", "AAPL"]
+    assert not first.cached
+    again = asyncio.run(research.query("azure cloud", top_k=2))
+    assert again.cached and again.hits == first.hits and again.query_id != first.query_id
+    filtered = asyncio.run(research.query("azure cloud", top_k=2, symbols=["AAPL"]))
+    assert [hit.chunk.symbol for hit in filtered.hits] == ["AAPL"]
+
+    asyncio.run(research.rate(first.query_id, 5))
+    with pytest.raises(ValueError):
+        asyncio.run(research.rate(first.query_id, 9))
+
+    (corpus / "AAPL_2024-05-01_note.txt").write_text("azure cloud azure cloud " * 50)
+    asyncio.run(research.ingest([corpus]))
+    refreshed = asyncio.run(research.query("azure cloud", top_k=2))
+    assert not refreshed.cached and refreshed.hits[0].chunk.symbol == "AAPL"
+    reopened = LocalResearch(tmp_path / "store", HashingEmbedder(dimension=64), workers=1)
+    assert [hit.chunk.text for hit in asyncio.run(reopened.query("azure cloud", top_k=2)).hits] == [
+        hit.chunk.text for hit in refreshed.hits
+    ]
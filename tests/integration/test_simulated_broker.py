@@ -0,0 +1,81 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.broker.simulator import SimulatedBroker
+from src.domain.events import FillEvent, OrderEvent, OrderRejectedEvent, TickEvent
+from src.infrastructure.clock import Scheduler, VirtualClock
+
+
+def _order(side: str, quantity: float, price=None, symbol: str = "AAPL") -> OrderEvent:
+    return OrderEvent(symbol=symbol, side=side, quantity=quantity, price=price, client_order_id=uuid4())
+
+
+async def _drain(broker: SimulatedBroker, timeout: float = 0.01) -> list:
+    reports = []
+    while True:
+        try:
+            reports.append(await asyncio.wait_for(broker.stream_fills(), timeout))
+        except asyncio.TimeoutError:
+            return reports
+
+
+@pytest.mark.integration
+def test_simulated_broker_fills_market_and_limit_orders():
+    async def _run() -> None:
+        broker = SimulatedBroker(slippage_bps=10.0, liquidity=60.0)
+        await broker.on_tick(TickEvent(symbol="AAPL", price=100.0, timestamp=1.0))
+
+        market = _order("BUY", 100)
+        await broker.submit_order(market)
+        fill = await broker.stream_fills()
+        assert fill.client_order_id == market.client_order_id
+        assert fill.quantity == 60
+        assert fill.price == pytest.approx(100.1)
+        await broker.on_tick(TickEvent(symbol="AAPL", price=101.0, timestamp=2.0))
+        fill = await broker.stream_fills()
+        assert fill.quantity == 40
+        assert fill.price == pytest.approx(101.101)
+
+        bid = _order("BUY", 10, price=99.0)
+        ask = _order("SELL", 10, price=103.0)
+        await broker.submit_order(bid)
+        await broker.submit_order(ask)
+        assert await _drain(broker) == []
+        assert broker.open_orders == 2
+        await broker.on_tick(TickEvent(symbol="AAPL", price=98.5, timestamp=3.0))
+        (fill,) = await _drain(broker)
+        assert (fill.client_order_id, fill.price) == (bid.client_order_id, 98.5)
+
+        await broker.cancel_order(str(ask.client_order_id))
+        await broker.on_tick(TickEvent(symbol="AAPL", price=104.0, timestamp=4.0))
+        assert await _drain(broker) == []
+        assert broker.open_orders == 0
+        assert broker.stats.cancelled == 1
+
+    asyncio.run(_run())
+
+
+@pytest.mark.integration
+def test_simulated_broker_applies_latency_and_rejections():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    broker = SimulatedBroker(latency=0.05, reject_probability=0.5, seed=3, scheduler=scheduler)
+
+    async def _run() -> tuple:
+        await broker.on_tick(TickEvent(symbol="AAPL", price=50.0, timestamp=0.0))
+        orders = [_order("BUY", 1) for _ in range(200)]
+        for order in orders:
+            await broker.submit_order(order)
+        rejections = await _drain(broker)
+        await scheduler.sleep(0.05)
+        return rejections, await _drain(broker)
+
+    rejections, fills = scheduler.run(_run())
+    assert all(isinstance(event, OrderRejectedEvent) for event in rejections)
+    assert all(isinstance(event, FillEvent) for event in fills)
+    assert [event.client_order_id for event in rejections] == broker.rejected
+    assert broker.stats.rejected + len(fills) == 200
+    assert 60 < broker.stats.rejected < 140
+    assert not {fill.client_order_id for fill in fills} & set(broker.rejected)
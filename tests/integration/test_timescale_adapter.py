@@ -0,0 +1,200 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.persistence.asyncpg_timescale import (
+    TABLE_COLUMNS,
+    AsyncpgTimescaleRepository,
+    from_record,
+    to_record,
+)
+from src.adapters.persistence.timescale import TimescaleRepository
+from src.domain.events import FillEvent, PortfolioMetricsEvent, TickEvent
+from src.domain.models import Bucket
+from src.infrastructure.clock import FixedClock, Scheduler, VirtualClock
+
+
+@pytest.mark.integration
+def test_events_map_to_typed_copy_records():
+    table, record = to_record(TickEvent(symbol="AAPL", price=150.5, timestamp=60.0), now=0.0)
+    assert table == "ticks"
+    assert record == (datetime(1970, 1, 1, 0, 1, tzinfo=timezone.utc), "AAPL", 150.5)
+
+    order_id = uuid4()
+    table, record = to_record(FillEvent("MSFT", "SELL", 3.0, 410.0, order_id), now=120.0)
+    assert table == "fills"
+    assert len(record) == len(TABLE_COLUMNS["fills"])
+    assert record[0] == datetime(1970, 1, 1, 0, 2, tzinfo=timezone.utc)
+    assert record[-1] == order_id
+    assert from_record("fills", record) == FillEvent("MSFT", "SELL", 3.0, 410.0, order_id)
+
+    metrics = PortfolioMetricsEvent(5.0, 0, 0, 0, 0, 0, 0, 0, 0, 0, (("AAPL", 1.0),), True, 0.0)
+    table, record = to_record(metrics, now=9.0)
+    assert table is None
+    assert record[0] == "PortfolioMetricsEvent"
+    assert record[2] == datetime(1970, 1, 1, 0, 0, 5, tzinfo=timezone.utc)
+
+
+@pytest.mark.integration
+def test_asyncpg_repository_requires_connect():
+    repository = AsyncpgTimescaleRepository(dsn="postgresql://localhost/kyzlo")
+    with pytest.raises(RuntimeError, match="connect"):
+        asyncio.run(repository.persist_event(TickEvent(symbol="AAPL", price=1.0, timestamp=1.0)))
+
+
+class _FakeConnection:
+    def __init__(self, pool: "_FakePool") -> None:
+        self.pool = pool
+
+    async def copy_records_to_table(self, table, records, columns):
+        if table in self.pool.failing:
+            raise OSError(f"COPY into {table} failed")
+        self.pool.copies.append((table, list(records), columns))
+
+    async def prepare(self, query):
+        pool = self.pool
+
+        class _Statement:
+            async def executemany(self, records):
+                pool.copies.append(("events", list(records), None))
+
+        return _Statement()
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.copies: list = []
+        self.failing: set = set()
+        self.closed = False
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return _FakeConnection(pool)
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        return _Acquire()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _repository(pool: _FakePool, **kwargs) -> AsyncpgTimescaleRepository:
+    async def create_pool(dsn, min_size, max_size):
+        return pool
+
+    return AsyncpgTimescaleRepository(dsn="postgresql://localhost/kyzlo", pool_factory=create_pool, **kwargs)
+
+
+def _tick(idx: int) -> TickEvent:
+    return TickEvent(symbol="AAPL", price=float(idx), timestamp=float(idx))
+
+
+@pytest.mark.integration
+def test_asyncpg_repository_flushes_full_batches_in_the_background():
+    pool = _FakePool()
+
+    async def _run() -> None:
+        repository = _repository(pool, batch_size=3, flush_interval=3600.0)
+        await repository.connect()
+        for idx in range(3):
+            await repository.persist_event(_tick(idx))
+        assert pool.copies == []
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert [(table, len(records)) for table, records, _ in pool.copies] == [("ticks", 3)]
+        await repository.persist_event(_tick(3))
+        await repository.close()
+        assert [len(records) for _, records, _ in pool.copies] == [3, 1]
+        assert (repository.written, pool.closed) == (4, True)
+
+    asyncio.run(_run())
+
+
+@pytest.mark.integration
+def test_asyncpg_repository_flushes_on_interval():
+    pool = _FakePool()
+    scheduler = Scheduler(VirtualClock())
+
+    async def _run() -> None:
+        repository = _repository(pool, batch_size=100, flush_interval=0.5, scheduler=scheduler)
+        await repository.connect()
+        await repository.persist_event(_tick(1))
+        await repository.persist_event(PortfolioMetricsEvent(5.0, 0, 0, 0, 0, 0, 0, 0, 0, 0, (), True, 0.0))
+        await scheduler.sleep(0.4)
+        assert pool.copies == []
+        await scheduler.sleep(0.2)
+        assert sorted(table for table, _, _ in pool.copies) == ["events", "ticks"]
+        assert repository.written == 2
+        await repository.close()
+
+    scheduler.run(_run())
+
+
+@pytest.mark.integration
+def test_asyncpg_repository_backpressure_and_failed_copies():
+    pool = _FakePool()
+    pool.failing.add("ticks")
+
+    async def _run() -> None:
+        repository = _repository(pool, batch_size=100, flush_interval=3600.0, max_pending=3)
+        await repository.connect()
+        await repository.persist_event(_tick(1))
+        await repository.persist_event(FillEvent("AAPL", "BUY", 1.0, 10.0, uuid4()))
+        # The third record reaches max_pending, so the caller waits for the flush itself.
+        await repository.persist_event(_tick(2))
+        assert [table for table, _, _ in pool.copies] == ["fills"]
+        assert (repository.written, repository.failed) == (1, 2)
+        await repository.persist_event(_tick(3))
+        await repository.close()
+        assert repository.failed == 3
+
+    asyncio.run(_run())
+
+
+@pytest.mark.integration
+def test_memory_repository_streams_time_ranges_in_chunks():
+    async def _run() -> list:
+        repository = TimescaleRepository(dsn="memory://")
+        for idx in range(10):
+            await repository.persist_event(TickEvent(symbol="AAPL", price=float(idx), timestamp=float(idx)))
+            await repository.persist_event(TickEvent(symbol="MSFT", price=float(idx), timestamp=idx + 0.5))
+        await repository.persist_event(TickEvent(symbol="AAPL", price=99.0, timestamp=2.5))
+        chunks = [
+            chunk
+            async for chunk in repository.stream_events(TickEvent, 2.0, 5.0, symbols=["AAPL", "MSFT"], chunk_size=3)
+        ]
+        only_msft = [chunk async for chunk in repository.stream_events(TickEvent, 0.0, 2.0, symbols=["MSFT"])]
+        return [chunks, only_msft]
+
+    chunks, only_msft = asyncio.run(_run())
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    timestamps = [event.timestamp for chunk in chunks for event in chunk]
+    assert timestamps == [2.0, 2.5, 2.5, 3.0, 3.5, 4.0, 4.5]
+    assert [event.timestamp for event in only_msft[0]] == [0.5, 1.5]
+
+
+@pytest.mark.integration
+def test_memory_repository_downsamples_values_and_recorded_times():
+    async def _run() -> list:
+        repository = TimescaleRepository(dsn="memory://", clock=FixedClock(125.0))
+        for timestamp, price in [(0.0, 10.0), (20.0, 12.0), (40.0, 9.0), (61.0, 11.0), (130.0, 15.0)]:
+            await repository.persist_event(TickEvent(symbol="AAPL", price=price, timestamp=timestamp))
+        await repository.persist_event(FillEvent("AAPL", "BUY", 1.0, 14.0, uuid4()))
+        return [
+            await repository.downsample(TickEvent, "AAPL", 0.0, 120.0, 60.0),
+            await repository.downsample(FillEvent, "AAPL", 0.0, 200.0, 60.0),
+        ]
+
+    ticks, fills = asyncio.run(_run())
+    assert ticks == [
+        Bucket("AAPL", 0.0, 10.0, 12.0, 9.0, 9.0, 3),
+        Bucket("AAPL", 60.0, 11.0, 11.0, 11.0, 11.0, 1),
+    ]
+    assert fills == [Bucket("AAPL", 120.0, 14.0, 14.0, 14.0, 14.0, 1)]
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.clock import MonotonicClock, Scheduler, VirtualClock
+from src.infrastructure.resilience import CircuitBreaker
+
+MARKET_OPEN = 1_700_000_000.0
+TRADING_DAY = 6.5 * 3600
+
+
+def test_virtual_clock_advances_in_nanoseconds():
+    clock = VirtualClock(start=1.0)
+    clock.advance(0.5e-9)
+    assert clock.now_ns() == 1_000_000_001
+    clock.advance_to(2.0)
+    assert clock.now() == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        clock.advance(-1.0)
+
+
+def test_monotonic_clock_matches_loop_time():
+    clock = MonotonicClock()
+
+    async def _run() -> float:
+        return asyncio.get_running_loop().time()
+
+    before = clock.now()
+    loop_time = asyncio.run(_run())
+    assert before <= loop_time <= clock.now()
+
+
+def test_simulated_trading_day_runs_in_virtual_time():
+    clock = VirtualClock(start=MARKET_OPEN)
+    scheduler = Scheduler(clock)
+    bar_closes = []
+    fired = []
+
+    async def heartbeat() -> int:
+        beats = 0
+        while scheduler.now() < MARKET_OPEN + TRADING_DAY:
+            await scheduler.sleep(1.0)
+            beats += 1
+        return beats
+
+    async def bars() -> None:
+        for minute in range(1, 391):
+            await scheduler.sleep_until(MARKET_OPEN + minute * 60)
+            bar_closes.append(scheduler.now())
+
+    async def main() -> int:
+        scheduler.call_later(3600, lambda: fired.append(scheduler.now()))
+        beats, _ = await asyncio.gather(heartbeat(), bars())
+        return beats
+
+    started = time.perf_counter()
+    beats = scheduler.run(main())
+    elapsed = time.perf_counter() - started
+
+    assert beats == 23_400
+    assert len(bar_closes) == 390
+    assert bar_closes[-1] == pytest.approx(MARKET_OPEN + TRADING_DAY)
+    assert fired == [pytest.approx(MARKET_OPEN + 3600)]
+    assert elapsed < 5.0
+
+
+def test_circuit_breaker_reset_timeout_uses_injected_scheduler():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    breaker = CircuitBreaker(max_failures=1, reset_timeout=60.0, scheduler=scheduler)
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    async def main() -> None:
+        with pytest.raises(ValueError):
+            await breaker.call(fail)
+
+    scheduler.run(main())
+    assert clock.now() == pytest.approx(60.0)
+    assert breaker.open is False
@@ -0,0 +1,223 @@
+import asyncio
+
+import pytest
+
+from src.application.engine import PartitionedEngine, QueueStats
+from src.domain.events import TickEvent
+from src.infrastructure.clock import FixedClock, Scheduler, VirtualClock
+
+
+def _ticks(count: int, symbol: str = "AAPL"):
+    return [TickEvent(symbol=symbol, price=float(idx), timestamp=float(idx)) for idx in range(count)]
+
+
+@pytest.mark.parametrize(
+    "policy,expected_prices,dropped,conflated",
+    [
+        ("drop_new", [0.0, 1.0], 3, 0),
+        ("drop_oldest", [3.0, 4.0], 3, 0),
+        ("conflate", [4.0], 0, 4),
+    ],
+)
+def test_engine_backpressure_policies(policy, expected_prices, dropped, conflated):
+    async def _run() -> None:
+        engine = PartitionedEngine(maxsize=2, policy=policy, clock=FixedClock(10.0))
+        received = []
+
+        async def handler(event: TickEvent) -> None:
+            received.append(event.price)
+
+        engine.register_handler("AAPL", handler)
+        # The worker has not run yet, so the queue fills before anything is consumed.
+        for tick in _ticks(5):
+            await engine.enqueue(tick)
+        stats = engine.stats("AAPL")
+        assert stats.depth == len(expected_prices)
+        assert stats.dropped == dropped
+        assert stats.conflated == conflated
+
+        await asyncio.sleep(0)
+        assert received == expected_prices
+        assert engine.stats("AAPL").lag == pytest.approx(10.0 - expected_prices[-1])
+        await engine.shutdown()
+
+    asyncio.run(_run())
+
+
+def test_engine_block_policy_waits_for_room():
+    async def _run() -> None:
+        engine = PartitionedEngine(maxsize=1, policy="block", clock=FixedClock(0.0))
+        received = []
+        release = asyncio.Event()
+
+        async def handler(event: TickEvent) -> None:
+            await release.wait()
+            received.append(event.price)
+
+        engine.register_handler("AAPL", handler)
+        ticks = _ticks(3)
+        await engine.enqueue(ticks[0])
+        await asyncio.sleep(0)
+        await engine.enqueue(ticks[1])
+        blocked = asyncio.create_task(engine.enqueue(ticks[2]))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await asyncio.sleep(0)
+        assert received == [0.0, 1.0, 2.0]
+        assert engine.stats("AAPL").dropped == 0
+        await engine.shutdown()
+
+    asyncio.run(_run())
+
+
+def test_engine_discards_ticks_for_symbols_without_a_handler():
+    async def _run() -> None:
+        engine = PartitionedEngine(maxsize=2, policy="block")
+        for tick in _ticks(5, symbol="IBM"):
+            await engine.enqueue(tick)
+
+        assert engine.active_symbols == 0
+        assert engine.stats("IBM") == QueueStats()
+
+    asyncio.run(_run())
+
+
+def test_engine_switches_to_conflation_when_lagging():
+    async def _run() -> None:
+        clock = FixedClock(100.0)
+        engine = PartitionedEngine(clock=clock, conflate_lag_threshold=5.0)
+        received = []
+
+        async def handler(event: TickEvent) -> None:
+            received.append(event.price)
+
+        engine.register_handler("AAPL", handler)
+        await engine.enqueue(TickEvent(symbol="AAPL", price=1.0, timestamp=90.0))
+        await asyncio.sleep(0)
+        assert engine.stats("AAPL").conflating
+
+        for tick in _ticks(3):
+            await engine.enqueue(TickEvent(symbol="AAPL", price=tick.price, timestamp=99.0))
+        await asyncio.sleep(0)
+        assert received == [1.0, 2.0]
+        assert engine.stats("AAPL").conflated == 2
+        assert not engine.stats("AAPL").conflating
+
+    asyncio.run(_run())
+
+
+def test_engine_pool_multiplexes_symbols_in_order():
+    async def _run() -> None:
+        engine = PartitionedEngine(workers=4)
+        received = {}
+
+        async def handler(event: TickEvent) -> None:
+            received.setdefault(event.symbol, []).append(event.price)
+            await asyncio.sleep(0)
+
+        symbols = [f"SYM{idx}" for idx in range(200)]
+        for symbol in symbols:
+            engine.register_handler(symbol, handler)
+        assert engine.worker_count == 0
+
+        for tick_idx in range(20):
+            for symbol in symbols[:50]:
+                await engine.enqueue(TickEvent(symbol=symbol, price=float(tick_idx), timestamp=0.0))
+        await asyncio.sleep(0.05)
+
+        assert engine.worker_count <= 4
+        assert engine.active_symbols == 50
+        assert all(received[symbol] == [float(idx) for idx in range(20)] for symbol in symbols[:50])
+        assert engine.stats("SYM0").processed == 20
+        await engine.shutdown()
+
+    asyncio.run(_run())
+
+
+def test_engine_pool_reclaims_idle_symbols_and_unsubscribes():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+
+    async def _run() -> None:
+        engine = PartitionedEngine(workers=2, idle_timeout=30.0, clock=clock)
+        received = []
+
+        async def handler(event: TickEvent) -> None:
+            received.append(event.symbol)
+
+        engine.register_handler("AAPL", handler)
+        engine.register_handler("MSFT", handler)
+        await engine.enqueue(TickEvent(symbol="AAPL", price=1.0, timestamp=0.0))
+        await engine.enqueue(TickEvent(symbol="MSFT", price=1.0, timestamp=0.0))
+        await scheduler.sleep(29.0)
+        assert engine.active_symbols == 2
+        await scheduler.sleep(31.0)
+        assert received == ["AAPL", "MSFT"]
+        assert engine.active_symbols == 0
+        assert engine.worker_count == 0
+
+        engine.unregister_handler("MSFT")
+        await engine.enqueue(TickEvent(symbol="MSFT", price=2.0, timestamp=0.0))
+        await engine.enqueue(TickEvent(symbol="AAPL", price=2.0, timestamp=0.0))
+        await asyncio.sleep(0)
+        assert received == ["AAPL", "MSFT", "AAPL"]
+        assert engine.stats("AAPL").processed == 2
+        await engine.shutdown()
+
+    scheduler.run(_run())
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_engine_handler_errors_do_not_stop_other_symbols(workers):
+    async def _run() -> None:
+        engine = PartitionedEngine(maxsize=2, workers=workers)
+        received = []
+
+        async def good(event: TickEvent) -> None:
+            received.append(event.price)
+
+        async def bad(event: TickEvent) -> None:
+            raise ValueError("bad tick")
+
+        engine.register_handler("GOOD", good)
+        engine.register_handler("BAD", bad)
+        for idx in range(5):
+            await engine.enqueue(TickEvent(symbol="BAD", price=float(idx), timestamp=0.0))
+            await engine.enqueue(TickEvent(symbol="GOOD", price=float(idx), timestamp=0.0))
+        await asyncio.sleep(0.01)
+
+        assert received == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert engine.stats("BAD").processed == 5
+        assert engine.worker_count == (1 if workers else 2)
+        await engine.shutdown()
+
+    asyncio.run(_run())
+
+
+def test_engine_unregister_releases_blocked_feed_and_drops_later_ticks():
+    async def _run() -> None:
+        engine = PartitionedEngine(maxsize=2, policy="block")
+        release = asyncio.Event()
+
+        async def handler(event: TickEvent) -> None:
+            await release.wait()
+
+        engine.register_handler("AAPL", handler)
+        for tick in _ticks(3):
+            await engine.enqueue(tick)
+        await asyncio.sleep(0)
+        blocked = asyncio.create_task(engine.enqueue(TickEvent(symbol="AAPL", price=3.0, timestamp=3.0)))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        engine.unregister_handler("AAPL")
+        await asyncio.wait_for(blocked, 1.0)
+        for tick in _ticks(5):
+            await asyncio.wait_for(engine.enqueue(tick), 1.0)
+        assert engine.active_symbols == 0
+        assert engine.worker_count == 0
+
+    asyncio.run(_run())
@@ -0,0 +1,87 @@
+import io
+import json
+
+import pytest
+import structlog
+
+from src.infrastructure.logging import AsyncLogSink, configure_async_logging
+
+
+def _emit(sink: AsyncLogSink, event: str, **fields) -> None:
+    with pytest.raises(structlog.DropEvent):
+        sink(None, "info", {"event": event, **fields})
+
+
+def _lines(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_async_sink_writes_on_background_thread_and_flushes_on_close():
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream).start()
+    for idx in range(100):
+        _emit(sink, "tick", idx=idx)
+    sink.close()
+
+    lines = _lines(stream)
+    assert [line["idx"] for line in lines] == list(range(100))
+    assert all(isinstance(line["timestamp"], str) for line in lines)
+
+
+def test_async_sink_samples_and_rate_limits_with_summary():
+    now = [0.0]
+    stream = io.StringIO()
+    sink = AsyncLogSink(
+        stream=stream,
+        sample_every={"tick": 10},
+        rate_limits={"risk_validation_failed": 2.0},
+        clock=lambda: now[0],
+    )
+    for _ in range(50):
+        _emit(sink, "tick")
+    for _ in range(5):
+        _emit(sink, "risk_validation_failed")
+    now[0] = 1.0
+    _emit(sink, "risk_validation_failed")
+    sink.close()
+
+    lines = _lines(stream)
+    events = [line["event"] for line in lines]
+    assert events.count("tick") == 5
+    assert events.count("risk_validation_failed") == 3
+    assert lines[-1]["event"] == "log_events_suppressed"
+    assert lines[-1]["counts"] == {"tick": 45, "risk_validation_failed": 3}
+
+
+def test_async_sink_counts_queue_overflow_instead_of_blocking():
+    stream = io.StringIO()
+    sink = AsyncLogSink(stream=stream, max_queue=2)
+    for _ in range(5):
+        _emit(sink, "tick")
+    sink.close()
+
+    lines = _lines(stream)
+    assert [line["event"] for line in lines].count("tick") == 2
+    assert lines[-1]["counts"] == {"log_queue_full": 3}
+
+
+def test_configured_logging_keeps_tracebacks_and_context():
+    stream = io.StringIO()
+    sink = configure_async_logging(stream=stream)
+    try:
+        logger = structlog.get_logger("test")
+        with structlog.contextvars.bound_contextvars(request_id="r-1"):
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                logger.exception("division_failed")
+    finally:
+        sink.close()
+        structlog.reset_defaults()
+
+    [line] = _lines(stream)
+    assert line["event"] == "division_failed"
+    assert line["level"] == "error"
+    assert line["request_id"] == "r-1"
+    assert "ZeroDivisionError" in line["exception"]
+    assert "Traceback" in line["exception"]
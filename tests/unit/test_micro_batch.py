@@ -0,0 +1,92 @@
+import random
+
+import numpy as np
+
+from src.application.micro_batch import MicroBatchEngine
+from src.domain.events import TickEvent
+from src.domain.models import Tick
+from src.domain.strategy.cross_section import CrossSectionalGoldenCross
+from src.domain.strategy.golden_cross import GoldenCrossStrategy
+from src.infrastructure.clock import Scheduler, VirtualClock
+from src.infrastructure.idempotency import generate_signal_id
+
+
+def _ticks(count: int, symbols: int, seed: int = 3) -> list:
+    rng = random.Random(seed)
+    names = [f"SYM{idx}" for idx in range(symbols)]
+    return [Tick(rng.choice(names), round(100 + rng.gauss(0, 1), 2), float(idx)) for idx in range(count)]
+
+
+def test_cross_sectional_golden_cross_matches_per_symbol_strategy():
+    ticks = _ticks(3000, 40)
+    history = ([100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.5])
+    per_symbol = {}
+    expected = []
+    for tick in ticks:
+        strategy = per_symbol.get(tick.symbol)
+        if strategy is None:
+            strategy = per_symbol[tick.symbol] = GoldenCrossStrategy(
+                "golden-cross", short_window=3, long_window=7, id_generator=generate_signal_id
+            )
+            if tick.symbol == "SYM1":
+                strategy.warmup("SYM1", *history)
+        signal = strategy.on_tick(tick)
+        if signal:
+            expected.append(signal)
+
+    universe = CrossSectionalGoldenCross(
+        "golden-cross", short_window=3, long_window=7, id_generator=generate_signal_id, capacity=2
+    )
+    universe.warmup("SYM1", *history)
+    produced = []
+    rng = random.Random(5)
+    start = 0
+    while start < len(ticks):
+        batch = ticks[start : start + rng.randint(1, 200)]
+        start += len(batch)
+        signals = universe.on_batch(
+            np.array([universe.index_of(tick.symbol) for tick in batch]),
+            np.array([tick.price for tick in batch]),
+            np.array([tick.timestamp for tick in batch]),
+        )
+        produced.extend(signals.signals(generate_signal_id))
+    assert produced == expected
+    assert universe.on_tick(Tick("SYM1", 99.0, 1e9)) is not None
+
+
+def test_micro_batch_engine_flushes_per_window_and_reports_stats():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    batches = []
+
+    async def handler(batch) -> None:
+        batches.append(batch)
+
+    async def _run() -> None:
+        engine = MicroBatchEngine(
+            CrossSectionalGoldenCross("golden-cross", id_generator=generate_signal_id),
+            handler,
+            window=0.002,
+            max_batch=8,
+            scheduler=scheduler,
+        )
+        for idx in range(6):
+            await engine.enqueue(TickEvent(symbol=f"SYM{idx % 2}", price=100.0 + idx, timestamp=float(idx)))
+            await scheduler.sleep(0.0005)
+        await scheduler.sleep(0.01)
+        for idx in range(10):
+            await engine.enqueue(TickEvent(symbol="SYM0", price=110.0 - idx, timestamp=10.0 + idx))
+        await engine.shutdown()
+
+        stats = engine.stats
+        assert [len(batch.events) for batch in batches] == [4, 2, 8, 2]
+        assert (stats.windows, stats.ticks, stats.largest_window) == (4, 16, 8)
+        assert stats.max_wait == 0.002
+        # SYM0 warms up on its fifth tick; SYM1 never does.
+        assert stats.signals == sum(len(batch.signals) for batch in batches) == 9
+        signals = [signal for batch in batches for signal in batch.signals.signals(generate_signal_id)]
+        assert {signal.symbol for signal in signals} == {"SYM0"}
+        assert (signals[0].side, signals[-1].side) == ("BUY", "SELL")
+        assert stats.ticks_per_second > 0
+
+    scheduler.run(_run())
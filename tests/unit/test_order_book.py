@@ -0,0 +1,89 @@
+import pytest
+from uuid import uuid4
+
+from src.application.fsm import InvalidOrderState
+from src.application.order_book import OrderBook, UnknownOrder
+from src.application.services import RiskService
+from src.domain.events import FillEvent, OrderEvent, SignalEvent
+from src.domain.models import Position
+from src.domain.risk.kill_switch import KillSwitch
+from src.domain.risk.rules import MaxPositionRule, RiskViolation
+
+
+def _order(symbol: str = "AAPL", side: str = "BUY", quantity: float = 10) -> OrderEvent:
+    return OrderEvent(symbol=symbol, side=side, quantity=quantity, price=None, client_order_id=uuid4())
+
+
+def _fill(order: OrderEvent, quantity: float) -> FillEvent:
+    return FillEvent(
+        symbol=order.symbol, side=order.side, quantity=quantity, price=100.0, client_order_id=order.client_order_id
+    )
+
+
+def test_order_book_indexes_and_open_quantity():
+    book = OrderBook()
+    buy, sell, other = _order(), _order(side="SELL", quantity=4), _order(symbol="MSFT")
+    for event in (buy, sell, other):
+        book.add_event(event)
+
+    assert book.open_quantity("AAPL") == 6
+    assert {o.client_order_id for o in book.orders_for_symbol("AAPL")} == {buy.client_order_id, sell.client_order_id}
+    assert len(book.orders_in_state("PENDING")) == 3
+
+    assert book.transition_many([(buy.client_order_id, "SUBMITTED"), (sell.client_order_id, "SUBMITTED")]) == []
+    book.transition(sell.client_order_id, "CANCEL_PENDING")
+    book.transition(sell.client_order_id, "CANCELLED")
+
+    assert book.open_quantity("AAPL") == 10
+    assert book.get(sell.client_order_id).state == "CANCELLED"
+    assert len(book.orders_in_state("SUBMITTED")) == 1
+    with pytest.raises(InvalidOrderState):
+        book.transition(other.client_order_id, "FILLED")
+    with pytest.raises(UnknownOrder):
+        book.transition(uuid4(), "SUBMITTED")
+
+
+def test_order_book_reconciles_partial_fills_in_batch():
+    book = OrderBook()
+    buy, pending = _order(), _order()
+    book.add_event(buy, state="SUBMITTED")
+    book.add_event(pending)
+    stray = _order()
+
+    report = book.reconcile([_fill(buy, 4), _fill(buy, 3), _fill(pending, 1), _fill(stray, 1)])
+
+    assert report.applied == 2
+    assert report.unknown == [stray.client_order_id]
+    assert [failure.client_order_id for failure in report.rejected] == [pending.client_order_id]
+    assert book.get(buy.client_order_id).state == "PARTIALLY_FILLED"
+    assert book.filled_quantity(buy.client_order_id) == 7
+    assert book.open_buy_quantity("AAPL") == 3 + 10
+
+    report = book.reconcile([_fill(buy, 5)])
+    assert report.overfilled == [buy.client_order_id]
+    assert book.get(buy.client_order_id).state == "FILLED"
+    assert book.open_buy_quantity("AAPL") == 10
+    assert book.prune_terminal() == 1
+    assert buy.client_order_id not in book
+
+
+def test_risk_position_limits_count_open_orders():
+    book = OrderBook()
+    risk = RiskService(
+        kill_switch=KillSwitch(daily_loss_limit=1000), rules=[MaxPositionRule("AAPL", 100)], order_book=book
+    )
+    positions = [Position(symbol="AAPL", quantity=60, average_price=100.0)]
+    signal = SignalEvent("AAPL", "gc", 1.0, "BUY", 1.0, uuid4())
+    working = _order(quantity=40)
+    book.add_event(working, state="SUBMITTED")
+
+    with pytest.raises(RiskViolation, match="Max position exceeded for AAPL"):
+        risk.validate(signal, positions, pnl=0.0, broker_connected=True)
+    [decision] = risk.validate_batch([signal], positions, pnl=0.0, broker_connected=True)
+    assert decision.reason == "Max position exceeded for AAPL"
+
+    book.transition(working.client_order_id, "REJECTED")
+    risk.validate(signal, positions, pnl=0.0, broker_connected=True)
+    book.add_event(_order(quantity=30), state="SUBMITTED")
+    decisions = risk.validate_batch([signal] * 12, positions, pnl=0.0, broker_connected=True)
+    assert [decision.accepted for decision in decisions] == [True] * 10 + [False] * 2
@@ -0,0 +1,179 @@
+import asyncio
+import statistics
+from uuid import uuid4
+
+import pytest
+
+from src.application.bus import EventBus
+from src.application.portfolio_metrics import MetricsPublisher, PortfolioMetrics
+from src.application.services import ExecutionService, RiskService
+from src.domain.events import FillEvent, OrderEvent, PortfolioMetricsEvent, SignalEvent
+from src.domain.risk.kill_switch import KillSwitch, KillSwitchEngaged
+from src.infrastructure.clock import Scheduler, VirtualClock
+from src.ports.broker import BrokerPort
+
+
+def _fill(symbol: str, side: str, quantity: float, price: float) -> FillEvent:
+    return FillEvent(symbol=symbol, side=side, quantity=quantity, price=price, client_order_id=uuid4())
+
+
+def test_metrics_track_pnl_drawdown_and_exposure():
+    clock = VirtualClock()
+    metrics = PortfolioMetrics(clock=clock)
+
+    metrics.on_fill(_fill("AAPL", "BUY", 10, 100.0))
+    metrics.on_fill(_fill("MSFT", "BUY", 5, 200.0))
+    metrics.on_price("AAPL", 110.0)
+    assert metrics.unrealized_pnl == pytest.approx(100.0)
+    assert metrics.high_water_mark == pytest.approx(100.0)
+    assert metrics.gross_exposure == pytest.approx(2100.0)
+    assert metrics.exposure("MSFT") == pytest.approx(1000.0)
+
+    metrics.on_price("MSFT", 180.0)
+    assert metrics.drawdown == pytest.approx(100.0)
+    metrics.on_fill(_fill("AAPL", "SELL", 10, 105.0))
+    assert metrics.realized_pnl == pytest.approx(50.0)
+    assert metrics.total_pnl == pytest.approx(-50.0)
+    assert metrics.max_drawdown == pytest.approx(150.0)
+    assert metrics.exposure("AAPL") == 0.0
+    assert metrics.net_exposure == pytest.approx(900.0)
+
+
+def test_metrics_high_water_mark_resets_each_day():
+    clock = VirtualClock()
+    metrics = PortfolioMetrics(clock=clock)
+    metrics.on_fill(_fill("AAPL", "BUY", 10, 100.0))
+    metrics.on_price("AAPL", 110.0)
+    metrics.on_price("AAPL", 105.0)
+    assert (metrics.high_water_mark, metrics.drawdown) == (pytest.approx(100.0), pytest.approx(50.0))
+
+    clock.advance(86_400.0)
+    metrics.on_price("AAPL", 104.0)
+    assert metrics.high_water_mark == pytest.approx(50.0)
+    assert metrics.drawdown == pytest.approx(10.0)
+    assert metrics.max_drawdown == pytest.approx(10.0)
+
+
+def test_metrics_rolling_volatility_uses_window():
+    clock = VirtualClock()
+    metrics = PortfolioMetrics(clock=clock, volatility_interval=1.0, volatility_window=3)
+    metrics.on_fill(_fill("AAPL", "BUY", 1, 100.0))
+    totals = []
+    for price in [101.0, 99.0, 104.0, 100.0, 103.0]:
+        clock.advance(1.0)
+        metrics.on_price("AAPL", price)
+        totals.append(price - 100.0)
+    changes = [b - a for a, b in zip([0.0] + totals, totals)]
+    assert metrics.pnl_volatility == pytest.approx(statistics.stdev(changes[-3:]))
+
+
+def test_kill_switch_reads_metrics_for_drawdown_and_disconnects():
+    clock = VirtualClock()
+    metrics = PortfolioMetrics(clock=clock)
+    kill_switch = KillSwitch(daily_loss_limit=1000.0, max_drawdown=50.0)
+    risk = RiskService(kill_switch=kill_switch, rules=[], metrics=metrics)
+    signal = SignalEvent(
+        symbol="AAPL", strategy_id="s", timestamp=0.0, side="BUY", strength=1.0, signal_id=uuid4()
+    )
+
+    metrics.on_fill(_fill("AAPL", "BUY", 10, 100.0))
+    metrics.on_price("AAPL", 110.0)
+    risk.validate(signal, [], pnl=0.0, broker_connected=True)
+    metrics.on_price("AAPL", 104.0)
+    with pytest.raises(KillSwitchEngaged, match="drawdown"):
+        risk.validate(signal, [], pnl=0.0, broker_connected=True)
+
+    metrics.on_price("AAPL", 110.0)
+    metrics.set_broker_connected(False)
+    clock.advance(30.0)
+    risk.validate(signal, [], pnl=0.0, broker_connected=True)
+    clock.advance(31.0)
+    assert metrics.broker_disconnected_seconds == pytest.approx(61.0)
+    with pytest.raises(KillSwitchEngaged, match="Broker"):
+        risk.validate(signal, [], pnl=0.0, broker_connected=True)
+    metrics.set_broker_connected(True)
+    assert metrics.broker_disconnected_seconds == 0.0
+    risk.validate(signal, [], pnl=0.0, broker_connected=False)
+
+
+class _FlakyBroker(BrokerPort):
+    def __init__(self) -> None:
+        self.failing = True
+        self.fills: "asyncio.Queue[FillEvent]" = asyncio.Queue()
+
+    async def submit_order(self, order: OrderEvent) -> None:
+        if self.failing:
+            raise ConnectionError("broker unreachable")
+
+    async def cancel_order(self, client_order_id: str) -> None:
+        return None
+
+    async def stream_fills(self) -> FillEvent:
+        if self.failing:
+            raise ConnectionError("stream closed")
+        return await self.fills.get()
+
+
+def test_broker_stream_errors_engage_kill_switch_through_metrics():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    metrics = PortfolioMetrics(clock=clock)
+    risk = RiskService(kill_switch=KillSwitch(daily_loss_limit=1000.0), rules=[], metrics=metrics)
+    broker = _FlakyBroker()
+    execution = ExecutionService(broker, on_connection=metrics.set_broker_connected, scheduler=scheduler)
+    signal = SignalEvent(
+        symbol="AAPL", strategy_id="s", timestamp=0.0, side="BUY", strength=1.0, signal_id=uuid4()
+    )
+    received = []
+
+    async def on_fill(fill: FillEvent) -> None:
+        received.append(fill)
+
+    async def _run() -> None:
+        pump = asyncio.create_task(execution.pump_fills(on_fill, retry_delay=5.0))
+        await scheduler.sleep(30.0)
+        assert not metrics.broker_connected
+        risk.validate(signal, [], pnl=0.0, broker_connected=True)
+        await scheduler.sleep(32.0)
+        with pytest.raises(KillSwitchEngaged, match="Broker"):
+            risk.validate(signal, [], pnl=0.0, broker_connected=True)
+        broker.failing = False
+        broker.fills.put_nowait(_fill("AAPL", "BUY", 1, 100.0))
+        await scheduler.sleep(5.0)
+        assert len(received) == 1
+        pump.cancel()
+        await asyncio.gather(pump, return_exceptions=True)
+
+    scheduler.run(_run())
+    assert metrics.broker_disconnected_seconds == 0.0
+    risk.validate(signal, [], pnl=0.0, broker_connected=False)
+    order = OrderEvent(symbol="AAPL", side="BUY", quantity=1, price=None, client_order_id=uuid4())
+    broker.failing = True
+    with pytest.raises(ConnectionError):
+        asyncio.run(execution.submit(order))
+    assert not metrics.broker_connected
+
+
+def test_publisher_emits_snapshots_on_interval():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    metrics = PortfolioMetrics(clock=clock)
+    bus = EventBus()
+    published = []
+
+    async def on_metrics(event: PortfolioMetricsEvent) -> None:
+        published.append(event)
+
+    async def _run() -> None:
+        await bus.subscribe(PortfolioMetricsEvent, on_metrics)
+        metrics.on_fill(_fill("AAPL", "BUY", 2, 50.0))
+        metrics.on_price("AAPL", 55.0)
+        publisher = MetricsPublisher(metrics, bus, interval=5.0, scheduler=scheduler)
+        publisher.start()
+        await scheduler.sleep(12.0)
+        await publisher.stop()
+
+    scheduler.run(_run())
+    assert [event.timestamp for event in published] == [5.0, 10.0]
+    assert published[0].total_pnl == pytest.approx(10.0)
+    assert published[0].exposures == (("AAPL", 110.0),)
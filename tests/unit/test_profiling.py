@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+
+from src.application.bus import EventBus
+from src.application.engine import PartitionedEngine
+from src.domain.events import SignalEvent, TickEvent
+from src.infrastructure.idempotency import generate_signal_id
+from src.infrastructure.profiling import HandlerProfiler, StackSampler
+
+
+def test_profiler_records_cumulative_and_self_time_through_bus_and_engine():
+    now = [0.0]
+    profiler = HandlerProfiler(timer=lambda: now[0])
+
+    async def _run() -> None:
+        bus = EventBus(profiler=profiler)
+        engine = PartitionedEngine(profiler=profiler)
+
+        async def on_signal(event: SignalEvent) -> None:
+            now[0] += 2.0
+
+        async def on_tick(event: TickEvent) -> None:
+            now[0] += 1.0
+            signal_id = generate_signal_id("AAPL", "gc", event.timestamp)
+            await bus.publish(SignalEvent("AAPL", "gc", event.timestamp, "BUY", 1.0, signal_id))
+
+        await bus.subscribe(SignalEvent, on_signal)
+        engine.register_handler("AAPL", on_tick)
+        await engine.enqueue(TickEvent("AAPL", 1.0, 1.0))
+        await asyncio.sleep(0)
+
+        profiler.enable()
+        for idx in range(2):
+            await engine.enqueue(TickEvent("AAPL", 1.0, 2.0 + idx))
+        await asyncio.sleep(0)
+        profiler.disable()
+        await engine.enqueue(TickEvent("AAPL", 1.0, 5.0))
+        await asyncio.sleep(0)
+        await engine.shutdown()
+
+    asyncio.run(_run())
+
+    stats = {name.rsplit(".", 1)[-1]: value for name, value in profiler.snapshot().items()}
+    assert stats["on_tick"].calls == 2
+    assert stats["on_tick"].total == 6.0
+    assert stats["on_tick"].self_time == 2.0
+    assert stats["on_signal"].calls == 2
+    assert stats["on_signal"].self_time == 4.0
+
+
+def test_profiler_calibration_reports_small_overhead():
+    profiler = HandlerProfiler()
+    overhead = profiler.calibrate(calls=2000)
+    assert 0.0 <= overhead < 1e-3
+    assert profiler.snapshot() == {}
+
+
+def test_stack_sampler_collapses_target_thread_stacks(tmp_path):
+    stop = threading.Event()
+
+    def busy_loop() -> None:
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy_loop)
+    worker.start()
+    sampler = StackSampler(interval=0.001, thread_id=worker.ident).start()
+    time.sleep(0.1)
+    output = sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert "busy_loop" in output
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in output.splitlines())
+    assert 0.0 < sampler.overhead < 1.0
+    sampler.dump(tmp_path / "stacks.folded")
+    assert (tmp_path / "stacks.folded").read_text().startswith(output.splitlines()[0])
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from src.application.services import RiskService
+from src.domain.events import OrderEvent, SignalEvent
+from src.domain.models import Position
+from src.domain.risk.kill_switch import KillSwitch
+from src.domain.risk.rules import MaxNotionalRule, MaxPositionRule, RiskViolation
+from src.domain.strategy.cross_section import SignalBatch
+from src.infrastructure.idempotency import generate_signal_id
+
+
+def _order(symbol: str, side: str, quantity: float, price: float) -> OrderEvent:
+    return OrderEvent(
+        symbol=symbol,
+        side=side,
+        quantity=quantity,
+        price=price,
+        client_order_id=generate_signal_id(symbol, side, quantity),
+    )
+
+
+def _service(**kwargs) -> RiskService:
+    rules = [
+        MaxPositionRule(symbol="AAPL", max_quantity=100),
+        MaxNotionalRule(max_notional=kwargs.get("max_notional", 30_000)),
+    ]
+    return RiskService(kill_switch=KillSwitch(daily_loss_limit=1000), rules=rules)
+
+
+def test_validate_batch_applies_cumulative_effect_of_accepted_orders():
+    service = _service()
+    positions = [Position(symbol="AAPL", quantity=60, average_price=100.0)]
+    orders = [
+        _order("AAPL", "BUY", 30, 100.0),
+        _order("AAPL", "BUY", 20, 100.0),
+        _order("AAPL", "BUY", 10, 100.0),
+        _order("AAPL", "SELL", 50, 100.0),
+        _order("AAPL", "BUY", 10, 100.0),
+        _order("MSFT", "BUY", 120, 200.0),
+        _order("MSFT", "BUY", 10, 200.0),
+    ]
+
+    decisions = service.validate_batch(orders, positions, pnl=0.0, broker_connected=True)
+
+    assert [decision.accepted for decision in decisions] == [True, True, False, True, True, True, False]
+    assert decisions[2].reason == "Max position exceeded for AAPL"
+    assert decisions[6].reason == "Max notional exposure exceeded"
+    assert decisions[0].reason is None
+
+
+def test_validate_batch_of_one_matches_validate():
+    service = _service(max_notional=1e9)
+    positions = [Position(symbol="AAPL", quantity=100, average_price=100.0)]
+    signal = SignalEvent("AAPL", "gc", 1.0, "BUY", 1.0, generate_signal_id("AAPL", "gc", 1.0))
+
+    with pytest.raises(RiskViolation) as exc:
+        service.validate(signal, positions, pnl=0.0, broker_connected=True)
+    [decision] = service.validate_batch([signal], positions, pnl=0.0, broker_connected=True)
+    assert not decision.accepted
+    assert decision.reason == str(exc.value)
+
+
+def test_validate_batch_rejects_everything_when_kill_switch_engaged():
+    service = _service()
+    orders = [_order("AAPL", "BUY", 1, 1.0), _order("MSFT", "SELL", 1, 1.0)]
+    decisions = service.validate_batch(orders, [], pnl=-5000.0, broker_connected=True)
+    assert [decision.reason for decision in decisions] == ["Daily loss limit exceeded"] * 2
+
+
+def test_validate_batch_rejects_unpriced_candidates_under_notional_limit():
+    service = _service(max_notional=1_000)
+    signals = [
+        SignalEvent("NVDA", "gc", 1.0, "BUY", 1.0, generate_signal_id("NVDA", "gc", 1.0)),
+        SignalEvent("MSFT", "gc", 1.0, "BUY", 1.0, generate_signal_id("MSFT", "gc", 1.0)),
+    ]
+
+    decisions = service.validate_batch(signals, [], pnl=0.0, broker_connected=True, prices={"MSFT": 500.0})
+
+    assert [decision.accepted for decision in decisions] == [False, True]
+    assert decisions[0].reason == "No price for NVDA"
+
+
+def test_validate_batch_handles_many_rejections_in_one_pass():
+    service = _service(max_notional=10_000)
+    orders = [_order("AAPL" if idx % 2 else "MSFT", "BUY", 1, 100.0) for idx in range(20_000)]
+
+    decisions = service.validate_batch(orders, [], pnl=0.0, broker_connected=True)
+
+    assert [idx for idx, decision in enumerate(decisions) if decision.accepted] == list(range(101))
+    assert {decision.reason for decision in decisions[101:]} == {"Max notional exposure exceeded"}
+
+
+def test_validate_signal_batch_matches_validate_batch_and_builds_only_what_rules_need():
+    service = _service()
+    batch = SignalBatch(
+        strategy_id="gc",
+        symbols=["AAPL", "AAPL", "MSFT", "AAPL", "TSLA"],
+        timestamps=np.arange(5.0),
+        buy=np.array([True, True, True, False, True]),
+        strengths=np.ones(5),
+    )
+    positions = [Position(symbol="AAPL", quantity=99, average_price=100.0)]
+    prices = {"AAPL": 100.0, "MSFT": 200.0}
+    built = []
+
+    def id_generator(symbol: str, strategy_id: str, timestamp: float):
+        built.append(symbol)
+        return generate_signal_id(symbol, strategy_id, timestamp)
+
+    decisions = service.validate_signal_batch(
+        batch, id_generator, positions, pnl=0.0, broker_connected=True, prices=prices
+    )
+    events = [
+        SignalEvent(s.symbol, s.strategy_id, s.timestamp, s.side, s.strength, s.signal_id)
+        for s in batch.signals(generate_signal_id)
+    ]
+    assert decisions == service.validate_batch(events, positions, pnl=0.0, broker_connected=True, prices=prices)
+    assert [decision.accepted for decision in decisions] == [True, False, True, True, False]
+    assert built == []
+
+    accepted = [idx for idx, decision in enumerate(decisions) if decision.accepted]
+    assert [signal.symbol for signal in batch.signals(id_generator, accepted)] == ["AAPL", "MSFT", "AAPL"]
+    assert batch.signals(generate_signal_id, accepted)[1] == batch.signal(2, generate_signal_id)
@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+from src.domain.events import FillEvent, OrderEvent, PortfolioMetricsEvent, SignalEvent, TickEvent
+from src.infrastructure.event_codec import decode, encode
+from src.infrastructure.shm_ring import SharedRing
+
+
+def test_codec_round_trips_domain_events_and_falls_back_to_pickle():
+    order_id = uuid4()
+    events = [
+        TickEvent(symbol="AAPL", price=150.25, timestamp=1.5),
+        SignalEvent(
+            symbol="MSFT", strategy_id="golden-cross", timestamp=2.0, side="SELL", strength=0.5, signal_id=order_id
+        ),
+        OrderEvent(symbol="AAPL", side="BUY", quantity=10, price=None, client_order_id=order_id),
+        OrderEvent(symbol="AAPL", side="BUY", quantity=10, price=99.5, client_order_id=order_id),
+        FillEvent(symbol="ÄPL", side="SELL", quantity=3, price=101.0, client_order_id=order_id),
+        PortfolioMetricsEvent(1.0, 0, 0, 0, 0, 0, 0, 0, 0, 0, (("AAPL", 1.0),), True, 0.0),
+        {"event": "tick_handled", "level": "info"},
+    ]
+    for event in events:
+        assert decode(encode(event)) == event
+    assert len(encode(events[0])) == 22
+
+
+def test_ring_preserves_order_across_wraps_and_drops_when_full():
+    ring = SharedRing.create(256)
+    try:
+        reader = SharedRing.attach(ring.name)
+        written = []
+        for idx in range(200):
+            payload = bytes([idx % 256]) * (idx % 37)
+            assert ring.try_write(payload)
+            written.append(payload)
+            if idx % 3 == 2:
+                assert reader.read_many() == written
+                written = []
+        assert reader.read_many() == written
+
+        while ring.try_write(b"x" * 60):
+            pass
+        assert ring.dropped == 1
+        assert not ring.try_write(b"y" * 1000)
+        assert ring.dropped == 2
+        assert len(reader.read_many()) == 256 // 64
+        assert reader.read() is None and ring.pending == 0
+
+        ring.close_writer()
+        assert reader.closed
+        reader.close()
+    finally:
+        ring.close()
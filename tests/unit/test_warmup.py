@@ -0,0 +1,64 @@
+import asyncio
+
+import numpy as np
+
+from src.application.warmup import WarmupService
+from src.domain.models import Tick
+from src.domain.strategy.golden_cross import GoldenCrossStrategy
+from src.infrastructure.clock import FixedClock
+from src.infrastructure.idempotency import generate_signal_id
+from src.ports.history import HistoricalDataPort
+
+
+class _MemoryHistory(HistoricalDataPort):
+    def __init__(self, data):
+        self.data = data
+        self.requests = []
+
+    async def load(self, kind, symbols, start, end):
+        self.requests.append((kind, tuple(symbols), start, end))
+        result = {}
+        for symbol in symbols:
+            if symbol in self.data:
+                columns = self.data[symbol]
+                mask = (columns["timestamp"] >= start) & (columns["timestamp"] < end)
+                result[symbol] = {name: column[mask] for name, column in columns.items()}
+        return result
+
+    async def append(self, kind, symbol, day, columns):
+        raise NotImplementedError
+
+
+def test_golden_cross_warmup_matches_tick_replay_and_skips_overlap():
+    prices = [10.0, 11.0, 9.0, 12.0, 13.0, 12.5, 14.0]
+    timestamps = [float(idx) for idx in range(len(prices))]
+    warmed = GoldenCrossStrategy("gc", id_generator=generate_signal_id)
+    replayed = GoldenCrossStrategy("gc", id_generator=generate_signal_id)
+    warmed.warmup("AAPL", np.array(prices), np.array(timestamps))
+    for price, timestamp in zip(prices, timestamps):
+        replayed.on_tick(Tick("AAPL", price, timestamp))
+
+    assert warmed.on_tick(Tick("AAPL", 99.0, timestamps[-1])) is None
+    live = Tick("AAPL", 11.0, 7.0)
+    assert warmed.on_tick(live) == replayed.on_tick(live)
+
+
+def test_warmup_service_primes_each_symbol_from_lookback():
+    timestamps = np.arange(0.0, 100.0, 10.0)
+    history = _MemoryHistory(
+        {"AAPL": {"timestamp": timestamps, "close": np.linspace(1.0, 10.0, len(timestamps))}}
+    )
+    strategies = {
+        "AAPL": GoldenCrossStrategy("gc", id_generator=generate_signal_id),
+        "MSFT": GoldenCrossStrategy("gc", id_generator=generate_signal_id),
+    }
+    service = WarmupService(history, clock=FixedClock(100.0))
+
+    results = asyncio.run(service.warm(strategies, lookback=50.0))
+
+    assert results["AAPL"].rows == 5
+    assert results["AAPL"].last_timestamp == 90.0
+    assert results["MSFT"].rows == 0
+    assert history.requests == [("bars", ("AAPL", "MSFT"), 50.0, 100.0)]
+    signal = strategies["AAPL"].on_tick(Tick("AAPL", 11.0, 100.0))
+    assert signal is not None and signal.side == "BUY"